@@ -0,0 +1,65 @@
+"""add_users_email_lower_index
+
+Revision ID: 7c3e9a41b2d5
+Revises: 1a2b3c4d5e6f
+Create Date: 2026-10-16 10:00:00.000000+09:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3e9a41b2d5"
+down_revision: Union[str, None] = "1a2b3c4d5e6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 대소문자만 다른 이메일 중복 확인 (있으면 유니크 인덱스 생성이 실패하므로 먼저 중단)
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT lower(email) AS email_lower, count(*) AS cnt
+                FROM users
+                GROUP BY lower(email)
+                HAVING count(*) > 1
+                """
+            )
+        )
+        .all()
+    )
+    if duplicates:
+        emails = ", ".join(
+            f"{row.email_lower} ({row.cnt}건)" for row in duplicates
+        )
+        raise RuntimeError(
+            "대소문자만 다른 중복 이메일 계정이 있어 lower(email) 유니크 인덱스를 "
+            f"생성할 수 없습니다. 계정을 정리한 후 다시 실행하세요: {emails}"
+        )
+
+    # 대소문자 무시 이메일 조회를 위한 lower(email) 유니크 함수 인덱스 추가
+    # (운영 중 테이블 잠금 방지를 위해 CONCURRENTLY)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_email_lower",
+            "users",
+            [sa.text("lower(email)")],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # lower(email) 함수 인덱스 제거
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_email_lower",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,40 @@
+"""add_email_verifications_lookup_index
+
+Revision ID: 3f8d2b6c9e14
+Revises: 7c3e9a41b2d5
+Create Date: 2026-10-16 11:00:00.000000+09:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8d2b6c9e14"
+down_revision: Union[str, None] = "7c3e9a41b2d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 미사용 인증 코드 조회용 부분 인덱스 추가 (운영 중 테이블 잠금 방지를 위해 CONCURRENTLY)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ev_lookup",
+            "email_verifications",
+            ["email", "verification_type", sa.text("expires_at DESC")],
+            postgresql_where=sa.text("is_used = false"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # 부분 인덱스 제거
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_ev_lookup",
+            table_name="email_verifications",
+            postgresql_concurrently=True,
+        )
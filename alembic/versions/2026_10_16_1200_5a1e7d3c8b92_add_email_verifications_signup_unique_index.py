@@ -0,0 +1,53 @@
+"""add_email_verifications_signup_unique_index
+
+Revision ID: 5a1e7d3c8b92
+Revises: 3f8d2b6c9e14
+Create Date: 2026-10-16 12:00:00.000000+09:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5a1e7d3c8b92"
+down_revision: Union[str, None] = "3f8d2b6c9e14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 이메일별 회원가입 인증 코드 중복 행 정리 (가장 최근 행만 유지)
+    op.execute(
+        """
+        DELETE FROM email_verifications a
+        USING email_verifications b
+        WHERE a.verification_type = 'signup'
+          AND b.verification_type = 'signup'
+          AND a.email = b.email
+          AND (a.created_at, a.id) < (b.created_at, b.id)
+        """
+    )
+
+    # 회원가입 인증 코드 UPSERT용 부분 유니크 인덱스 추가 (CONCURRENTLY)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_ev_signup_email",
+            "email_verifications",
+            ["email"],
+            unique=True,
+            postgresql_where=sa.text("verification_type = 'signup'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # 부분 유니크 인덱스 제거
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_ev_signup_email",
+            table_name="email_verifications",
+            postgresql_concurrently=True,
+        )
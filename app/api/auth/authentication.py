@@ -3,54 +3,126 @@
 로그인, 로그아웃, 토큰 갱신, 사용자 정보 조회
 """
 
+import asyncio
 import logging
-import re
+import secrets
+import string
+import time
+import weakref
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
-from uuid import uuid4
+from uuid import UUID
 
 import jwt
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, File, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status, File, UploadFile
 from fastapi.responses import JSONResponse
-from jose.exceptions import JWTError
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, delete, exists, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.constants import AccountType, OAuthProvider
+from app.constants import AccountType, OAuthProvider, ResponseMessages
 from app.core.config import get_settings
-from app.core.deps import get_current_user
+from app.core.deps import (
+    get_current_user,
+    get_current_user_async,
+    get_current_user_id,
+)
+from app.core.http_client import http_client
 from app.core.security import (
+    access_token_claims,
     create_access_token,
     create_refresh_token,
-    decode_access_token,
-    decode_refresh_token,
+    decode_access_token_cached,
+    decode_jwt,
+    decode_refresh_token_cached,
+)
+from app.core.user_cache import (
+    invalidate_availability,
+    invalidate_user_info,
+    user_info_cache,
 )
-from app.db.database import get_session
+from app.db.database import get_async_session, get_session
 from app.models.diary import DiaryEntry
 from app.models.email_verification import EmailVerification
+from app.models.fcm import FCMToken, NotificationHistory, NotificationSettings
+from app.models.notification import Notification
 from app.models.oauth_token import OAuthToken
 from app.models.password_reset_token import PasswordResetToken
 from app.models.user import User
 from app.schemas.base import BaseResponse
 from app.utils.email_service import EmailService
-from app.utils.encryption import password_hasher
+from app.utils.encryption import (
+    clear_verify_cache,
+    constant_time_compare,
+    generate_verification_code,
+    hash_password_async,
+    password_hasher,
+    verify_password_async,
+)
 from app.utils.minio_upload import upload_image_with_thumbnail_to_minio
-from app.utils.validators import validate_image_file
+from app.utils.validators import has_valid_password_charset, validate_image_file
 
 from app.utils.error_handlers import StandardHTTPException, unauthorized_exception
 
 router = APIRouter(tags=["Authentication"])
 
-# 인증이 필요한 라우터
+# 인증이 필요한 라우터 (사용자 조회/검증은 각 엔드포인트의 사용자 의존성에서 수행)
 authenticated_router = APIRouter(
     tags=["Authentication"],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user_id)],
 )
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# 쿠키 설정 (요청마다 settings 속성을 조회하지 않도록 import 시 한 번만 구성)
+_COOKIE_KW = {
+    "path": "/",
+    "secure": settings.cookie_secure,
+    "httponly": settings.cookie_httponly,
+    "samesite": settings.cookie_samesite,
+    "domain": settings.cookie_domain,
+}
+_ACCESS_MAX_AGE = settings.jwt_access_token_expire_minutes * 60
+_REFRESH_MAX_AGE = settings.jwt_refresh_token_expire_days * 24 * 60 * 60
+_AUTH_COOKIE_KEYS = ("access_token", "refresh_token", "session")
+
+
+def _build_cookie_suffix(max_age: int) -> str:
+    """토큰 값 뒤에 붙일 Set-Cookie 속성 문자열 생성 (환경별 고정값이므로 import 시 한 번만 생성)"""
+    attrs = [f"Max-Age={max_age}", f"Path={_COOKIE_KW['path']}"]
+    if _COOKIE_KW["domain"]:
+        attrs.append(f"Domain={_COOKIE_KW['domain']}")
+    if _COOKIE_KW["secure"]:
+        attrs.append("Secure")
+    if _COOKIE_KW["httponly"]:
+        attrs.append("HttpOnly")
+    if _COOKIE_KW["samesite"]:
+        attrs.append(f"SameSite={_COOKIE_KW['samesite']}")
+    return "; " + "; ".join(attrs)
+
+
+_ACCESS_COOKIE_SUFFIX = _build_cookie_suffix(_ACCESS_MAX_AGE)
+_REFRESH_COOKIE_SUFFIX = _build_cookie_suffix(_REFRESH_MAX_AGE)
+
+# 토큰 갱신 단일 처리 (사용자별 잠금 + 직전 발급 결과 재사용 시간)
+_REFRESH_REUSE_SECONDS = 5
+_refresh_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+_recent_refreshes: Dict[str, tuple[float, tuple[str, str, Dict[str, Any]]]] = {}
+
+# 존재하지 않는 계정 로그인 시 타이밍 균등화를 위한 더미 해시 (import 시 한 번만 생성)
+_DUMMY_PASSWORD_HASH = password_hasher.hash_password(secrets.token_urlsafe(16))
+
+# 탈퇴 계정 복구 가능 기간
+_RESTORE_WINDOW = timedelta(days=30)
+
+# 이메일 변경 인증 토큰 문자 집합
+_VERIFICATION_TOKEN_CHARS = string.ascii_uppercase + string.digits
+
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -99,9 +171,7 @@ class ResetPasswordRequest(BaseModel):
             raise ValueError("비밀번호는 9자 이상이어야 합니다")
 
         # 영문, 숫자, 특수문자 포함 검증
-        if not re.match(
-            r"^(?=.*[A-Za-z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{9,}$", v
-        ):
+        if not has_valid_password_charset(v):
             raise ValueError("비밀번호는 영문, 숫자, 특수문자를 포함해야 합니다")
 
         return v
@@ -127,9 +197,7 @@ class ChangePasswordRequest(BaseModel):
             raise ValueError("비밀번호는 9자 이상이어야 합니다")
 
         # 영문, 숫자, 특수문자 포함 검증
-        if not re.match(
-            r"^(?=.*[A-Za-z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{9,}$", v
-        ):
+        if not has_valid_password_charset(v):
             raise ValueError("비밀번호는 영문, 숫자, 특수문자를 포함해야 합니다")
 
         return v
@@ -186,119 +254,102 @@ class RestoreResponse(BaseModel):
 @router.post("/login", response_model=BaseResponse[LoginResponse])
 async def login(
     request: LoginRequest,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[LoginResponse]:
     """이메일 로그인 API"""
-    try:
-        # 1. 사용자 조회 (Soft Delete 포함)
-        stmt = select(User).where(User.email == request.email)
-        result = db.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="이메일 또는 비밀번호가 올바르지 않습니다.",
-            )
+    # 1. 사용자 조회 (Soft Delete 포함)
+    stmt = select(User).where(func.lower(User.email) == request.email.lower())
+    user = await db.scalar(stmt)
 
-        # 2. Soft Delete된 계정인지 확인
-        if user.deleted_at is not None:
-            current_time = (
-                datetime.now(user.deleted_at.tzinfo)
-                if user.deleted_at.tzinfo
-                else datetime.now()
-            )
-            deleted_time = (
-                user.deleted_at.replace(tzinfo=None)
-                if user.deleted_at.tzinfo
-                else user.deleted_at
-            )
-            current_time_naive = (
-                current_time.replace(tzinfo=None)
-                if current_time.tzinfo
-                else current_time
-            )
+    if not user:
+        # 존재하지 않는 이메일도 해시 검증 시간을 동일하게 소모 (타이밍 기반 계정 추측 방지)
+        await verify_password_async(request.password, _DUMMY_PASSWORD_HASH)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="이메일 또는 비밀번호가 올바르지 않습니다.",
+        )
 
-            # 30일 이내인지 확인
-            if deleted_time >= current_time_naive - timedelta(days=30):
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail={
-                        "error": "ACCOUNT_DELETED",
-                        "message": "탈퇴된 계정입니다. 30일 이내에 복구할 수 있습니다.",
-                        "deleted_at": user.deleted_at.isoformat(),
-                        "restore_available": True,
-                        "days_remaining": 30 - (current_time_naive - deleted_time).days,
-                    },
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail={
-                        "error": "ACCOUNT_PERMANENTLY_DELETED",
-                        "message": "탈퇴 후 30일이 경과되어 복구할 수 없습니다.",
-                        "deleted_at": user.deleted_at.isoformat(),
-                        "restore_available": False,
-                    },
-                )
+    # 2. Soft Delete된 계정인지 확인
+    if user.deleted_at is not None:
+        # deleted_at은 timestamptz이므로 UTC 현재 시각과 바로 비교
+        elapsed = datetime.now(timezone.utc) - user.deleted_at
 
-        # 3. 이메일 회원가입 사용자인지 확인
-        if user.account_type != AccountType.EMAIL.value:
+        # 30일 이내인지 확인
+        if elapsed <= _RESTORE_WINDOW:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="소셜 로그인으로 가입된 계정입니다.",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "error": "ACCOUNT_DELETED",
+                    "message": "탈퇴된 계정입니다. 30일 이내에 복구할 수 있습니다.",
+                    "deleted_at": user.deleted_at.isoformat(),
+                    "restore_available": True,
+                    "days_remaining": _RESTORE_WINDOW.days - elapsed.days,
+                },
             )
-
-        # 4. 비밀번호 검증
-        if not password_hasher.verify_password(request.password, user.password_hash):
+        else:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="이메일 또는 비밀번호가 올바르지 않습니다.",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "error": "ACCOUNT_PERMANENTLY_DELETED",
+                    "message": "탈퇴 후 30일이 경과되어 복구할 수 없습니다.",
+                    "deleted_at": user.deleted_at.isoformat(),
+                    "restore_available": False,
+                },
             )
 
-        # 5. 계정 활성화 상태 확인
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="비활성화된 계정입니다.",
-            )
+    # 3. 이메일 회원가입 사용자인지 확인
+    if user.account_type != AccountType.EMAIL.value:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="소셜 로그인으로 가입된 계정입니다.",
+        )
 
-        # 6. JWT 토큰 생성
-        access_token = create_access_token({"sub": str(user.id)})
-        refresh_token = create_refresh_token({"sub": str(user.id)})
+    # 4. 계정 활성화 상태 확인 (비활성 계정은 해시 검증 생략)
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="비활성화된 계정입니다.",
+        )
 
-        # 7. 응답 생성 (쿠키만 설정, 응답에는 토큰 제외)
-        response_data = LoginResponse(
-            user_id=str(user.id),
-            email=user.email,
-            nickname=user.nickname,
-            message="로그인이 완료되었습니다.",
+    # 5. 비밀번호 검증
+    if not await verify_password_async(request.password, user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="이메일 또는 비밀번호가 올바르지 않습니다.",
         )
 
-        logger.info(f"사용자 로그인: {user.email}")
+    # 기존 bcrypt 해시는 로그인 성공 시 Argon2id로 재해싱
+    if password_hasher.needs_update(user.password_hash):
+        user.password_hash = await hash_password_async(request.password)
+        await db.commit()
+
+    # 6. JWT 토큰 생성
+    access_token = create_access_token(access_token_claims(user))
+    refresh_token = create_refresh_token({"sub": str(user.id)})
+
+    # 7. 응답 생성 (쿠키만 설정, 응답에는 토큰 제외)
+    response_data = LoginResponse(
+        user_id=str(user.id),
+        email=user.email,
+        nickname=user.nickname,
+        message="로그인이 완료되었습니다.",
+    )
 
-        # 쿠키 설정을 위한 응답 생성
-        response = JSONResponse(
-            content={
-                "success": True,
-                "message": "로그인이 성공적으로 완료되었습니다.",
-                "data": response_data.model_dump(),
-            }
-        )
+    logger.info("사용자 로그인: %s", user.email)
 
-        # 쿠키에 토큰 설정 (환경별 동적 설정)
-        _set_auth_cookies(response, access_token, refresh_token)
+    # 쿠키 설정을 위한 응답 생성
+    response = JSONResponse(
+        content={
+            "success": True,
+            "message": "로그인이 성공적으로 완료되었습니다.",
+            "data": response_data.model_dump(),
+        }
+    )
 
-        return response
+    # 쿠키에 토큰 설정 (환경별 동적 설정)
+    _set_auth_cookies(response, access_token, refresh_token)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"로그인 실패: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="로그인 중 오류가 발생했습니다.",
-        )
+    return response
 
 
 class LogoutService:
@@ -310,38 +361,35 @@ class LogoutService:
     async def revoke_google_token(self, access_token: str) -> bool:
         """구글 OAuth 토큰 무효화"""
         try:
-            import httpx
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://oauth2.googleapis.com/revoke",
-                    data={"token": access_token},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            # 공유 클라이언트 재사용 (요청마다 TLS 핸드셰이크 생략)
+            response = await http_client.client.post(
+                settings.google_revoke_uri,
+                data={"token": access_token},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception as e:
-            logger.warning(f"Google token revocation failed: {e}")
+            logger.warning("Google token revocation failed: %s", e)
             return False
 
     def invalidate_oauth_tokens(self, user_id: str) -> None:
         """사용자의 OAuth 토큰들을 무효화"""
         try:
-            # 사용자의 OAuth 토큰 조회
-            stmt = select(OAuthToken).where(OAuthToken.user_id == user_id)
+            # 토큰 만료 시간을 DB 현재 시간으로 설정하여 무효화 (단일 UPDATE)
+            stmt = (
+                update(OAuthToken)
+                .where(OAuthToken.user_id == user_id)
+                .values(expires_at=func.now())
+            )
             result = self.db.execute(stmt)
-            oauth_tokens = result.scalars().all()
-
-            for oauth_token in oauth_tokens:
-                # 토큰 만료 시간을 현재 시간으로 설정하여 무효화
-                oauth_token.expires_at = datetime.now(timezone.utc)
 
             self.db.commit()
             logger.info(
-                f"Invalidated {len(oauth_tokens)} OAuth tokens for user {user_id}"
+                "Invalidated %s OAuth tokens for user %s", result.rowcount, user_id
             )
 
         except Exception as e:
-            logger.error(f"Failed to invalidate OAuth tokens for user {user_id}: {e}")
+            logger.error("Failed to invalidate OAuth tokens for user %s: %s", user_id, e)
             self.db.rollback()
 
     def log_logout_attempt(
@@ -359,21 +407,24 @@ class LogoutService:
                 logger.warning(log_message)
 
         except Exception as e:
-            logger.error(f"Failed to log logout attempt: {e}")
+            logger.error("Failed to log logout attempt: %s", e)
 
 
 @router.post("/logout", response_model=BaseResponse[Dict[str, Any]])
 async def logout(
     request: Request,
     response: Response,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_session),
 ) -> BaseResponse[Dict[str, Any]]:
     """로그아웃 API - 구글 OAuth 세션 정리, JWT 토큰 무효화, 쿠키 정리"""
     logout_service = LogoutService(db)
+    logout_time = datetime.now(timezone.utc).isoformat()
     success = True
     error_details = []
     current_user_id = None
-    user = None
+    account_type = None
+    provider = None
 
     try:
         # 1. Authorization 헤더에서 토큰 추출 및 사용자 ID 파싱
@@ -383,40 +434,46 @@ async def logout(
 
             try:
                 # 토큰 페이로드에서 사용자 ID 추출
-                payload = decode_access_token(token)
-                current_user_id = int(payload.get("sub"))
+                payload = decode_access_token_cached(token)
+                current_user_id = UUID(payload.get("sub"))
                 jti = payload.get("jti")
 
-                # 사용자 정보 조회
-                stmt = select(User).where(User.id == current_user_id)
-                result = db.execute(stmt)
-                user = result.scalar_one_or_none()
+                if "acct" in payload:
+                    # 토큰 클레임에 계정 정보가 있으면 DB 조회 생략
+                    account_type = payload["acct"]
+                    provider = payload.get("prov")
+                else:
+                    # 클레임이 없는 기존 토큰은 DB에서 필요한 컬럼만 조회
+                    row = db.execute(
+                        select(User.account_type, User.provider).where(
+                            User.id == current_user_id
+                        )
+                    ).one_or_none()
+                    if row:
+                        account_type, provider = row
 
                 if jti:
-                    logger.info(f"Token logout requested: {jti}")
+                    logger.info("Token logout requested: %s", jti)
 
             except Exception as e:
-                logger.warning(f"Failed to decode token: {e}")
+                logger.warning("Failed to decode token: %s", e)
 
         # 2. 구글 OAuth 세션 정리
         if (
-            user
-            and user.account_type == AccountType.SOCIAL.value
-            and user.provider == OAuthProvider.GOOGLE.value
+            account_type == AccountType.SOCIAL.value
+            and provider == OAuthProvider.GOOGLE.value
         ):
-            stmt = select(OAuthToken).where(
+            stmt = select(OAuthToken.access_token).where(
                 OAuthToken.user_id == current_user_id,
                 OAuthToken.provider == OAuthProvider.GOOGLE.value,
             )
-            result = db.execute(stmt)
-            oauth_token = result.scalar_one_or_none()
+            google_access_token = db.execute(stmt).scalar_one_or_none()
 
-            if oauth_token and oauth_token.access_token:
-                if not await logout_service.revoke_google_token(
-                    oauth_token.access_token
-                ):
-                    error_details.append("Google token revocation failed")
-                    success = False
+            if google_access_token:
+                # 외부 API 호출은 응답 이후 백그라운드에서 처리 (실패 시 서비스에서 로그 기록)
+                background_tasks.add_task(
+                    logout_service.revoke_google_token, google_access_token
+                )
 
         # 3. OAuth 토큰 무효화
         if current_user_id:
@@ -435,11 +492,11 @@ async def logout(
 
         return BaseResponse(
             data={
-                "logout_time": datetime.now(timezone.utc).isoformat(),
+                "logout_time": logout_time,
                 "user_id": str(current_user_id) if current_user_id else None,
-                "account_type": user.account_type if user else None,
-                "provider": user.provider
-                if user and user.account_type == AccountType.SOCIAL.value
+                "account_type": account_type,
+                "provider": provider
+                if account_type == AccountType.SOCIAL.value
                 else None,
                 "errors": error_details if error_details else None,
             },
@@ -449,13 +506,13 @@ async def logout(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error during logout: {e}")
+        logger.error("Unexpected error during logout: %s", e)
         if current_user_id:
             logout_service.log_logout_attempt(str(current_user_id), False, str(e))
 
         return BaseResponse(
             data={
-                "logout_time": datetime.now(timezone.utc).isoformat(),
+                "logout_time": logout_time,
                 "user_id": str(current_user_id) if current_user_id else None,
                 "account_type": "unknown",
                 "provider": None,
@@ -468,41 +525,71 @@ async def logout(
 @router.post("/refresh", response_model=BaseResponse[Dict[str, Any]])
 async def refresh_token(
     request: Request,
-    db: Session = Depends(get_session),
+    response: Response,
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[Dict[str, Any]]:
     """JWT 토큰 갱신 API - Refresh Token을 사용하여 새로운 Access Token 발급"""
+    # 1. 쿠키에서 Refresh Token 추출
+    refresh_token = request.cookies.get("refresh_token")
+    if not refresh_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token이 필요합니다.",
+        )
+
+    # 2. Refresh Token 검증
     try:
-        # 1. 쿠키에서 Refresh Token 추출
-        refresh_token = request.cookies.get("refresh_token")
-        if not refresh_token:
+        payload = decode_refresh_token_cached(refresh_token)
+        user_id = payload.get("sub")
+        token_type = payload.get("type")
+
+        if token_type != "refresh":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Refresh token이 필요합니다.",
+                detail="유효하지 않은 토큰 타입입니다.",
             )
 
-        # 2. Refresh Token 검증
-        try:
-            payload = decode_refresh_token(refresh_token)
-            user_id = payload.get("sub")
-            token_type = payload.get("type")
-
-            if token_type != "refresh":
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="유효하지 않은 토큰 타입입니다.",
-                )
+    except Exception as e:
+        logger.warning("Refresh token 검증 실패: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 refresh token입니다.",
+        )
 
-        except Exception as e:
-            logger.warning(f"Refresh token 검증 실패: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="유효하지 않은 refresh token입니다.",
-            )
+    # 3~4. 사용자 확인 및 새로운 토큰 발급 (동일 사용자 동시 갱신은 한 번만 처리)
+    access_token, new_refresh_token, user_data = await _refresh_tokens_single_flight(
+        db, user_id
+    )
+
+    # 5. 쿠키에 새로운 토큰 설정
+    _set_auth_cookies(response, access_token, new_refresh_token)
+
+    return BaseResponse(
+        data=user_data,
+        message="토큰이 성공적으로 갱신되었습니다.",
+    )
+
+
+async def _refresh_tokens_single_flight(
+    db: AsyncSession, user_id: str
+) -> tuple[str, str, Dict[str, Any]]:
+    """
+    사용자별 토큰 갱신 단일 처리
+
+    동시에 도착한 같은 사용자의 갱신 요청은 잠금으로 직렬화하고,
+    짧은 시간 동안 발급 결과를 재사용하여 DB 조회와 서명을 한 번만 수행
+
+    Returns:
+        (access token, refresh token, 응답 사용자 정보)
+    """
+    lock = _refresh_locks.setdefault(user_id, asyncio.Lock())
+    async with lock:
+        cached = _recent_refreshes.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
 
-        # 3. 사용자 정보 조회
         stmt = select(User).where(User.id == user_id)
-        result = db.execute(stmt)
-        user = result.scalar_one_or_none()
+        user = await db.scalar(stmt)
 
         if not user:
             raise HTTPException(
@@ -516,71 +603,80 @@ async def refresh_token(
                 detail="비활성화된 계정입니다.",
             )
 
-        # 4. 새로운 토큰 발급
         access_token = create_access_token(
-            data={"sub": str(user.id), "email": user.email}
+            data={**access_token_claims(user), "email": user.email}
         )
         new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
+        user_data = {
+            "user_id": str(user.id),
+            "email": user.email,
+            "nickname": user.nickname,
+        }
 
-        logger.info(f"토큰 갱신 성공: {user.email}")
-
-        # 5. 쿠키에 새로운 토큰 설정
-        response = JSONResponse(
-            content={
-                "success": True,
-                "message": "토큰이 성공적으로 갱신되었습니다.",
-                "data": {
-                    "user_id": str(user.id),
-                    "email": user.email,
-                    "nickname": user.nickname,
-                },
-            }
-        )
-
-        _set_auth_cookies(response, access_token, new_refresh_token)
-        return response
+        logger.info("토큰 갱신 성공: %s", user.email)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"토큰 갱신 중 오류 발생: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="토큰 갱신 중 오류가 발생했습니다.",
-        )
+        now = time.monotonic()
+        for key in [k for k, v in _recent_refreshes.items() if v[0] <= now]:
+            del _recent_refreshes[key]
+        issued = (access_token, new_refresh_token, user_data)
+        _recent_refreshes[user_id] = (now + _REFRESH_REUSE_SECONDS, issued)
+        return issued
 
 
 @authenticated_router.get("/me", response_model=BaseResponse[Dict[str, Any]])
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_session),
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[Dict[str, Any]]:
     """현재 로그인한 사용자 정보 조회 API"""
-    try:
-        user_data = {
-            "user_id": str(current_user.id),
-            "email": current_user.email,
-            "nickname": current_user.nickname,
-            "profile_image_url": current_user.profile_image_url,
-            "account_type": current_user.account_type,
-            "provider": current_user.provider,
-            "is_active": current_user.is_active,
-            "created_at": current_user.created_at.isoformat()
-            if current_user.created_at
-            else None,
-        }
+    # 짧은 TTL 캐시 우선 조회 (활성/미탈퇴 계정만 저장, 프로필 변경/탈퇴 시 무효화)
+    cache_key = str(user_id)
+    user_data = user_info_cache.get(cache_key)
+    if user_data is not None:
+        return BaseResponse(
+            data=user_data, message="현재 사용자 정보를 성공적으로 조회했습니다."
+        )
 
-        return BaseResponse(data=user_data, message="현재 사용자 정보를 성공적으로 조회했습니다.")
+    # 응답에 필요한 컬럼만 조회 (비밀번호 해시 등 전체 행 로딩 생략)
+    stmt = select(
+        User.id,
+        User.email,
+        User.nickname,
+        User.profile_image_url,
+        User.account_type,
+        User.provider,
+        User.is_active,
+        User.created_at,
+    ).where(User.id == user_id, User.deleted_at.is_(None))
+    row = (await db.execute(stmt)).one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=ResponseMessages.USER_NOT_FOUND,
+        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"사용자 정보 조회 실패: {e}")
+    if not row.is_active:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="사용자 정보 조회 중 오류가 발생했습니다.",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=ResponseMessages.ACCOUNT_INACTIVE,
         )
 
+    user_data = {
+        "user_id": str(row.id),
+        "email": row.email,
+        "nickname": row.nickname,
+        "profile_image_url": row.profile_image_url,
+        "account_type": row.account_type,
+        "provider": row.provider,
+        "is_active": row.is_active,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+    # 위의 탈퇴/비활성 검사를 통과한 경우에만 캐시
+    user_info_cache.set(cache_key, user_data)
+
+    return BaseResponse(data=user_data, message="현재 사용자 정보를 성공적으로 조회했습니다.")
+
 
 @authenticated_router.put("/profile", response_model=BaseResponse[Dict[str, Any]])
 async def update_user_profile(
@@ -599,29 +695,32 @@ async def update_user_profile(
 
         current_user.updated_at = datetime.now(timezone.utc)
 
+        # 커밋 후 만료된 속성 재조회(SELECT)를 피하기 위해 응답 데이터를 먼저 구성
+        user_email = current_user.email
+        response_data = {
+            "user_id": str(current_user.id),
+            "nickname": current_user.nickname,
+            "profile_image_url": current_user.profile_image_url,
+            "updated_at": current_user.updated_at.isoformat(),
+        }
+
         db.commit()
-        db.refresh(current_user)
+        invalidate_user_info(response_data["user_id"])
+        invalidate_availability(nickname=request.nickname)
 
-        logger.info(f"프로필 업데이트 성공: {current_user.email} -> {request.nickname}")
+        logger.info("프로필 업데이트 성공: %s -> %s", user_email, request.nickname)
 
         return BaseResponse(
-            data={
-                "user_id": str(current_user.id),
-                "nickname": current_user.nickname,
-                "profile_image_url": current_user.profile_image_url,
-                "updated_at": current_user.updated_at.isoformat(),
-            },
+            data=response_data,
             message="프로필이 성공적으로 업데이트되었습니다.",
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"프로필 업데이트 실패: {e}")
+    except IntegrityError:
+        # 닉네임 중복은 별도 사전 조회 없이 DB 유니크 제약조건(uq_users_nickname)으로 판단
         db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="프로필 업데이트 중 오류가 발생했습니다.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 닉네임입니다.",
         )
 
 
@@ -634,41 +733,34 @@ async def upload_profile_image(
     image: UploadFile = File(description="프로필 이미지 파일"),
 ) -> BaseResponse[Dict[str, Any]]:
     """프로필 이미지 업로드 API"""
-    try:
-        # 이미지 파일 검증
-        validate_image_file(image.content_type, image.size)
+    # 이미지 파일 검증
+    validate_image_file(image.content_type, image.size)
         
-        # MinIO에 이미지와 썸네일 업로드
-        file_id, original_url, thumbnail_url = await upload_image_with_thumbnail_to_minio(image)
+    # MinIO에 이미지와 썸네일 업로드
+    file_id, _, thumbnail_url, _ = await upload_image_with_thumbnail_to_minio(image)
         
-        # 사용자 프로필에 이미지 URL 저장 (썸네일 사용)
-        current_user.profile_image_url = thumbnail_url
-        current_user.updated_at = datetime.now(timezone.utc)
-        
-        db.commit()
-        db.refresh(current_user)
-        
-        logger.info(f"프로필 이미지 업로드 성공: {current_user.email} -> {thumbnail_url}")
-        
-        return BaseResponse(
-            data={
-                "image_url": thumbnail_url,
-                "file_id": file_id,
-                "user_id": str(current_user.id),
-                "updated_at": current_user.updated_at.isoformat(),
-            },
-            message="프로필 이미지가 성공적으로 업로드되었습니다.",
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"프로필 이미지 업로드 실패: {e}")
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="프로필 이미지 업로드 중 오류가 발생했습니다.",
-        )
+    # 사용자 프로필에 이미지 URL 저장 (썸네일 사용)
+    current_user.profile_image_url = thumbnail_url
+    current_user.updated_at = datetime.now(timezone.utc)
+
+    # 커밋 후 만료된 속성 재조회(SELECT)를 피하기 위해 응답 데이터를 먼저 구성
+    user_email = current_user.email
+    response_data = {
+        "image_url": thumbnail_url,
+        "file_id": file_id,
+        "user_id": str(current_user.id),
+        "updated_at": current_user.updated_at.isoformat(),
+    }
+
+    db.commit()
+    invalidate_user_info(response_data["user_id"])
+
+    logger.info("프로필 이미지 업로드 성공: %s -> %s", user_email, thumbnail_url)
+
+    return BaseResponse(
+        data=response_data,
+        message="프로필 이미지가 성공적으로 업로드되었습니다.",
+    )
 
 
 # === 이메일 변경 관련 엔드포인트 ===
@@ -689,85 +781,70 @@ async def send_email_change_verification(
     db: Session = Depends(get_session),
 ) -> BaseResponse[Dict[str, str]]:
     """이메일 변경을 위한 인증 URL 발송 API"""
-    try:
-        import random
-        import string
-        from app.models.email_verification import EmailVerification
-        from app.utils.email_service import EmailService
-
-        # 1. 새로운 이메일 중복 확인
-        stmt = select(User).where(User.email == request.new_email)
-        result = db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용 중인 이메일입니다.",
-            )
-
-        # 2. 기존 이메일과 같은지 확인
-        if request.new_email == current_user.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="현재 사용 중인 이메일과 동일합니다.",
-            )
+    # 1. 새로운 이메일 중복 확인
+    stmt = select(
+        exists().where(func.lower(User.email) == request.new_email.lower())
+    )
+    email_taken = db.scalar(stmt)
 
-        # 3. 인증 토큰 생성
-        verification_token = "".join(
-            random.choices(string.ascii_uppercase + string.digits, k=6)
+    if email_taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 이메일입니다.",
         )
 
-        # 4. 기존 인증 코드가 있다면 삭제
-        stmt = select(EmailVerification).where(
-            EmailVerification.email == request.new_email,
-            EmailVerification.verification_type == "change",
+    # 2. 기존 이메일과 같은지 확인
+    if request.new_email == current_user.email:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="현재 사용 중인 이메일과 동일합니다.",
         )
-        result = db.execute(stmt)
-        existing_verification = result.scalar_one_or_none()
 
-        if existing_verification:
-            db.delete(existing_verification)
+    # 3. 인증 토큰 생성
+    verification_token = "".join(
+        secrets.choice(_VERIFICATION_TOKEN_CHARS) for _ in range(6)
+    )
 
-        # 5. 새로운 인증 토큰 저장
-        new_verification = EmailVerification(
-            email=request.new_email,
-            verification_code=verification_token,
-            verification_type="change",
-            expires_at=datetime.now() + timedelta(minutes=30),
-        )
+    # 4. 기존 인증 코드가 있다면 삭제
+    stmt = select(EmailVerification).where(
+        EmailVerification.email == request.new_email,
+        EmailVerification.verification_type == "change",
+    )
+    existing_verification = db.scalar(stmt)
 
-        db.add(new_verification)
-        db.commit()
+    if existing_verification:
+        db.delete(existing_verification)
 
-        # 6. 인증 URL 생성
-        verification_url = f"{settings.frontend_url}/profile?token={verification_token}&action=change-email"
+    # 5. 새로운 인증 토큰 저장
+    new_verification = EmailVerification(
+        email=request.new_email,
+        verification_code=verification_token,
+        verification_type="change",
+        expires_at=datetime.now() + timedelta(minutes=30),
+    )
 
-        # 7. 실제 이메일 발송
-        email_service = EmailService()
-        await email_service.send_email_change_verification(
-            to_email=request.new_email,
-            verification_url=verification_url,
-            current_email=current_user.email,
-        )
+    db.add(new_verification)
+    db.commit()
 
-        return BaseResponse(
-            data={
-                "message": "인증 이메일이 발송되었습니다.",
-                "email_sent": "true",
-                "target_email": request.new_email,
-            },
-            message="이메일 변경 인증 이메일이 성공적으로 발송되었습니다.",
-        )
+    # 6. 인증 URL 생성
+    verification_url = f"{settings.frontend_url}/profile?token={verification_token}&action=change-email"
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"이메일 변경 인증 URL 발송 실패: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="인증 이메일 발송 중 오류가 발생했습니다.",
-        )
+    # 7. 실제 이메일 발송
+    email_service = EmailService()
+    await email_service.send_email_change_verification(
+        to_email=request.new_email,
+        verification_url=verification_url,
+        current_email=current_user.email,
+    )
+
+    return BaseResponse(
+        data={
+            "message": "인증 이메일이 발송되었습니다.",
+            "email_sent": "true",
+            "target_email": request.new_email,
+        },
+        message="이메일 변경 인증 이메일이 성공적으로 발송되었습니다.",
+    )
 
 
 @router.get("/change-email/verify-token")
@@ -777,53 +854,40 @@ async def verify_email_change_token(
     db: Session = Depends(get_session),
 ) -> BaseResponse[Dict[str, Any]]:
     """이메일 변경 토큰 검증 API"""
-    try:
-        from app.models.email_verification import EmailVerification
-
-        # 1. 토큰 검증
-        if email:
-            stmt = select(EmailVerification).where(
-                EmailVerification.email == email,
-                EmailVerification.verification_code == token,
-                EmailVerification.verification_type == "change",
-                EmailVerification.expires_at > datetime.now(),
-                EmailVerification.is_used.is_(False),
-            )
-        else:
-            stmt = select(EmailVerification).where(
-                EmailVerification.verification_code == token,
-                EmailVerification.verification_type == "change",
-                EmailVerification.expires_at > datetime.now(),
-                EmailVerification.is_used.is_(False),
-            )
-
-        result = db.execute(stmt)
-        verification = result.scalar_one_or_none()
-
-        if not verification:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="유효하지 않은 인증 토큰입니다.",
-            )
-
-        return BaseResponse(
-            data={
-                "valid": "true",
-                "email": verification.email,
-                "message": "인증 토큰이 유효합니다.",
-            },
-            message="토큰 검증 성공",
+    # 1. 토큰 검증
+    if email:
+        stmt = select(EmailVerification).where(
+            EmailVerification.email == email,
+            EmailVerification.verification_code == token,
+            EmailVerification.verification_type == "change",
+            EmailVerification.expires_at > datetime.now(),
+            EmailVerification.is_used.is_(False),
+        )
+    else:
+        stmt = select(EmailVerification).where(
+            EmailVerification.verification_code == token,
+            EmailVerification.verification_type == "change",
+            EmailVerification.expires_at > datetime.now(),
+            EmailVerification.is_used.is_(False),
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"토큰 검증 실패: {e}")
+    verification = db.scalar(stmt)
+
+    if not verification:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="토큰 검증 중 오류가 발생했습니다.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 인증 토큰입니다.",
         )
 
+    return BaseResponse(
+        data={
+            "valid": "true",
+            "email": verification.email,
+            "message": "인증 토큰이 유효합니다.",
+        },
+        message="토큰 검증 성공",
+    )
+
 
 @authenticated_router.post("/change-email/verify-password", response_model=BaseResponse[Dict[str, str]])
 async def verify_password_and_change_email(
@@ -832,259 +896,236 @@ async def verify_password_and_change_email(
     db: Session = Depends(get_session),
 ) -> BaseResponse[Dict[str, str]]:
     """토큰 검증 및 비밀번호 확인 후 이메일 변경 API"""
-    try:
-        from app.models.email_verification import EmailVerification
+    # 1. 이메일 회원가입 사용자인지 확인
+    if current_user.account_type != AccountType.EMAIL.value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="소셜 로그인 사용자는 비밀번호 확인이 필요하지 않습니다.",
+        )
 
-        # 1. 이메일 회원가입 사용자인지 확인
-        if current_user.account_type != AccountType.EMAIL.value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="소셜 로그인 사용자는 비밀번호 확인이 필요하지 않습니다.",
-            )
+    # 2. 토큰 검증
+    stmt = select(EmailVerification).where(
+        EmailVerification.email == request.new_email,
+        EmailVerification.verification_code == request.token,
+        EmailVerification.verification_type == "change",
+        EmailVerification.expires_at > datetime.now(),
+        EmailVerification.is_used.is_(False),
+    )
+    verification = db.scalar(stmt)
 
-        # 2. 토큰 검증
-        stmt = select(EmailVerification).where(
-            EmailVerification.email == request.new_email,
-            EmailVerification.verification_code == request.token,
-            EmailVerification.verification_type == "change",
-            EmailVerification.expires_at > datetime.now(),
-            EmailVerification.is_used.is_(False),
+    if not verification:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 인증 토큰입니다.",
         )
-        result = db.execute(stmt)
-        verification = result.scalar_one_or_none()
 
-        if not verification:
+    # 3. 비밀번호 검증
+    if not password_hasher.verify_password(
+        request.password, current_user.password_hash
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="비밀번호가 올바르지 않습니다.",
+        )
+
+    # 4. 새로운 이메일 중복 확인
+    stmt = select(
+        exists().where(func.lower(User.email) == request.new_email.lower())
+    )
+    email_taken = db.scalar(stmt)
+
+    if email_taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 이메일입니다.",
+        )
+
+    # 5. 이메일 변경
+    old_email = current_user.email
+    user_id = current_user.id
+    current_user.email = request.new_email
+
+    # 6. 토큰 사용 처리
+    verification.is_used = True
+
+    db.commit()
+    invalidate_user_info(user_id)
+    invalidate_availability(email=request.new_email)
+
+    logger.info("이메일 변경 성공: %s → %s", old_email, request.new_email)
+
+    return BaseResponse(
+        data={
+            "message": "이메일이 성공적으로 변경되었습니다.",
+            "email_changed": "true",
+            "old_email": old_email,
+            "new_email": request.new_email,
+            "requires_logout": "true",
+        },
+        message="이메일 변경이 완료되었습니다. 보안을 위해 다시 로그인해주세요.",
+    )
+
+
+# === 계정 탈퇴 관련 엔드포인트 ===
+class WithdrawRequest(BaseModel):
+    password: str  # 이메일 계정의 경우 비밀번호 확인
+    reason: str = "기타"  # 탈퇴 이유
+    detailed_reason: str = None  # 상세 이유
+
+
+@authenticated_router.post("/withdraw", response_model=BaseResponse[Dict[str, Any]])
+async def withdraw_account(
+    request: WithdrawRequest,
+    response: Response,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_session),
+) -> BaseResponse[Dict[str, Any]]:
+    """회원 탈퇴 API"""
+    logger.info("탈퇴 요청 시작: %s", current_user.id)
+
+    # 1. 계정 타입별 비밀번호 확인
+    if current_user.account_type == AccountType.EMAIL.value:
+        if not request.password:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="유효하지 않은 인증 토큰입니다.",
+                detail="이메일 계정은 비밀번호 확인이 필요합니다.",
             )
-
-        # 3. 비밀번호 검증
-        if not password_hasher.verify_password(
+        if not await verify_password_async(
             request.password, current_user.password_hash
         ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="비밀번호가 올바르지 않습니다.",
+                detail="비밀번호가 올바르지 않습니다."
             )
 
-        # 4. 새로운 이메일 중복 확인
-        stmt = select(User).where(User.email == request.new_email)
-        result = db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용 중인 이메일입니다.",
-            )
-
-        # 5. 이메일 변경
-        old_email = current_user.email
-        current_user.email = request.new_email
-
-        # 6. 토큰 사용 처리
-        verification.is_used = True
-
-        db.commit()
-
-        logger.info(f"이메일 변경 성공: {old_email} → {request.new_email}")
-
-        return BaseResponse(
-            data={
-                "message": "이메일이 성공적으로 변경되었습니다.",
-                "email_changed": "true",
-                "old_email": old_email,
-                "new_email": request.new_email,
-                "requires_logout": "true",
-            },
-            message="이메일 변경이 완료되었습니다. 보안을 위해 다시 로그인해주세요.",
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"이메일 변경 실패: {e}")
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="이메일 변경 중 오류가 발생했습니다.",
-        )
-
-
-# === 계정 탈퇴 관련 엔드포인트 ===
-class WithdrawRequest(BaseModel):
-    password: str  # 이메일 계정의 경우 비밀번호 확인
-    reason: str = "기타"  # 탈퇴 이유
-    detailed_reason: str = None  # 상세 이유
+    # 2. 탈퇴 처리
+    withdrawal_date = datetime.now(timezone.utc)
 
+    # 3~5. User/Diary Soft Delete 및 관련 데이터 Hard Delete를 CTE 한 문장으로 실행
+    await db.execute(
+        _WITHDRAW_STATEMENT,
+        {
+            "user_id": current_user.id,
+            "email": current_user.email,
+            "withdrawal_date": withdrawal_date,
+        },
+    )
 
-@authenticated_router.post("/withdraw", response_model=BaseResponse[Dict[str, Any]])
-async def withdraw_account(
-    request: WithdrawRequest,
-    response: Response,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_session),
-) -> BaseResponse[Dict[str, Any]]:
-    """회원 탈퇴 API"""
-    try:
-        from sqlalchemy import update, delete
-        from app.models.diary import DiaryEntry
-        from app.models.fcm import FCMToken, NotificationHistory, NotificationSettings
-        from app.models.notification import Notification
-        from app.models.oauth_token import OAuthToken
-        from app.models.email_verification import EmailVerification
-        from app.models.image import Image
-
-        logger.info(f"탈퇴 요청 시작: {current_user.id}")
-
-        # 1. 계정 타입별 비밀번호 확인
-        if current_user.account_type == AccountType.EMAIL.value:
-            if not request.password:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="이메일 계정은 비밀번호 확인이 필요합니다.",
-                )
-            if not password_hasher.verify_password(
-                request.password, current_user.password_hash
-            ):
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="비밀번호가 올바르지 않습니다."
-                )
+    await db.commit()
+    invalidate_user_info(current_user.id)
 
-        # 2. 탈퇴 처리
-        withdrawal_date = datetime.now(timezone.utc)
+    # 6. 쿠키 무효화
+    _clear_auth_cookies(response)
 
-        # 3. User 테이블 Soft Delete
-        db.execute(
-            update(User)
-            .where(User.id == current_user.id)
-            .values(deleted_at=withdrawal_date)
-        )
+    logger.info("탈퇴 성공: %s", current_user.id)
 
-        # 4. Diary 테이블 Soft Delete
-        db.execute(
-            update(DiaryEntry)
-            .where(DiaryEntry.user_id == current_user.id)
-            .values(deleted_at=withdrawal_date)
-        )
+    return BaseResponse(
+        data={
+            "message": "계정 탈퇴가 완료되었습니다.",
+            "withdrawal_date": withdrawal_date.isoformat(),
+            "restore_until": (withdrawal_date + timedelta(days=30)).isoformat(),
+            "success": True,
+        },
+        message="계정 탈퇴가 성공적으로 처리되었습니다.",
+    )
 
-        # 5. 관련 데이터 Hard Delete
-        db.execute(delete(FCMToken).where(FCMToken.user_id == current_user.id))
-        db.execute(delete(NotificationSettings).where(NotificationSettings.user_id == current_user.id))
-        db.execute(delete(NotificationHistory).where(NotificationHistory.user_id == current_user.id))
-        db.execute(delete(Notification).where(Notification.user_id == current_user.id))
-        db.execute(delete(OAuthToken).where(OAuthToken.user_id == current_user.id))
-        db.execute(delete(EmailVerification).where(EmailVerification.email == current_user.email))
 
-        db.commit()
+# 헬퍼 함수들
+def _build_withdraw_statement():
+    """
+    회원 탈퇴 처리 문장 생성
 
-        # 6. 쿠키 무효화
-        _clear_auth_cookies(response)
+    User Soft Delete를 본문으로, Diary Soft Delete와 관련 테이블 Hard Delete를
+    데이터 변경 CTE로 묶어 한 번의 왕복으로 실행
+    (user_id/email/withdrawal_date는 실행 시 파라미터로 전달)
+    """
+    user_id = bindparam("user_id", type_=User.id.type)
+    email = bindparam("email", type_=EmailVerification.email.type)
+    withdrawal_date = bindparam("withdrawal_date", type_=User.deleted_at.type)
+
+    ctes = [
+        update(DiaryEntry)
+        .where(DiaryEntry.user_id == user_id)
+        .values(deleted_at=withdrawal_date)
+        .returning(DiaryEntry.id)
+        .cte("withdrawn_diaries"),
+        delete(FCMToken)
+        .where(FCMToken.user_id == user_id)
+        .returning(FCMToken.id)
+        .cte("deleted_fcm_tokens"),
+        delete(NotificationSettings)
+        .where(NotificationSettings.user_id == user_id)
+        .returning(NotificationSettings.id)
+        .cte("deleted_notification_settings"),
+        delete(NotificationHistory)
+        .where(NotificationHistory.user_id == user_id)
+        .returning(NotificationHistory.id)
+        .cte("deleted_notification_history"),
+        delete(Notification)
+        .where(Notification.user_id == user_id)
+        .returning(Notification.id)
+        .cte("deleted_notifications"),
+        delete(OAuthToken)
+        .where(OAuthToken.user_id == user_id)
+        .returning(OAuthToken.id)
+        .cte("deleted_oauth_tokens"),
+        delete(EmailVerification)
+        .where(EmailVerification.email == email)
+        .returning(EmailVerification.id)
+        .cte("deleted_email_verifications"),
+    ]
+    return (
+        update(User)
+        .where(User.id == user_id)
+        .values(deleted_at=withdrawal_date)
+        .add_cte(*ctes)
+    )
 
-        logger.info(f"탈퇴 성공: {current_user.id}")
 
-        return BaseResponse(
-            data={
-                "message": "계정 탈퇴가 완료되었습니다.",
-                "withdrawal_date": withdrawal_date.isoformat(),
-                "restore_until": (withdrawal_date + timedelta(days=30)).isoformat(),
-                "success": True,
-            },
-            message="계정 탈퇴가 성공적으로 처리되었습니다.",
-        )
+# 탈퇴 문장은 import 시 한 번만 구성하고 요청마다 파라미터만 바인딩
+_WITHDRAW_STATEMENT = _build_withdraw_statement()
 
-    except HTTPException:
-        db.rollback()
-        raise
-    except Exception as e:
-        logger.error(f"탈퇴 처리 중 예외 발생: {e}")
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="탈퇴 처리 중 오류가 발생했습니다.",
-        )
 
-
-# 헬퍼 함수들
 async def _get_user_from_request(request: Request, db: Session) -> User | None:
     """요청에서 사용자 정보 추출 (Bearer token 또는 Cookie)"""
-    current_user = None
-
-    # 1. Authorization 헤더에서 Bearer 토큰 확인
+    # 1. Authorization 헤더의 Bearer 토큰, 2. 쿠키 순으로 확인
     auth_header = request.headers.get("Authorization")
-    if auth_header and auth_header.startswith("Bearer "):
-        token = auth_header.split(" ")[1]
-        try:
-            payload = jwt.decode(
-                token, settings.secret_key, algorithms=[settings.jwt_algorithm]
-            )
-            user_id = payload.get("sub")
-            if user_id:
-                stmt = select(User).where(User.id == user_id)
-                result = db.execute(stmt)
-                current_user = result.scalar_one_or_none()
-        except JWTError:
-            pass
-
-    # 2. Bearer 토큰이 없거나 유효하지 않으면 쿠키 확인
-    if not current_user:
-        access_token = request.cookies.get("access_token")
-        if access_token:
-            try:
-                payload = jwt.decode(
-                    access_token,
-                    settings.secret_key,
-                    algorithms=[settings.jwt_algorithm],
-                )
-                user_id = payload.get("sub")
-                if user_id:
-                    stmt = select(User).where(User.id == user_id)
-                    result = db.execute(stmt)
-                    current_user = result.scalar_one_or_none()
-            except JWTError:
-                pass
-
-    return current_user
-
-
-def _set_auth_cookies(response: JSONResponse, access_token: str, refresh_token: str):
-    """인증 쿠키 설정"""
-    response.set_cookie(
-        key="access_token",
-        value=access_token,
-        httponly=settings.cookie_httponly,
-        secure=settings.cookie_secure,
-        samesite=settings.cookie_samesite,
-        max_age=settings.jwt_access_token_expire_minutes * 60,
-        path="/",
-        domain=settings.cookie_domain,
+    tokens = (
+        auth_header.split(" ")[1]
+        if auth_header and auth_header.startswith("Bearer ")
+        else None,
+        request.cookies.get("access_token"),
     )
 
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=settings.cookie_httponly,
-        secure=settings.cookie_secure,
-        samesite=settings.cookie_samesite,
-        max_age=settings.jwt_refresh_token_expire_days * 24 * 60 * 60,
-        path="/",
-        domain=settings.cookie_domain,
+    for token in tokens:
+        if not token:
+            continue
+        try:
+            user_id = decode_jwt(token)["sub"]
+            # identity map 우선 조회 (이미 로드된 경우 SELECT 생략)
+            current_user = db.get(User, UUID(user_id))
+        except (jwt.InvalidTokenError, ValueError):
+            continue
+        if current_user:
+            return current_user
+
+    return None
+
+
+def _set_auth_cookies(response: Response, access_token: str, refresh_token: str):
+    """인증 쿠키 설정 (미리 만든 속성 문자열에 토큰 값만 붙여 Set-Cookie 헤더 추가)"""
+    response.headers.append(
+        "set-cookie", f"access_token={access_token}{_ACCESS_COOKIE_SUFFIX}"
+    )
+    response.headers.append(
+        "set-cookie", f"refresh_token={refresh_token}{_REFRESH_COOKIE_SUFFIX}"
     )
 
 
 def _clear_auth_cookies(response: Response):
     """인증 쿠키 삭제"""
-    for key in ["access_token", "refresh_token", "session"]:
-        response.delete_cookie(
-            key=key,
-            path="/",
-            secure=settings.cookie_secure,
-            httponly=settings.cookie_httponly,
-            samesite=settings.cookie_samesite,
-            domain=settings.cookie_domain,
-        )
+    for key in _AUTH_COOKIE_KEYS:
+        response.delete_cookie(key=key, **_COOKIE_KW)
 
 
 # =============================================================================
@@ -1106,11 +1147,12 @@ async def send_password_reset_email(
     Returns:
         발송 결과
     """
+    now = datetime.now(timezone.utc)
+
     try:
         # 사용자 조회
-        stmt = select(User).where(User.email == request.email)
-        result = db.execute(stmt)
-        user = result.scalar_one_or_none()
+        stmt = select(User).where(func.lower(User.email) == request.email.lower())
+        user = db.scalar(stmt)
 
         if not user:
             return BaseResponse(
@@ -1150,26 +1192,27 @@ async def send_password_reset_email(
 
         for token in existing_tokens:
             token.is_used = True
-            token.used_at = datetime.now(timezone.utc)
 
-        # 새로운 토큰 생성
-        token_value = str(uuid4())
-        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        # 새로운 토큰 생성 (192비트 URL-safe 토큰, 32자)
+        token_value = secrets.token_urlsafe(24)
+        expires_at = now + timedelta(hours=1)
 
         reset_token = PasswordResetToken(
             user_id=user.id, token=token_value, expires_at=expires_at, is_used=False
         )
 
+        # 커밋 후 만료된 사용자 속성 재조회를 피하기 위해 미리 보관
+        to_email, nickname = user.email, user.nickname
+
         db.add(reset_token)
         db.commit()
-        db.refresh(reset_token)
 
         # 비밀번호 재설정 이메일 발송
         email_service = EmailService()
         reset_url = f"{settings.frontend_url}/reset-password?token={token_value}"
 
         email_sent = await email_service.send_password_reset_email(
-            to_email=user.email, nickname=user.nickname, reset_url=reset_url
+            to_email=to_email, nickname=nickname, reset_url=reset_url
         )
 
         if not email_sent:
@@ -1197,7 +1240,7 @@ async def send_password_reset_email(
 
     except Exception as e:
         db.rollback()
-        logger.error(f"비밀번호 재설정 이메일 발송 중 오류: {e}")
+        logger.error("비밀번호 재설정 이메일 발송 중 오류: %s", e)
 
         return BaseResponse(
             success=False,
@@ -1211,6 +1254,57 @@ async def send_password_reset_email(
         )
 
 
+def _find_password_reset_token(
+    db: Session, email: str, token: str, now: datetime
+):
+    """
+    이메일 계정 사용자와 유효한 재설정 토큰을 단일 JOIN으로 조회
+
+    Returns:
+        (user_id, token_id, password_hash) 또는 None
+    """
+    stmt = (
+        select(User.id, PasswordResetToken.id, User.password_hash)
+        .join(PasswordResetToken, PasswordResetToken.user_id == User.id)
+        .where(
+            func.lower(User.email) == email.lower(),
+            User.account_type != AccountType.SOCIAL.value,
+            PasswordResetToken.token == token,
+            PasswordResetToken.is_used.is_(False),
+            PasswordResetToken.expires_at > now,
+        )
+        .limit(1)
+    )
+    return db.execute(stmt).first()
+
+
+def _raise_password_reset_lookup_error(db: Session, email: str) -> None:
+    """
+    재설정 토큰 조회 실패 시 원인(계정 없음/소셜 계정/잘못된 코드)에 맞는 예외 발생
+    """
+    account_type = db.execute(
+        select(User.account_type).where(func.lower(User.email) == email.lower())
+    ).scalar_one_or_none()
+
+    if account_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 이메일로 가입된 계정이 없습니다.",
+        )
+
+    # 소셜 계정 사용자인 경우
+    if account_type == AccountType.SOCIAL.value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="소셜 계정 사용자는 비밀번호 재설정이 불가능합니다.",
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="유효하지 않은 인증코드입니다.",
+    )
+
+
 @router.post("/forgot-password/verify", response_model=BaseResponse[Dict[str, Any]])
 async def verify_password_reset_code(
     request: VerifyPasswordResetCodeRequest,
@@ -1226,55 +1320,21 @@ async def verify_password_reset_code(
     Returns:
         인증 결과
     """
-    try:
-        # 사용자 조회
-        stmt = select(User).where(User.email == request.email)
-        result = db.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 이메일로 가입된 계정이 없습니다.",
-            )
-
-        # 소셜 계정 사용자인 경우
-        if user.account_type == AccountType.SOCIAL.value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="소셜 계정 사용자는 비밀번호 재설정이 불가능합니다.",
-            )
-
-        # 토큰 조회
-        stmt = select(PasswordResetToken).where(
-            PasswordResetToken.user_id == user.id,
-            PasswordResetToken.token == request.verification_code,
-            PasswordResetToken.is_used.is_(False),
-            PasswordResetToken.expires_at > datetime.now(timezone.utc),
-        )
-        result = db.execute(stmt)
-        token = result.scalar_one_or_none()
+    now = datetime.now(timezone.utc)
 
-        if not token:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="유효하지 않은 인증코드입니다.",
-            )
+    # 사용자 + 토큰 단일 JOIN 조회
+    row = _find_password_reset_token(
+        db, request.email, request.verification_code, now
+    )
 
-        return BaseResponse(
-            success=True,
-            data={"verified": True},
-            message="인증코드가 확인되었습니다.",
-        )
+    if not row:
+        _raise_password_reset_lookup_error(db, request.email)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"인증코드 확인 중 오류: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="인증코드 확인 중 오류가 발생했습니다.",
-        )
+    return BaseResponse(
+        success=True,
+        data={"verified": True},
+        message="인증코드가 확인되었습니다.",
+    )
 
 
 @router.post("/forgot-password/reset", response_model=BaseResponse[Dict[str, str]])
@@ -1292,65 +1352,43 @@ async def reset_password(
     Returns:
         재설정 결과
     """
-    try:
-        # 사용자 조회
-        stmt = select(User).where(User.email == request.email)
-        result = db.execute(stmt)
-        user = result.scalar_one_or_none()
+    now = datetime.now(timezone.utc)
 
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="해당 이메일로 가입된 계정이 없습니다.",
-            )
+    # 사용자 + 토큰 단일 JOIN 조회 및 검증
+    row = _find_password_reset_token(
+        db, request.email, request.verification_code, now
+    )
 
-        # 소셜 계정 사용자인 경우
-        if user.account_type == AccountType.SOCIAL.value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="소셜 계정 사용자는 비밀번호 재설정이 불가능합니다.",
-            )
+    if not row:
+        _raise_password_reset_lookup_error(db, request.email)
 
-        # 토큰 조회 및 검증
-        stmt = select(PasswordResetToken).where(
-            PasswordResetToken.user_id == user.id,
-            PasswordResetToken.token == request.verification_code,
-            PasswordResetToken.is_used.is_(False),
-            PasswordResetToken.expires_at > datetime.now(timezone.utc),
-        )
-        result = db.execute(stmt)
-        token = result.scalar_one_or_none()
+    user_id, token_id, old_password_hash = row
 
-        if not token:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="유효하지 않은 인증코드입니다.",
-            )
+    # 비밀번호 해시화 및 업데이트
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(password_hash=password_hasher.hash_password(request.new_password))
+    )
 
-        # 비밀번호 해시화 및 업데이트
-        user.password_hash = password_hasher.hash_password(request.new_password)
+    # 토큰 사용 처리
+    db.execute(
+        update(PasswordResetToken)
+        .where(PasswordResetToken.id == token_id)
+        .values(is_used=True)
+    )
 
-        # 토큰 사용 처리
-        token.is_used = True
-        token.used_at = datetime.now(timezone.utc)
+    db.commit()
 
-        db.commit()
+    # 이전 비밀번호의 검증 캐시 제거 (해당 사용자 항목만, None이면 전체가 비워지므로 제외)
+    if old_password_hash:
+        clear_verify_cache(old_password_hash)
 
-        return BaseResponse(
-            success=True,
-            data={"message": "비밀번호가 성공적으로 변경되었습니다."},
-            message="비밀번호가 성공적으로 변경되었습니다.",
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"비밀번호 재설정 중 오류: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="비밀번호 재설정 중 오류가 발생했습니다.",
-        )
+    return BaseResponse(
+        success=True,
+        data={"message": "비밀번호가 성공적으로 변경되었습니다."},
+        message="비밀번호가 성공적으로 변경되었습니다.",
+    )
 
 
 # =============================================================================
@@ -1374,42 +1412,42 @@ async def change_password(
     Returns:
         변경 결과
     """
-    try:
-        # 소셜 계정 사용자인 경우
-        if current_user.account_type == AccountType.SOCIAL.value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="소셜 계정 사용자는 비밀번호 변경이 불가능합니다.",
-            )
-
-
-        # 현재 비밀번호 확인
-        if not password_hasher.verify_password(request.current_password, current_user.password_hash):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="현재 비밀번호가 올바르지 않습니다.",
-            )
+    # 소셜 계정 사용자인 경우
+    if current_user.account_type == AccountType.SOCIAL.value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="소셜 계정 사용자는 비밀번호 변경이 불가능합니다.",
+        )
 
-        # 새 비밀번호 해시화 및 업데이트
-        current_user.password_hash = password_hasher.hash_password(request.new_password)
-        db.commit()
 
-        return BaseResponse(
-            success=True,
-            data={"message": "비밀번호가 성공적으로 변경되었습니다."},
-            message="비밀번호가 성공적으로 변경되었습니다.",
+    # 현재 비밀번호 확인
+    if not password_hasher.verify_password(request.current_password, current_user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="현재 비밀번호가 올바르지 않습니다.",
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"비밀번호 변경 중 오류: {e}")
+    # 현재 비밀번호와 동일한지 확인 (검증된 평문끼리 비교하여 추가 bcrypt 연산 생략)
+    if constant_time_compare(request.new_password, request.current_password):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="비밀번호 변경 중 오류가 발생했습니다.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="새 비밀번호는 현재 비밀번호와 달라야 합니다.",
         )
 
+    # 새 비밀번호 해시화 및 업데이트
+    old_password_hash = current_user.password_hash
+    current_user.password_hash = password_hasher.hash_password(request.new_password)
+    db.commit()
+
+    # 이전 비밀번호의 검증 캐시 제거
+    clear_verify_cache(old_password_hash)
+
+    return BaseResponse(
+        success=True,
+        data={"message": "비밀번호가 성공적으로 변경되었습니다."},
+        message="비밀번호가 성공적으로 변경되었습니다.",
+    )
+
 
 @authenticated_router.post("/verify-password", response_model=BaseResponse[Dict[str, str]])
 async def verify_password(
@@ -1426,46 +1464,68 @@ async def verify_password(
     Returns:
         비밀번호 확인 결과
     """
-    try:
-        from app.utils.encryption import password_hasher
-
-        # 이메일 회원가입 사용자인지 확인
-        if current_user.account_type != AccountType.EMAIL.value:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="소셜 로그인 사용자는 비밀번호 확인이 불가능합니다.",
-            )
-
-        # 현재 비밀번호 확인
-        if not password_hasher.verify_password(request.current_password, current_user.password_hash):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="현재 비밀번호가 올바르지 않습니다.",
-            )
-
-        return BaseResponse.success(
-            data={"message": "비밀번호 확인 완료"},
-            message="비밀번호가 정상적으로 확인되었습니다.",
+    # 이메일 회원가입 사용자인지 확인
+    if current_user.account_type != AccountType.EMAIL.value:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="소셜 로그인 사용자는 비밀번호 확인이 불가능합니다.",
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"비밀번호 확인 중 오류: {e}")
+    # 현재 비밀번호 확인
+    if not password_hasher.verify_password(request.current_password, current_user.password_hash):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="비밀번호 확인 중 오류가 발생했습니다.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="현재 비밀번호가 올바르지 않습니다.",
         )
 
+    return BaseResponse.success(
+        data={"message": "비밀번호 확인 완료"},
+        message="비밀번호가 정상적으로 확인되었습니다.",
+    )
+
 
 # =============================================================================
 # 계정 복구 관련 엔드포인트
 # =============================================================================
 
+
+async def _get_restorable_user(db: AsyncSession, email: str) -> User:
+    """
+    복구 가능한 탈퇴 사용자 조회
+
+    30일 경과 여부를 DB에서 함께 계산하여 파이썬 측 timezone 변환 없이 판단
+
+    Raises:
+        HTTPException: 탈퇴 계정이 없거나(404) 복구 기간이 지난 경우(400)
+    """
+    stmt = select(
+        User,
+        (User.deleted_at >= func.now() - _RESTORE_WINDOW).label("restorable"),
+    ).where(
+        func.lower(User.email) == email.lower(),
+        User.deleted_at.is_not(None),
+    )
+    row = (await db.execute(stmt)).one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="탈퇴된 계정을 찾을 수 없습니다."
+        )
+
+    if not row.restorable:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="탈퇴 후 30일이 경과되어 복구할 수 없습니다.",
+        )
+
+    return row.User
+
+
 @router.post("/restore/send-restore-email", response_model=BaseResponse[Dict[str, str]])
 async def send_restore_email(
     request: SendRestoreEmailRequest,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[Dict[str, str]]:
     """
     복구 이메일 발송 API
@@ -1477,109 +1537,62 @@ async def send_restore_email(
     Returns:
         이메일 발송 성공 응답
     """
-    try:
-        # 1. 탈퇴된 사용자 확인
-        stmt = select(User).where(
-            User.email == request.email,
-            User.deleted_at.is_not(None)
-        )
-        result = db.execute(stmt)
-        user = result.scalar_one_or_none()
+    # 1~2. 탈퇴된 사용자 조회 및 복구 가능 기간(30일) 확인
+    await _get_restorable_user(db, request.email)
 
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="탈퇴된 계정을 찾을 수 없습니다."
-            )
+    # 3. 인증 코드 생성 (6자리 숫자)
+    verification_code = generate_verification_code()
 
-        # 2. 30일 이내인지 확인
-        current_time = (
-            datetime.now(user.deleted_at.tzinfo)
-            if user.deleted_at.tzinfo
-            else datetime.now()
-        )
-        deleted_time = (
-            user.deleted_at.replace(tzinfo=None)
-            if user.deleted_at.tzinfo
-            else user.deleted_at
-        )
-        current_time_naive = (
-            current_time.replace(tzinfo=None) if current_time.tzinfo else current_time
-        )
-
-        if deleted_time < current_time_naive - timedelta(days=30):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="탈퇴 후 30일이 경과되어 복구할 수 없습니다.",
-            )
-
-        # 3. 인증 코드 생성 (6자리 숫자)
-        import random
-        verification_code = str(random.randint(100000, 999999))
-
-        # 4. 기존 인증 코드가 있다면 만료 처리
-        stmt = select(EmailVerification).where(
+    # 4~5. 기존 인증 코드 만료 처리와 새로운 인증 코드 저장을 한 트랜잭션으로 처리
+    now = datetime.now()
+    await db.execute(
+        update(EmailVerification)
+        .where(
             EmailVerification.email == request.email,
             EmailVerification.verification_type == "restore",
-            EmailVerification.expires_at > datetime.now(),
-        )
-        result = db.execute(stmt)
-        existing_verification = result.scalar_one_or_none()
-
-        if existing_verification:
-            existing_verification.expires_at = datetime.now() - timedelta(seconds=1)
-            existing_verification.is_used = True
-            db.commit()
-
-        # 5. 새로운 인증 코드 저장
-        new_verification = EmailVerification(
-            email=request.email,
-            verification_code=verification_code,
-            verification_type="restore",
-            expires_at=datetime.now() + timedelta(minutes=10),
-        )
-
-        db.add(new_verification)
-        db.commit()
-
-        # 6. 실제 이메일 발송
-        email_service = EmailService()
-        email_sent = await email_service.send_verification_email(
-            request.email, verification_code, "restore"
+            EmailVerification.expires_at > now,
         )
+        .values(expires_at=now - timedelta(seconds=1), is_used=True)
+    )
 
-        if not email_sent:
-            # 이메일 발송 실패 시 인증 코드 삭제
-            db.delete(new_verification)
-            db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="복구 이메일 발송에 실패했습니다. 잠시 후 다시 시도해주세요.",
-            )
+    new_verification = EmailVerification(
+        email=request.email,
+        verification_code=verification_code,
+        verification_type="restore",
+        expires_at=now + timedelta(minutes=10),
+    )
 
-        logger.info(f"복구 이메일 발송 성공: {request.email} (인증코드: {verification_code})")
+    db.add(new_verification)
+    await db.commit()
 
-        return BaseResponse(
-            success=True,
-            data={"message": "복구 이메일이 발송되었습니다."},
-            message="복구 이메일이 성공적으로 발송되었습니다.",
-        )
+    # 6. 실제 이메일 발송
+    email_service = EmailService()
+    email_sent = await email_service.send_verification_email(
+        request.email, verification_code, "restore"
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"복구 이메일 발송 실패: {e}")
+    if not email_sent:
+        # 이메일 발송 실패 시 인증 코드 삭제
+        await db.delete(new_verification)
+        await db.commit()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="이메일 발송 중 오류가 발생했습니다.",
+            detail="복구 이메일 발송에 실패했습니다. 잠시 후 다시 시도해주세요.",
         )
 
+    logger.info("복구 이메일 발송 성공: %s (인증코드: %s)", request.email, verification_code)
+
+    return BaseResponse(
+        success=True,
+        data={"message": "복구 이메일이 발송되었습니다."},
+        message="복구 이메일이 성공적으로 발송되었습니다.",
+    )
+
 
 @router.post("/restore", response_model=BaseResponse[RestoreResponse])
 async def restore_account(
     request: RestoreRequest,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[RestoreResponse]:
     """
     계정 복구 API
@@ -1591,109 +1604,76 @@ async def restore_account(
     Returns:
         복구 성공 응답
     """
-    try:
-        # 1. 탈퇴된 사용자 조회
-        stmt = select(User).where(
-            User.email == request.email,
-            User.deleted_at.is_not(None)
-        )
-        result = db.execute(stmt)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="탈퇴된 계정을 찾을 수 없습니다."
-            )
-
-        # 2. 30일 이내인지 확인
-        current_time = (
-            datetime.now(user.deleted_at.tzinfo)
-            if user.deleted_at.tzinfo
-            else datetime.now()
-        )
-        deleted_time = (
-            user.deleted_at.replace(tzinfo=None)
-            if user.deleted_at.tzinfo
-            else user.deleted_at
-        )
-        current_time_naive = (
-            current_time.replace(tzinfo=None) if current_time.tzinfo else current_time
-        )
-
-        if deleted_time < current_time_naive - timedelta(days=30):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="탈퇴 후 30일이 경과되어 복구할 수 없습니다.",
-            )
+    # 1~2. 탈퇴된 사용자 조회 및 복구 가능 기간(30일) 확인
+    user = await _get_restorable_user(db, request.email)
 
-        # 3. 이메일 인증 코드 확인
-        stmt = select(EmailVerification).where(
+    # 3. 이메일 인증 코드 확인
+    stmt = (
+        select(EmailVerification.id)
+        .where(
             EmailVerification.email == request.email,
             EmailVerification.verification_code == request.verification_code,
             EmailVerification.verification_type == "restore",
             EmailVerification.expires_at > datetime.now(),
             EmailVerification.is_used.is_(False),
         )
-        result = db.execute(stmt)
-        verification = result.scalar_one_or_none()
-
-        if not verification:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="유효하지 않은 인증 코드입니다."
-            )
-
-        # 4. 인증 코드 사용 처리
-        verification.is_used = True
-        db.commit()
-
-        # 5. 계정 복구 처리
-        restored_at = datetime.now()
-
-        # User 테이블 복구
-        db.execute(update(User).where(User.id == user.id).values(deleted_at=None))
+        .limit(1)
+    )
+    verification_id = await db.scalar(stmt)
 
-        # Diary 테이블 복구
-        db.execute(
-            update(DiaryEntry)
-            .where(DiaryEntry.user_id == user.id)
-            .values(deleted_at=None)
+    if verification_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 인증 코드입니다."
         )
 
-        # 6. 사용된 인증 코드 삭제
-        db.delete(verification)
+    # 4. 계정 복구 처리 (인증 코드 삭제 + User/Diary 복구를 CTE 한 문장으로 실행)
+    restored_at = datetime.now()
 
-        # 7. 변경사항 커밋
-        db.commit()
+    used_verification = (
+        delete(EmailVerification)
+        .where(EmailVerification.id == verification_id)
+        .returning(EmailVerification.id)
+        .cte("used_verification")
+    )
+    restored_diaries = (
+        update(DiaryEntry)
+        .where(DiaryEntry.user_id == user.id)
+        .values(deleted_at=None)
+        .returning(DiaryEntry.id)
+        .cte("restored_diaries")
+    )
+    stmt = (
+        update(User)
+        .where(User.id == user.id)
+        .values(deleted_at=None)
+        .returning(User.id, User.email, User.nickname, User.account_type)
+        .add_cte(used_verification)
+        .add_cte(restored_diaries)
+    )
+    restored = (await db.execute(stmt)).one()
 
-        # 8. 응답 생성
-        account_type_message = (
-            "이메일 계정" if user.account_type == AccountType.EMAIL.value else "소셜 계정"
-        )
-        response_data = RestoreResponse(
-            message=f"{account_type_message}이 성공적으로 복구되었습니다.",
-            restored_at=restored_at,
-            user_id=str(user.id),
-            email=user.email,
-            nickname=user.nickname,
-        )
+    # 5. 변경사항 커밋
+    await db.commit()
 
-        logger.info(f"계정 복구 성공: {user.email}")
+    # 6. 응답 생성
+    account_type_message = (
+        "이메일 계정"
+        if restored.account_type == AccountType.EMAIL.value
+        else "소셜 계정"
+    )
+    response_data = RestoreResponse(
+        message=f"{account_type_message}이 성공적으로 복구되었습니다.",
+        restored_at=restored_at,
+        user_id=str(restored.id),
+        email=restored.email,
+        nickname=restored.nickname,
+    )
 
-        return BaseResponse(
-            success=True,
-            data=response_data,
-            message=f"{account_type_message} 복구가 완료되었습니다.",
-        )
+    logger.info("계정 복구 성공: %s", restored.email)
 
-    except HTTPException:
-        db.rollback()
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"계정 복구 실패: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="계정 복구 중 오류가 발생했습니다.",
-        )
+    return BaseResponse(
+        success=True,
+        data=response_data,
+        message=f"{account_type_message} 복구가 완료되었습니다.",
+    )
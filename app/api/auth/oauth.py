@@ -11,7 +11,11 @@ from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.security import create_access_token, create_refresh_token
+from app.core.security import (
+    access_token_claims,
+    create_access_token,
+    create_refresh_token,
+)
 from app.db.database import get_session
 from app.services.oauth import GoogleOAuthService
 
@@ -21,19 +25,39 @@ router = APIRouter(prefix="/google", tags=["Oauth"])
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# 자주 사용하는 설정값 (요청마다 settings 속성을 조회하지 않도록 import 시 한 번만 구성)
+_FRONTEND_CB = settings.frontend_callback_url
+_SUCCESS_REDIRECT_URL = f"{_FRONTEND_CB}?success=true"
+_OAUTH_COOKIE_KW = {
+    "path": "/",
+    "httponly": settings.cookie_httponly,
+    "secure": settings.is_production,
+    "samesite": "strict" if settings.is_production else settings.cookie_samesite,
+    "domain": settings.cookie_domain,
+}
+
+# 쿠키 만료 시간 (초)
+_ACCESS_MAX_AGE = settings.jwt_access_token_expire_minutes * 60
+_REFRESH_MAX_AGE = settings.jwt_refresh_token_expire_days * 24 * 60 * 60
+
+# 구글 로그인 URL (파라미터가 모두 정적 설정값이므로 import 시 한 번만 생성)
+_GOOGLE_LOGIN_URL = "{}?{}".format(
+    settings.google_auth_uri,
+    urlencode(
+        {
+            "client_id": settings.google_client_id,
+            "redirect_uri": settings.google_redirect_uri,
+            "response_type": "code",
+            "scope": "openid email profile",
+        }
+    ),
+)
+
 
 @router.get("/login")
 async def google_login() -> RedirectResponse:
     """구글 로그인 페이지로 리다이렉트"""
-    params = {
-        "client_id": settings.google_client_id,
-        "redirect_uri": settings.google_redirect_uri,
-        "response_type": "code",
-        "scope": "openid email profile",
-    }
-
-    query_string = urlencode(params)
-    return RedirectResponse(f"{settings.google_auth_uri}?{query_string}")
+    return RedirectResponse(_GOOGLE_LOGIN_URL)
 
 
 @router.get("/callback")
@@ -44,8 +68,8 @@ async def google_callback(
     """구글 OAuth 콜백 처리"""
     # 디버깅 로그
     if settings.is_development:
-        logger.debug(f"Frontend callback URL: {settings.frontend_callback_url}")
-        logger.debug(f"Google client ID: {settings.google_client_id[:8]}...")
+        logger.debug("Frontend callback URL: %s", _FRONTEND_CB)
+        logger.debug("Google client ID: %s...", settings.google_client_id[:8])
     else:
         logger.info("Google OAuth callback initiated")
 
@@ -54,25 +78,21 @@ async def google_callback(
         user, _ = await oauth_service.process_oauth_callback(code, db)
 
         # JWT 토큰 생성
-        access_token = create_access_token({"sub": str(user.id)})
+        access_token = create_access_token(access_token_claims(user))
         refresh_token = create_refresh_token({"sub": str(user.id)})
 
         # 프론트엔드로 리다이렉트 (쿠키에 토큰 설정)
-        response = RedirectResponse(
-            url=f"{settings.frontend_callback_url}?success=true"
-        )
+        response = RedirectResponse(url=_SUCCESS_REDIRECT_URL)
 
         # 쿠키에 토큰 설정 (환경별 보안 강화)
         _set_oauth_cookies(response, access_token, refresh_token)
 
         # 로그인 성공 로깅
         if settings.is_development:
-            logger.debug(f"User logged in: {user.email}")
-            logger.debug(
-                f"Redirecting to: {settings.frontend_callback_url}?success=true"
-            )
+            logger.debug("User logged in: %s", user.email)
+            logger.debug("Redirecting to: %s", _SUCCESS_REDIRECT_URL)
         else:
-            logger.info(f"User authentication successful: user_id={user.id}")
+            logger.info("User authentication successful: user_id=%s", user.id)
 
         return response
 
@@ -81,59 +101,60 @@ async def google_callback(
         error_detail = http_ex.detail
         if isinstance(error_detail, dict):
             if error_detail.get("error") == "ACCOUNT_DELETED":
-                error_url = f"{settings.frontend_callback_url}?error=account_deleted&message={error_detail.get('message', '탈퇴된 계정입니다.')}&restore_available=true&days_remaining={error_detail.get('days_remaining', 0)}"
+                error_url = _build_error_url(
+                    error="account_deleted",
+                    message=error_detail.get("message", "탈퇴된 계정입니다."),
+                    restore_available="true",
+                    days_remaining=error_detail.get("days_remaining", 0),
+                )
             elif error_detail.get("error") == "ACCOUNT_PERMANENTLY_DELETED":
-                error_url = f"{settings.frontend_callback_url}?error=account_permanently_deleted&message={error_detail.get('message', '탈퇴 후 30일이 경과되어 복구할 수 없습니다.')}&restore_available=false"
+                error_url = _build_error_url(
+                    error="account_permanently_deleted",
+                    message=error_detail.get(
+                        "message", "탈퇴 후 30일이 경과되어 복구할 수 없습니다."
+                    ),
+                    restore_available="false",
+                )
             else:
-                error_url = f"{settings.frontend_callback_url}?error=login_failed&message={error_detail.get('message', str(http_ex))}"
+                error_url = _build_error_url(
+                    error="login_failed",
+                    message=error_detail.get("message", str(http_ex)),
+                )
         else:
-            error_url = f"{settings.frontend_callback_url}?error=login_failed&message={str(error_detail)}"
+            error_url = _build_error_url(error="login_failed", message=str(error_detail))
 
         if settings.is_development:
-            logger.debug(f"HTTPException - Error URL: {error_url}")
+            logger.debug("HTTPException - Error URL: %s", error_url)
         else:
             logger.warning(
-                f"Authentication error occurred: status={http_ex.status_code}"
+                "Authentication error occurred: status=%s", http_ex.status_code
             )
 
         return RedirectResponse(url=error_url)
 
     except Exception as e:
-        error_url = (
-            f"{settings.frontend_callback_url}?error=login_failed&message={str(e)}"
-        )
+        error_url = _build_error_url(error="login_failed", message=str(e))
 
         if settings.is_development:
-            logger.debug(f"Error URL: {error_url}")
-            logger.error(f"OAuth Error: {e}")
+            logger.debug("Error URL: %s", error_url)
+            logger.error("OAuth Error: %s", e)
         else:
-            logger.error(f"OAuth authentication failed: {type(e).__name__}")
+            logger.error("OAuth authentication failed: %s", type(e).__name__)
 
         return RedirectResponse(url=error_url)
 
 
+def _build_error_url(**params) -> str:
+    """프론트엔드 콜백 에러 URL 생성 (쿼리 파라미터 인코딩)"""
+    return f"{_FRONTEND_CB}?{urlencode(params)}"
+
+
 def _set_oauth_cookies(
     response: RedirectResponse, access_token: str, refresh_token: str
 ):
     """OAuth 인증 쿠키 설정"""
-    response.set_cookie(
-        key="access_token",
-        value=access_token,
-        httponly=settings.cookie_httponly,
-        secure=settings.is_production,
-        samesite="strict" if settings.is_production else settings.cookie_samesite,
-        max_age=settings.jwt_access_token_expire_minutes * 60,
-        path="/",
-        domain=settings.cookie_domain,
-    )
-
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=settings.cookie_httponly,
-        secure=settings.is_production,
-        samesite="strict" if settings.is_production else settings.cookie_samesite,
-        max_age=settings.jwt_refresh_token_expire_days * 24 * 60 * 60,
-        path="/",
-        domain=settings.cookie_domain,
-    )
+    for key, value, max_age in (
+        ("access_token", access_token, _ACCESS_MAX_AGE),
+        ("refresh_token", refresh_token, _REFRESH_MAX_AGE),
+    ):
+        response.set_cookie(key=key, value=value, max_age=max_age, **_OAUTH_COOKIE_KW)
@@ -4,24 +4,28 @@
 """
 
 import logging
-import random
 import re
 from datetime import datetime, timedelta
 from typing import Any, Dict
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr, field_validator
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants import AccountType
 from app.core.config import get_settings
-from app.db.database import get_session
+from app.core.user_cache import availability_cache, invalidate_availability
+from app.db.database import AsyncSessionLocal, get_async_session
 from app.models.email_verification import EmailVerification
 from app.models.user import User
 from app.schemas.base import BaseResponse
-from app.utils.email_service import EmailService
-from app.utils.encryption import password_hasher
+from app.utils.email_service import EmailService, get_email_service
+from app.utils.encryption import generate_verification_code, hash_password_async
+from app.utils.validators import has_required_password_classes
 
 from app.utils.error_handlers import StandardHTTPException, bad_request_exception
 
@@ -29,6 +33,15 @@ router = APIRouter(tags=["Registration"])
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# 닉네임 허용 문자 패턴 (한글, 영문)
+_NICKNAME_PATTERN = re.compile(r"^[가-힣a-zA-Z]+$")
+
+def _signup_conflict_detail(error: IntegrityError) -> str:
+    """회원가입 INSERT 유니크 제약조건 위반 시 에러 메시지 결정"""
+    if "uq_users_nickname" in str(error.orig):
+        return "이미 사용 중인 닉네임입니다."
+    return "이미 가입된 이메일입니다."
+
 
 class SignupRequest(BaseModel):
     email: EmailStr
@@ -50,11 +63,7 @@ class SignupRequest(BaseModel):
             raise ValueError("비밀번호는 9자 이상이어야 합니다")
 
         # 영문, 숫자, 특수문자 포함 검사
-        has_letter = bool(re.search(r"[a-zA-Z]", v))
-        has_number = bool(re.search(r"\d", v))
-        has_special = bool(re.search(r'[!@#$%^&*()_+\-=\[\]{};\':"\\|,.<>/?]', v))
-
-        if not (has_letter and has_number and has_special):
+        if not has_required_password_classes(v):
             raise ValueError("비밀번호는 영문, 숫자, 특수문자를 모두 포함해야 합니다")
 
         return v
@@ -70,10 +79,10 @@ class SignupRequest(BaseModel):
         if not v or not isinstance(v, str):
             raise ValueError("닉네임은 유효한 문자열이어야 합니다")
 
-        if len(v) < 2 or len(v) > 10:
+        if not 2 <= len(v) <= 10:
             raise ValueError("닉네임은 2-10자 사이여야 합니다")
 
-        if not re.match(r"^[가-힣a-zA-Z]+$", v):
+        if not _NICKNAME_PATTERN.match(v):
             raise ValueError("닉네임은 한글과 영문만 사용 가능합니다")
 
         return v
@@ -98,265 +107,283 @@ class EmailVerificationConfirmRequest(BaseModel):
 @router.post("/signup", response_model=BaseResponse[SignupResponse])
 async def signup(
     request: SignupRequest,
-    db: Session = Depends(get_session),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_session),
+    email_service: EmailService = Depends(get_email_service),
 ) -> BaseResponse[SignupResponse]:
     """이메일 회원가입 API"""
-    try:
-        # 1. 이메일 중복 확인
-        stmt = select(User).where(User.email == request.email)
-        result = db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 가입된 이메일입니다.",
-            )
-
-        # 2. 이메일 인증 확인
-        stmt = select(EmailVerification).where(
+    # 1~3. 이메일 중복, 이메일 인증, 닉네임 중복을 단일 쿼리로 확인
+    stmt = select(
+        exists()
+        .where(func.lower(User.email) == request.email.lower())
+        .label("email_exists"),
+        select(EmailVerification.id)
+        .where(
             EmailVerification.email == request.email,
             EmailVerification.verification_type == "signup",
             EmailVerification.is_used.is_(True),
         )
-        result = db.execute(stmt)
-        email_verification = result.scalar_one_or_none()
-
-        if not email_verification:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이메일 인증이 필요합니다.",
-            )
-
-        # 3. 닉네임 중복 확인
-        stmt = select(User).where(User.nickname == request.nickname)
-        result = db.execute(stmt)
-        existing_nickname = result.scalar_one_or_none()
-
-        if existing_nickname:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용 중인 닉네임입니다.",
-            )
-
-        # 4. 비밀번호 해싱
-        hashed_password = password_hasher.hash_password(request.password)
-
-        # 5. 사용자 생성
-        new_user = User(
-            email=request.email,
-            password_hash=hashed_password,
-            nickname=request.nickname,
-            account_type=AccountType.EMAIL.value,
-            provider=None,
-            provider_id=None,
-            is_active=True,
+        .limit(1)
+        .scalar_subquery()
+        .label("verification_id"),
+        exists()
+        .where(User.nickname == request.nickname)
+        .label("nickname_exists"),
+    )
+    checks = (await db.execute(stmt)).one()
+
+    if checks.email_exists:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 가입된 이메일입니다.",
         )
 
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
-
-        # 6. 이메일 인증 기록 삭제 (회원가입 완료 후)
-        db.delete(email_verification)
-        db.commit()
-
-        # 7. 환영 이메일 발송
-        email_service = EmailService()
-        await email_service.send_welcome_email(new_user.email, new_user.nickname)
-
-        logger.info(f"새 사용자 가입: {new_user.email}")
+    if checks.verification_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이메일 인증이 필요합니다.",
+        )
 
-        return BaseResponse(
-            data=SignupResponse(
-                user_id=str(new_user.id),
-                email=new_user.email,
-                nickname=new_user.nickname,
-                message="회원가입이 완료되었습니다.",
-            ),
-            message="회원가입이 성공적으로 완료되었습니다.",
+    if checks.nickname_exists:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용 중인 닉네임입니다.",
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"회원가입 실패: {e}")
+    # 4. 비밀번호 해싱 (bcrypt 연산은 워커 스레드에서 수행)
+    hashed_password = await hash_password_async(request.password)
+
+    # 5. 사용자 생성
+    new_user = User(
+        email=request.email,
+        password_hash=hashed_password,
+        nickname=request.nickname,
+        account_type=AccountType.EMAIL.value,
+        provider=None,
+        provider_id=None,
+        is_active=True,
+    )
+
+    db.add(new_user)
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        # 사전 조회 이후 동시 가입으로 인한 중복은 DB 유니크 제약조건으로 최종 판단
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="회원가입 중 오류가 발생했습니다.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=_signup_conflict_detail(e),
         )
+    await db.commit()
+    await db.refresh(new_user)
+    invalidate_availability(email=new_user.email, nickname=new_user.nickname)
+
+    # 6. 이메일 인증 기록 삭제 (회원가입 완료 후)
+    await db.execute(
+        delete(EmailVerification).where(
+            EmailVerification.id == checks.verification_id
+        )
+    )
+    await db.commit()
+
+    # 7. 환영 이메일 발송 (응답 후 백그라운드에서 발송)
+    background_tasks.add_task(
+        email_service.send_welcome_email, new_user.email, new_user.nickname
+    )
+
+    logger.info("새 사용자 가입: %s", new_user.email)
+
+    return BaseResponse(
+        data=SignupResponse(
+            user_id=str(new_user.id),
+            email=new_user.email,
+            nickname=new_user.nickname,
+            message="회원가입이 완료되었습니다.",
+        ),
+        message="회원가입이 성공적으로 완료되었습니다.",
+    )
 
 
 @router.get("/check-email/{email}")
 async def check_email_availability(
     email: str,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[Dict[str, Any]]:
     """이메일 중복 확인 API"""
-    try:
-        stmt = select(User).where(User.email == email)
-        result = db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        data = {
-            "available": existing_user is None,
-            "message": "사용 가능한 이메일입니다."
-            if existing_user is None
-            else "이미 사용 중인 이메일입니다.",
-        }
-
-        return BaseResponse(data=data, message="이메일 중복 확인이 완료되었습니다.")
-    except Exception as e:
-        logger.error(f"이메일 확인 실패: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="이메일 확인 중 오류가 발생했습니다.",
-        )
+    # 최근 "사용 가능" 판정은 짧은 TTL 동안 재사용 (타이핑 중 연속 요청 흡수)
+    cache_key = ("email", email.lower())
+    if availability_cache.get(cache_key):
+        is_taken = False
+    else:
+        # 행 전체 대신 존재 여부만 확인 (ix_users_email_lower 인덱스 사용)
+        stmt = select(1).where(func.lower(User.email) == email.lower()).limit(1)
+        is_taken = await db.scalar(stmt) is not None
+        if not is_taken:
+            availability_cache.set(cache_key, True)
+
+    data = {
+        "available": not is_taken,
+        "message": "이미 사용 중인 이메일입니다."
+        if is_taken
+        else "사용 가능한 이메일입니다.",
+    }
+
+    return BaseResponse(data=data, message="이메일 중복 확인이 완료되었습니다.")
 
 
 @router.get("/check-nickname/{nickname}")
 async def check_nickname_availability(
     nickname: str,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[Dict[str, Any]]:
     """닉네임 중복 확인 API"""
-    try:
-        stmt = select(User).where(User.nickname == nickname)
-        result = db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        data = {
-            "available": existing_user is None,
-            "message": "사용 가능한 닉네임입니다."
-            if existing_user is None
-            else "이미 사용 중인 닉네임입니다.",
-        }
-
-        return BaseResponse(data=data, message="닉네임 중복 확인이 완료되었습니다.")
-    except Exception as e:
-        logger.error(f"닉네임 확인 실패: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="닉네임 확인 중 오류가 발생했습니다.",
-        )
+    # 최근 "사용 가능" 판정은 짧은 TTL 동안 재사용 (타이핑 중 연속 요청 흡수)
+    cache_key = ("nickname", nickname)
+    if availability_cache.get(cache_key):
+        is_taken = False
+    else:
+        # 행 전체 대신 존재 여부만 확인 (uq_users_nickname 인덱스 사용)
+        stmt = select(1).where(User.nickname == nickname).limit(1)
+        is_taken = await db.scalar(stmt) is not None
+        if not is_taken:
+            availability_cache.set(cache_key, True)
+
+    data = {
+        "available": not is_taken,
+        "message": "이미 사용 중인 닉네임입니다."
+        if is_taken
+        else "사용 가능한 닉네임입니다.",
+    }
+
+    return BaseResponse(data=data, message="닉네임 중복 확인이 완료되었습니다.")
 
 
 @router.post("/send-verification-email", response_model=BaseResponse[Dict[str, str]])
 async def send_verification_email(
     request: EmailVerificationRequest,
-    db: Session = Depends(get_session),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[Dict[str, str]]:
     """이메일 인증 코드 발송 API"""
-    logger.info(f"인증 코드 발송 요청 시작: {request.email}")
-
-    try:
-        # 1. 이메일 중복 확인
-        stmt = select(User).where(User.email == request.email)
-        result = db.execute(stmt)
-        existing_user = result.scalar_one_or_none()
-
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 가입된 이메일입니다.",
-            )
+    logger.info("인증 코드 발송 요청 시작: %s", request.email)
 
-        # 2. 인증 코드 생성 (6자리 숫자)
-        verification_code = str(random.randint(100000, 999999))
+    # 1. 이메일 중복 확인
+    stmt = select(
+        exists().where(func.lower(User.email) == request.email.lower())
+    )
+    email_taken = await db.scalar(stmt)
 
-        # 3. 기존 인증 코드가 있다면 삭제
-        stmt = select(EmailVerification).where(EmailVerification.email == request.email)
-        result = db.execute(stmt)
-        existing_verification = result.scalar_one_or_none()
+    if email_taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 가입된 이메일입니다.",
+        )
 
-        if existing_verification:
-            db.delete(existing_verification)
+    # 2. 인증 코드 생성 (6자리 숫자)
+    verification_code = generate_verification_code()
 
-        # 4. 새로운 인증 코드 저장
-        new_verification = EmailVerification(
+    # 3~4. 인증 코드 저장 (기존 코드가 있으면 같은 행을 갱신하는 단일 UPSERT)
+    expires_at = datetime.now() + timedelta(minutes=10)
+    stmt = (
+        insert(EmailVerification)
+        .values(
             email=request.email,
             verification_code=verification_code,
             verification_type="signup",
-            expires_at=datetime.now() + timedelta(minutes=10),
+            expires_at=expires_at,
+            is_used=False,
         )
-
-        db.add(new_verification)
-        db.commit()
-
-        # 5. 실제 이메일 발송
-        email_service = EmailService()
-        email_sent = await email_service.send_verification_email(
-            request.email, verification_code
+        .on_conflict_do_update(
+            index_elements=[EmailVerification.email],
+            index_where=EmailVerification.verification_type == "signup",
+            set_={
+                "verification_code": verification_code,
+                "expires_at": expires_at,
+                "is_used": False,
+                "created_at": func.now(),
+            },
         )
-
-        if not email_sent:
-            # 이메일 발송 실패 시 인증 코드 삭제
-            db.delete(new_verification)
-            db.commit()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="이메일 발송에 실패했습니다. 잠시 후 다시 시도해주세요.",
-            )
-
-        logger.info(f"인증 코드 발송: {request.email}")
-
-        return BaseResponse(
-            data={"message": "인증 코드가 발송되었습니다."},
-            message="인증 코드가 이메일로 발송되었습니다.",
+        .returning(EmailVerification.id)
+    )
+    verification_id = await db.scalar(stmt)
+    await db.commit()
+
+    # 5. 실제 이메일 발송 (응답 후 백그라운드에서 발송, 실패 시 인증 코드 삭제)
+    background_tasks.add_task(
+        _send_verification_email_task,
+        request.email,
+        verification_code,
+        verification_id,
+    )
+
+    logger.info("인증 코드 발송 예약: %s", request.email)
+
+    return BaseResponse(
+        data={"message": "인증 코드가 발송되었습니다."},
+        message="인증 코드가 이메일로 발송되었습니다.",
+    )
+
+
+async def _send_verification_email_task(
+    email: str, verification_code: str, verification_id: UUID
+) -> None:
+    """인증 코드 이메일 발송 백그라운드 작업 (발송 실패 시 인증 코드 삭제)"""
+    try:
+        email_sent = await get_email_service().send_verification_email(
+            email, verification_code
         )
-
-    except HTTPException:
-        raise
     except Exception as e:
-        db.rollback()
-        logger.error(f"인증 코드 발송 실패: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"인증 코드 발송 중 오류가 발생했습니다: {str(e)}",
+        logger.error("인증 코드 이메일 발송 중 예외: %s", e)
+        email_sent = False
+
+    if email_sent:
+        return
+
+    logger.warning("인증 코드 이메일 발송 실패, 인증 코드 삭제: %s", email)
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            delete(EmailVerification).where(
+                EmailVerification.id == verification_id,
+                # 그 사이 재발송으로 갱신된 코드는 유지
+                EmailVerification.verification_code == verification_code,
+            )
         )
+        await db.commit()
 
 
 @router.post("/verify-email", response_model=BaseResponse[Dict[str, str]])
 async def verify_email(
     request: EmailVerificationConfirmRequest,
-    db: Session = Depends(get_session),
+    db: AsyncSession = Depends(get_async_session),
 ) -> BaseResponse[Dict[str, str]]:
     """이메일 인증 코드 확인 API"""
-    try:
-        # 1. 인증 코드 조회
-        stmt = select(EmailVerification).where(
+    # 1~2. 인증 코드 확인 및 사용 처리 (단일 UPDATE ... RETURNING으로 원자적 처리)
+    stmt = (
+        update(EmailVerification)
+        .where(
             EmailVerification.email == request.email,
             EmailVerification.verification_code == request.verification_code,
             EmailVerification.verification_type == "signup",
             EmailVerification.expires_at > datetime.now(),
             EmailVerification.is_used.is_(False),
         )
-        result = db.execute(stmt)
-        verification = result.scalar_one_or_none()
-
-        if not verification:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="유효하지 않은 인증 코드입니다.",
-            )
+        .values(is_used=True)
+        .returning(EmailVerification.id)
+    )
+    verified_id = await db.scalar(stmt)
 
-        # 2. 인증 완료 처리
-        verification.is_used = True
-        db.commit()
+    if verified_id is None:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 인증 코드입니다.",
+        )
 
-        logger.info(f"이메일 인증 완료: {request.email}")
+    await db.commit()
 
-        return BaseResponse(
-            data={"message": "이메일 인증이 완료되었습니다."},
-            message="이메일 인증이 성공적으로 완료되었습니다.",
-        )
+    logger.info("이메일 인증 완료: %s", request.email)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"이메일 인증 실패: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="이메일 인증 중 오류가 발생했습니다.",
-        )
+    return BaseResponse(
+        data={"message": "이메일 인증이 완료되었습니다."},
+        message="이메일 인증이 성공적으로 완료되었습니다.",
+    )
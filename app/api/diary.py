@@ -2,27 +2,34 @@
 다이어리 API 라우터 (JWT 인증 기반)
 """
 
+import asyncio
+import hashlib
 import logging
-from datetime import date
+from datetime import date, datetime
 from typing import Annotated
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import (
     APIRouter,
     Depends,
     File,
+    Header,
     HTTPException,
     Path,
     Query,
+    Response,
     UploadFile,
     status,
 )
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.constants import SortOrder
+from app.constants import FileConstants, HTTPHeaders, SortOrder
 from app.core.deps import get_current_user_id
-from app.db.database import get_session
+from app.db.database import get_async_session
+from app.models.diary import DiaryEntry
 from app.models.image import Image
 from app.schemas.base import BaseResponse
 from app.schemas.diary import (
@@ -32,7 +39,7 @@ from app.schemas.diary import (
     DiaryUpdateRequest,
 )
 from app.services.diary import DiaryService
-from app.utils.error_handlers import ErrorPatterns, database_transaction_handler
+from app.utils.error_handlers import ErrorPatterns, async_database_transaction_handler
 from app.utils.minio_upload import (
     get_minio_uploader,
     upload_image_with_thumbnail_to_minio,
@@ -40,7 +47,6 @@ from app.utils.minio_upload import (
 from app.utils.validators import (
     extract_minio_object_key,
     validate_image_file,
-    validate_uuid,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,12 +54,68 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Diary"])
 
 
+# 목록 응답 직렬화용 TypeAdapter (스키마를 모듈 로드 시 한 번만 빌드)
+_DIARY_LIST_ADAPTER = TypeAdapter(list[DiaryListResponse])
+
+
+def _diary_list_response(
+    diaries: list[DiaryEntry], message: str, headers: dict[str, str] | None = None
+) -> ORJSONResponse:
+    """다이어리 목록 응답 구성 (ORM 객체를 한 번에 검증/직렬화하고 response_model 재검증 생략)"""
+    data = _DIARY_LIST_ADAPTER.dump_python(
+        _DIARY_LIST_ADAPTER.validate_python(diaries, from_attributes=True),
+        mode="json",
+    )
+    return ORJSONResponse(
+        content={
+            "success": True,
+            "data": data,
+            "message": message,
+            "timestamp": datetime.now().isoformat(),
+            "request_id": str(uuid4()),
+        },
+        headers=headers,
+    )
+
+
+def _weak_etag(*parts: object) -> str:
+    """응답 구성 요소로 약한 ETag 생성"""
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified(etag: str) -> Response:
+    """304 Not Modified 응답 (본문 없음)"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+    )
+
+
 @router.get("", response_model=BaseResponse[list[DiaryListResponse]])
 async def get_my_diaries(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
     page: Annotated[int, Query(ge=1, description="페이지 번호")] = 1,
+    cursor: Annotated[
+        str | None,
+        Query(description="다음 페이지 커서 (X-Next-Cursor 헤더 값, 지정 시 page 무시)"),
+    ] = None,
     page_size: Annotated[int, Query(ge=1, le=100, description="페이지 크기")] = 20,
     searchTerm: Annotated[str | None, Query(description="제목/내용 통합 검색")] = None,
     emotion: Annotated[str | None, Query(description="감정 필터")] = None,
@@ -68,11 +130,11 @@ async def get_my_diaries(
         description="정렬 순서 (asc: 오름차순, desc: 내림차순)",
         regex="^(asc|desc)$",
     ),
-) -> BaseResponse[list[DiaryListResponse]]:
+) -> ORJSONResponse:
     """JWT 인증된 사용자의 다이어리 목록 조회 (페이지네이션 포함)"""
 
     diary_service = DiaryService(session)
-    diaries, total_count = diary_service.get_diaries(
+    diaries, total_count, next_cursor = await diary_service.get_diaries(
         user_id=user_id,  # JWT에서 추출한 사용자 ID 사용
         page=page,
         page_size=page_size,
@@ -81,56 +143,59 @@ async def get_my_diaries(
         start_date=start_date,
         end_date=end_date,
         sort_order=sort_order,
+        cursor=cursor,
     )
 
-    # 응답 데이터 변환
-    diary_responses = [DiaryListResponse.from_orm(diary) for diary in diaries]
+    # 다음 페이지가 있으면 커서를 헤더로 전달 (응답 본문 형식은 유지)
+    headers = (
+        {HTTPHeaders.X_NEXT_CURSOR: next_cursor} if next_cursor is not None else None
+    )
 
-    return BaseResponse(
-        data=diary_responses, message=f"다이어리 목록 조회 성공 (총 {total_count}개)"
+    # 커서 조회 시에는 전체 개수(COUNT)를 생략
+    message = (
+        "다이어리 목록 조회 성공"
+        if total_count is None
+        else f"다이어리 목록 조회 성공 (총 {total_count}개)"
     )
 
+    return _diary_list_response(diaries, message, headers=headers)
+
 
 @router.get("/calendar", response_model=BaseResponse[list[DiaryListResponse]])
 async def get_calendar_diaries(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
     start_date: Annotated[date, Query(description="시작 날짜 (YYYY-MM-DD)")],
     end_date: Annotated[date, Query(description="종료 날짜 (YYYY-MM-DD)")],
-) -> BaseResponse[list[DiaryListResponse]]:
+) -> ORJSONResponse:
     """JWT 인증된 사용자의 캘린더용 다이어리 조회 (특정 날짜 범위)"""
 
     diary_service = DiaryService(session)
-    diaries = diary_service.get_diaries_by_date_range(
+    diaries = await diary_service.get_diaries_by_date_range(
         user_id=user_id,  # JWT에서 추출한 사용자 ID 사용
         start_date=start_date,
         end_date=end_date,
     )
 
-    # 응답 데이터 변환
-    diary_responses = [DiaryListResponse.model_validate(diary) for diary in diaries]
-
-    return BaseResponse(
-        data=diary_responses,
-        message=f"캘린더 다이어리 조회 성공 (총 {len(diary_responses)}개)",
+    return _diary_list_response(
+        diaries, f"캘린더 다이어리 조회 성공 (총 {len(diaries)}개)"
     )
 
 
 @router.get("/{diary_id}", response_model=BaseResponse[DiaryResponse])
 async def get_diary(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
-    diary_id: str = Path(..., description="다이어리 ID (UUID)"),
-) -> BaseResponse[DiaryResponse]:
+    diary_id: UUID = Path(..., description="다이어리 ID (UUID)"),
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> BaseResponse[DiaryResponse] | Response:
     """JWT 인증된 사용자의 특정 다이어리 조회"""
 
-    # UUID 형식 검증
-    validate_uuid(diary_id, "다이어리 ID")
-
     diary_service = DiaryService(session)
-    diary = diary_service.get_diary_by_id(diary_id=diary_id, user_id=user_id)
+    diary = await diary_service.get_diary_by_id(diary_id=diary_id, user_id=user_id)
 
     if not diary:
         raise HTTPException(
@@ -138,6 +203,14 @@ async def get_diary(
             detail="해당 다이어리를 찾을 수 없습니다.",
         )
 
+    # 이미지 추가/삭제는 updated_at을 갱신하지 않으므로 이미지 ID도 ETag에 포함
+    etag = _weak_etag(
+        diary.updated_at.isoformat(), *sorted(str(img.id) for img in diary.images)
+    )
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+
     # 응답 데이터 변환
     diary_response = DiaryResponse.from_orm(diary)
 
@@ -150,19 +223,16 @@ async def get_diary(
 @router.post("/{diary_id}/upload-image", response_model=BaseResponse[dict])
 async def upload_diary_image(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
-    diary_id: str = Path(..., description="다이어리 ID (UUID)"),
+    diary_id: UUID = Path(..., description="다이어리 ID (UUID)"),
     image: Annotated[UploadFile, File(description="업로드할 이미지 파일")],
 ) -> BaseResponse[dict]:
     """다이어리에 이미지 업로드"""
 
-    # UUID 형식 검증
-    validate_uuid(diary_id, "다이어리 ID")
-
     # 다이어리 존재 여부 및 권한 확인
     diary_service = DiaryService(session)
-    diary = diary_service.get_diary_by_id(diary_id=diary_id, user_id=user_id)
+    diary = await diary_service.get_diary_by_id(diary_id=diary_id, user_id=user_id)
 
     if not diary:
         raise HTTPException(
@@ -173,37 +243,42 @@ async def upload_diary_image(
     # 이미지 파일 검증
     validate_image_file(image.content_type, image.size)
 
-    with database_transaction_handler(
+    async with async_database_transaction_handler(
         session,
         ErrorPatterns.IMAGE_UPLOAD_FAILED,
         log_context=f"이미지 업로드 - diary_id: {diary_id}",
     ):
         # MinIO에 이미지와 썸네일 업로드
-        _, original_url, thumbnail_url = await upload_image_with_thumbnail_to_minio(
-            image
-        )
-
-        # 데이터베이스에 이미지 정보 저장
-        new_image = Image(
-            diary_id=diary_id,
-            file_path=original_url,
-            thumbnail_path=thumbnail_url,
-            mime_type=image.content_type,
-            file_size=image.size,
-            exif_removed=True,
+        # (mime_type은 클라이언트 헤더가 아닌 매직 바이트로 판별한 값)
+        (
+            _,
+            original_url,
+            thumbnail_url,
+            mime_type,
+        ) = await upload_image_with_thumbnail_to_minio(image)
+
+        # 데이터베이스에 이미지 정보 저장 (생성된 ID를 RETURNING으로 받아 refresh 생략)
+        image_id = await session.scalar(
+            insert(Image)
+            .values(
+                diary_id=diary_id,
+                file_path=original_url,
+                thumbnail_path=thumbnail_url,
+                mime_type=mime_type,
+                file_size=image.size,
+                exif_removed=True,
+            )
+            .returning(Image.id)
         )
-
-        session.add(new_image)
-        session.commit()
-        session.refresh(new_image)
+        await session.commit()
 
         return BaseResponse(
             data={
-                "id": str(new_image.id),
-                "file_path": new_image.file_path,
-                "thumbnail_path": new_image.thumbnail_path,
-                "mime_type": new_image.mime_type,
-                "file_size": new_image.file_size,
+                "id": str(image_id),
+                "file_path": original_url,
+                "thumbnail_path": thumbnail_url,
+                "mime_type": mime_type,
+                "file_size": image.size,
             },
             message="이미지 업로드 성공",
         )
@@ -212,61 +287,45 @@ async def upload_diary_image(
 @router.delete("/{diary_id}/images/{image_id}")
 async def delete_diary_image(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
-    diary_id: str = Path(..., description="다이어리 ID (UUID)"),
-    image_id: str = Path(..., description="이미지 ID (UUID)"),
+    diary_id: UUID = Path(..., description="다이어리 ID (UUID)"),
+    image_id: UUID = Path(..., description="이미지 ID (UUID)"),
 ) -> BaseResponse[dict]:
     """다이어리 이미지 삭제"""
 
-    # UUID 형식 검증
-    validate_uuid(diary_id, "다이어리 ID")
-    validate_uuid(image_id, "이미지 ID")
-
-    # 다이어리 존재 여부 및 권한 확인
-    diary_service = DiaryService(session)
-    diary = diary_service.get_diary_by_id(diary_id=diary_id, user_id=user_id)
-
-    if not diary:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="해당 다이어리를 찾을 수 없습니다.",
-        )
-
-    # 이미지 존재 여부 및 권한 확인
-    stmt = select(Image).where(Image.id == image_id, Image.diary_id == diary_id)
-    result = session.execute(stmt)
-    image = result.scalar_one_or_none()
-
-    if not image:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="해당 이미지를 찾을 수 없습니다.",
-        )
-
-    with database_transaction_handler(
+    async with async_database_transaction_handler(
         session,
         ErrorPatterns.IMAGE_DELETE_FAILED,
         log_context=f"이미지 삭제 - diary_id: {diary_id}, image_id: {image_id}",
     ):
-        # MinIO에서 실제 파일 삭제
-        uploader = get_minio_uploader()
+        # 다이어리 소유권/존재 여부 확인과 이미지 삭제를 단일 DELETE ... USING으로 처리
+        result = await session.execute(
+            delete(Image)
+            .where(
+                Image.id == image_id,
+                Image.diary_id == DiaryEntry.id,
+                DiaryEntry.id == diary_id,
+                DiaryEntry.user_id == user_id,
+                DiaryEntry.deleted_at.is_(None),
+            )
+            .returning(Image.file_path, Image.thumbnail_path)
+            .execution_options(synchronize_session=False)
+        )
+        image_paths = result.one_or_none()
 
-        # 원본 이미지 삭제
-        if image.file_path:
-            original_object_key = extract_minio_object_key(image.file_path)
-            if original_object_key:
-                uploader.delete_image(original_object_key)
+        if image_paths is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="해당 이미지를 찾을 수 없습니다.",
+            )
 
-        # 썸네일 삭제
-        if image.thumbnail_path:
-            thumbnail_object_key = extract_minio_object_key(image.thumbnail_path)
-            if thumbnail_object_key:
-                uploader.delete_image(thumbnail_object_key)
+        await session.commit()
 
-        # 데이터베이스에서 이미지 정보 삭제
-        session.delete(image)
-        session.commit()
+        # 커밋 후 MinIO에서 원본/썸네일 파일을 한 번의 요청으로 삭제
+        await get_minio_uploader().delete_images(
+            [extract_minio_object_key(path) for path in image_paths if path]
+        )
 
         return BaseResponse(
             data={"message": "이미지 삭제 성공"},
@@ -277,29 +336,42 @@ async def delete_diary_image(
 @router.get("/{diary_id}/images", response_model=BaseResponse[list[dict]])
 async def get_diary_images(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
-    diary_id: str = Path(..., description="다이어리 ID (UUID)"),
-) -> BaseResponse[list[dict]]:
+    diary_id: UUID = Path(..., description="다이어리 ID (UUID)"),
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> BaseResponse[list[dict]] | Response:
     """다이어리의 기존 이미지들 조회"""
 
-    # UUID 형식 검증
-    validate_uuid(diary_id, "다이어리 ID")
-
-    # 다이어리 존재 여부 및 권한 확인
-    diary_service = DiaryService(session)
-    diary = diary_service.get_diary_by_id(diary_id=diary_id, user_id=user_id)
+    # 다이어리 존재 여부/권한 확인과 이미지 조회를 단일 LEFT JOIN 쿼리로 처리
+    result = await session.execute(
+        select(DiaryEntry.id, Image)
+        .outerjoin(Image, Image.diary_id == DiaryEntry.id)
+        .where(
+            DiaryEntry.id == diary_id,
+            DiaryEntry.user_id == user_id,
+            DiaryEntry.deleted_at.is_(None),
+        )
+    )
+    rows = result.all()
 
-    if not diary:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 다이어리를 찾을 수 없습니다.",
         )
 
-    # 해당 다이어리의 이미지들 조회
-    stmt = select(Image).where(Image.diary_id == diary_id)
-    result = session.execute(stmt)
-    images = result.scalars().all()
+    # 이미지가 없는 다이어리는 LEFT JOIN 결과가 None
+    images = [img for _, img in rows if img is not None]
+
+    # 이미지 목록이 바뀌지 않았으면 직렬화/본문 전송 생략
+    etag = _weak_etag(
+        diary_id, *sorted(f"{img.id}:{img.created_at.isoformat()}" for img in images)
+    )
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
 
     # 이미지 정보 반환
     image_list = []
@@ -334,39 +406,57 @@ async def upload_temporary_images(
             detail="최대 10개의 이미지만 업로드할 수 있습니다.",
         )
 
-    uploaded_images = []
-
+    # 업로드 전에 모든 파일을 먼저 검증 (하나라도 실패하면 업로드하지 않음)
     for image in images:
-        try:
-            # 이미지 파일 검증
-            validate_image_file(image.content_type, image.size or 0)
-
-            # MinIO에 이미지 업로드 (썸네일 포함)
-            (
-                file_id,
-                original_url,
-                thumbnail_url,
-            ) = await upload_image_with_thumbnail_to_minio(image)
-
-            # 업로드된 이미지 정보 저장
-            image_info = {
-                "file_id": file_id,
-                "original_url": original_url,
-                "thumbnail_url": thumbnail_url,
-                "mime_type": image.content_type,
-                "file_size": image.size,
-                "filename": image.filename,
-            }
-            uploaded_images.append(image_info)
+        validate_image_file(image.content_type, image.size or 0)
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"이미지 업로드 실패: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"이미지 업로드 중 오류가 발생했습니다: {str(e)}",
-            ) from e
+    semaphore = asyncio.Semaphore(FileConstants.MAX_CONCURRENT_UPLOADS)
+
+    async def _upload(image: UploadFile) -> tuple[str, str, str, str]:
+        # MinIO에 이미지 업로드 (썸네일 포함) - 동시 업로드 수 제한
+        async with semaphore:
+            return await upload_image_with_thumbnail_to_minio(image)
+
+    results = await asyncio.gather(
+        *(_upload(image) for image in images), return_exceptions=True
+    )
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        # 일부만 업로드된 경우 이미 올라간 파일 정리
+        await get_minio_uploader().delete_images(
+            [
+                extract_minio_object_key(url)
+                for result in results
+                if not isinstance(result, BaseException)
+                for url in result[1:3]
+                if url
+            ]
+        )
+
+        error = failures[0]
+        if isinstance(error, HTTPException):
+            raise error
+        logger.error(f"이미지 업로드 실패: {error}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"이미지 업로드 중 오류가 발생했습니다: {str(error)}",
+        ) from error
+
+    # 업로드된 이미지 정보 저장 (요청 순서 유지)
+    uploaded_images = [
+        {
+            "file_id": file_id,
+            "original_url": original_url,
+            "thumbnail_url": thumbnail_url,
+            "mime_type": mime_type,
+            "file_size": image.size,
+            "filename": image.filename,
+        }
+        for image, (file_id, original_url, thumbnail_url, mime_type) in zip(
+            images, results
+        )
+    ]
 
     return BaseResponse(
         data=uploaded_images,
@@ -377,7 +467,7 @@ async def upload_temporary_images(
 @router.post("", response_model=BaseResponse[DiaryResponse])
 async def create_diary(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
     diary_create: DiaryCreateRequest,
 ) -> BaseResponse[DiaryResponse]:
@@ -386,7 +476,7 @@ async def create_diary(
     diary_service = DiaryService(session)
 
     # diary_id 변수 제거하고 diary_create와 user_id만 전달
-    created_diary = diary_service.create_diary(diary_create, user_id)
+    created_diary = await diary_service.create_diary(diary_create, user_id)
 
     return BaseResponse(
         data=DiaryResponse.model_validate(created_diary), message="다이어리 생성 성공"
@@ -396,30 +486,23 @@ async def create_diary(
 @router.put("/{diary_id}", response_model=BaseResponse[DiaryResponse])
 async def update_diary(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
-    diary_id: str = Path(..., description="다이어리 ID (UUID)"),
+    diary_id: UUID = Path(..., description="다이어리 ID (UUID)"),
     diary_update: DiaryUpdateRequest,
 ) -> BaseResponse[DiaryResponse]:
     """JWT 인증된 사용자의 다이어리 수정"""
 
-    # UUID 형식 검증
-    validate_uuid(diary_id, "다이어리 ID")
-
     diary_service = DiaryService(session)
 
-    # 다이어리 존재 여부 및 권한을 한 번에 확인 (보안 강화)
-    existing_diary = diary_service.get_diary_by_id(diary_id, user_id)
-    if not existing_diary:
+    # 다이어리 존재 여부/권한 확인과 수정을 단일 UPDATE로 처리 (보안 강화)
+    updated_diary = await diary_service.update_diary(diary_id, user_id, diary_update)
+    if not updated_diary:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="다이어리를 찾을 수 없거나 접근 권한이 없습니다",
         )
 
-    # 권한 검증은 이미 get_diary_by_id에서 완료됨
-
-    updated_diary = diary_service.update_diary(diary_id, diary_update)
-
     return BaseResponse(
         data=DiaryResponse.from_orm(updated_diary), message="다이어리 수정 성공"
     )
@@ -428,19 +511,16 @@ async def update_diary(
 @router.delete("/{diary_id}", response_model=BaseResponse[dict])
 async def delete_diary(
     *,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     user_id: Annotated[UUID, Depends(get_current_user_id)],
-    diary_id: str = Path(..., description="다이어리 ID (UUID)"),
+    diary_id: UUID = Path(..., description="다이어리 ID (UUID)"),
 ) -> BaseResponse[dict]:
     """JWT 인증된 사용자의 다이어리 삭제 (Soft Delete)"""
 
-    # UUID 형식 검증
-    validate_uuid(diary_id, "다이어리 ID")
-
     diary_service = DiaryService(session)
 
     # 다이어리 삭제 시도
-    success = diary_service.delete_diary(diary_id=diary_id, user_id=user_id)
+    success = await diary_service.delete_diary(diary_id=diary_id, user_id=user_id)
 
     if not success:
         raise HTTPException(
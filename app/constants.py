@@ -83,6 +83,8 @@ class FileConstants:
     # 파일 크기 제한 (15MB로 통일)
     MAX_FILE_SIZE = 15 * 1024 * 1024  # 15MB (bytes)
     MAX_FILE_SIZE_MB = 15  # MB 단위
+    UPLOAD_READ_CHUNK_SIZE = 1024 * 1024  # 업로드 파일 청크 읽기 단위 (1MB)
+    MAX_CONCURRENT_UPLOADS = 5  # 다중 이미지 업로드 시 동시 업로드 수
 
     # 이미지 관련
     ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
@@ -139,6 +141,9 @@ class HTTPHeaders:
     # 인증 헤더
     WWW_AUTHENTICATE = "WWW-Authenticate"
 
+    # 페이지네이션 헤더 (키셋 페이지네이션 다음 커서)
+    X_NEXT_CURSOR = "X-Next-Cursor"
+
 
 # 시간 관련 상수
 class TimeConstants:
@@ -26,9 +26,21 @@ class Settings(BaseSettings):
     database_echo: bool = os.getenv("DATABASE_ECHO", "false").lower() == "true"
     database_pool_size: int = int(os.getenv("DATABASE_POOL_SIZE", "10"))
     database_max_overflow: int = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+    # 비동기(asyncpg) 엔진 전용 풀 크기 (동기 엔진과 별도로 연결을 점유하므로 따로 설정)
+    database_async_pool_size: int = int(os.getenv("DATABASE_ASYNC_POOL_SIZE", "5"))
+    database_async_max_overflow: int = int(
+        os.getenv("DATABASE_ASYNC_MAX_OVERFLOW", "5")
+    )
     database_pool_timeout: int = int(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
     database_pool_recycle: int = int(os.getenv("DATABASE_POOL_RECYCLE", "3600"))
+    database_pool_use_lifo: bool = (
+        os.getenv("DATABASE_POOL_USE_LIFO", "true").lower() == "true"
+    )
     database_ssl_mode: str = os.getenv("DATABASE_SSL_MODE", "prefer")
+    # PgBouncer(transaction pooling) 경유 시 서버측 prepared statement 비활성화
+    database_pgbouncer: bool = (
+        os.getenv("DATABASE_PGBOUNCER", "false").lower() == "true"
+    )
 
     # 보안 설정 (환경변수에서 필수로 가져오기)
     secret_key: str = os.getenv("SECRET_KEY", "")
@@ -50,6 +62,9 @@ class Settings(BaseSettings):
     minio_secure: bool = os.getenv("MINIO_SECURE", "false").lower() == "true"
     minio_bucket_name: str = os.getenv("MINIO_BUCKET_NAME", "saegim")
 
+    # 썸네일 생성 프로세스 풀 크기 (uvicorn 워커마다 생성되므로 작게 유지)
+    thumbnail_process_workers: int = int(os.getenv("THUMBNAIL_PROCESS_WORKERS", "2"))
+
     # CORS 설정 (환경변수에서 쉼표로 구분된 문자열을 리스트로 변환)
     allowed_hosts: Any = os.getenv(
         "ALLOWED_HOSTS",
@@ -75,6 +90,9 @@ class Settings(BaseSettings):
     google_userinfo_uri: str = os.getenv(
         "GOOGLE_USERINFO_URI", "https://www.googleapis.com/oauth2/v2/userinfo"
     )
+    google_revoke_uri: str = os.getenv(
+        "GOOGLE_REVOKE_URI", "https://oauth2.googleapis.com/revoke"
+    )
 
     # 프론트엔드 URL 설정
     frontend_url: str = os.getenv(
@@ -8,13 +8,16 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.core.security import decode_access_token, get_current_user_id_from_cookie
+from app.core.security import (
+    decode_access_token_cached,
+    get_current_user_id_from_cookie,
+)
 from app.constants import AuthConstants, ResponseMessages
-from app.db.database import get_session
+from app.db.database import get_async_session, get_session
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -92,7 +95,7 @@ async def _extract_user_id(request: Request) -> UUID | None:
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith(AuthConstants.BEARER_PREFIX):
         token = auth_header.split(" ")[1]
-        payload = decode_access_token(token)
+        payload = decode_access_token_cached(token)
         user_id = payload.get("sub")
         logger.debug("Bearer 토큰에서 user_id 추출 성공")
         return UUID(user_id)
@@ -104,9 +107,21 @@ async def _validate_user(user_id: UUID, db: Session) -> User:
     """사용자 존재 여부 및 활성 상태 확인"""
     logger.debug("사용자 검증 시작")
 
-    stmt = select(User).where(User.id == user_id, User.deleted_at.is_(None))
-    result = db.execute(stmt)
-    user = result.scalar_one_or_none()
+    # identity map 우선 조회 (이미 로드된 경우 SELECT 생략)
+    return _ensure_active_user(user_id, db.get(User, user_id))
+
+
+async def _validate_user_async(user_id: UUID, db: AsyncSession) -> User:
+    """사용자 존재 여부 및 활성 상태 확인 (비동기 세션)"""
+    logger.debug("사용자 검증 시작")
+
+    return _ensure_active_user(user_id, await db.get(User, user_id))
+
+
+def _ensure_active_user(user_id: UUID, user: User | None) -> User:
+    """조회된 사용자의 탈퇴/비활성 여부 검사"""
+    if user is not None and user.deleted_at is not None:
+        user = None
 
     logger.info(f"데이터베이스 조회 결과: {'사용자 존재' if user else '사용자 없음'}")
 
@@ -127,33 +142,58 @@ async def _validate_user(user_id: UUID, db: Session) -> User:
 
 
 async def get_current_user(
-    request: Request, db: Session = Depends(get_session)
+    user_id: UUID = Depends(get_current_user_id), db: Session = Depends(get_session)
 ) -> User:
     """
     쿠키 또는 Bearer 토큰을 통해 현재 로그인한 사용자 조회
     (소셜 로그인: 쿠키, 이메일 로그인: Bearer 토큰)
 
+    토큰 해석은 get_current_user_id 의존성에 위임하여, 같은 요청에서
+    get_current_user_id를 함께 사용해도 FastAPI 의존성 캐시로 한 번만 실행
+
     Args:
-        request: FastAPI Request 객체
+        user_id: 토큰에서 추출한 사용자 ID
         db: 데이터베이스 세션
 
     Returns:
         현재 로그인한 사용자
 
     Raises:
-        HTTPException: 토큰이 유효하지 않은 경우
+        HTTPException: 사용자가 없거나 비활성화된 경우
     """
     try:
-        user_id = await _extract_user_id(request)
+        user = await _validate_user(user_id, db)
+        logger.info(f"인증 성공: {user_id}")
+        return user
 
-        if user_id is None:
-            logger.error("인증 토큰을 찾을 수 없음")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail=ResponseMessages.TOKEN_REQUIRED,
-            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"인증 중 예외 발생: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=ResponseMessages.AUTH_FAILED
+        )
 
-        user = await _validate_user(user_id, db)
+
+async def get_current_user_async(
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_session),
+) -> User:
+    """
+    현재 로그인한 사용자 조회 (AsyncSession 사용 엔드포인트용)
+
+    Args:
+        user_id: 토큰에서 추출한 사용자 ID
+        db: 비동기 데이터베이스 세션
+
+    Returns:
+        현재 로그인한 사용자 (같은 요청의 AsyncSession에 연결됨)
+
+    Raises:
+        HTTPException: 사용자가 없거나 비활성화된 경우
+    """
+    try:
+        user = await _validate_user_async(user_id, db)
         logger.info(f"인증 성공: {user_id}")
         return user
 
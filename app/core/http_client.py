@@ -25,6 +25,29 @@ class HttpClient:
             timeout: 요청 타임아웃 (초)
         """
         self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        공유 AsyncClient (최초 사용 시 생성)
+
+        요청마다 클라이언트를 새로 만들지 않고 커넥션 풀/TLS 세션을 재사용
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, max_connections=100
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """공유 AsyncClient 종료 (애플리케이션 종료 시 호출)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
 
     async def post_json(
         self,
@@ -48,21 +71,20 @@ class HttpClient:
             HTTPException: 요청 실패 시
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, data=data, headers=headers)
-
-                if response.status_code != expected_status:
-                    error_detail = self._extract_error_detail(response)
-                    logger.error(
-                        f"POST request failed. URL: {url}, "
-                        f"Status: {response.status_code}, Details: {error_detail}"
-                    )
-                    raise ErrorFactory.bad_request(
-                        f"HTTP 요청이 실패했습니다: {error_detail}",
-                        {"url": url, "status_code": response.status_code},
-                    )
-
-                return response.json()
+            response = await self.client.post(url, data=data, headers=headers)
+
+            if response.status_code != expected_status:
+                error_detail = self._extract_error_detail(response)
+                logger.error(
+                    f"POST request failed. URL: {url}, "
+                    f"Status: {response.status_code}, Details: {error_detail}"
+                )
+                raise ErrorFactory.bad_request(
+                    f"HTTP 요청이 실패했습니다: {error_detail}",
+                    {"url": url, "status_code": response.status_code},
+                )
+
+            return response.json()
 
         except httpx.TimeoutException:
             logger.error(f"Request timeout for URL: {url}")
@@ -91,21 +113,20 @@ class HttpClient:
             HTTPException: 요청 실패 시
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
-
-                if response.status_code != expected_status:
-                    error_detail = self._extract_error_detail(response)
-                    logger.error(
-                        f"GET request failed. URL: {url}, "
-                        f"Status: {response.status_code}, Details: {error_detail}"
-                    )
-                    raise ErrorFactory.bad_request(
-                        f"HTTP 요청이 실패했습니다: {error_detail}",
-                        {"url": url, "status_code": response.status_code},
-                    )
-
-                return response.json()
+            response = await self.client.get(url, headers=headers)
+
+            if response.status_code != expected_status:
+                error_detail = self._extract_error_detail(response)
+                logger.error(
+                    f"GET request failed. URL: {url}, "
+                    f"Status: {response.status_code}, Details: {error_detail}"
+                )
+                raise ErrorFactory.bad_request(
+                    f"HTTP 요청이 실패했습니다: {error_detail}",
+                    {"url": url, "status_code": response.status_code},
+                )
+
+            return response.json()
 
         except httpx.TimeoutException:
             logger.error(f"Request timeout for URL: {url}")
@@ -3,12 +3,19 @@
 FastAPI lifespan context manager
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
-from app.db.database import create_db_and_tables
+from app.core.http_client import http_client
+from app.db.database import async_engine, create_db_and_tables
+from app.services.cleanup_service import run_email_verification_cleanup
+from app.utils.minio_upload import (
+    shutdown_thumbnail_executor,
+    start_thumbnail_executor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +27,8 @@ async def lifespan(app: FastAPI):
 
     시작 시:
     - 데이터베이스 테이블 생성
+    - 썸네일 생성 프로세스 풀 시작
+    - 만료 인증 코드 정리 태스크 시작
     - 필요한 초기화 작업 수행
 
     종료 시:
@@ -36,6 +45,12 @@ async def lifespan(app: FastAPI):
         logger.warning(f"⚠️ 데이터베이스 연결 실패: {e}")
         logger.info("데이터베이스 없이 서버를 시작합니다.")
 
+    # 썸네일 생성 프로세스 풀 시작 (요청 처리 스레드가 생기기 전에 생성)
+    start_thumbnail_executor()
+
+    # 만료된 이메일 인증 코드 주기적 정리
+    verification_cleanup_task = asyncio.create_task(run_email_verification_cleanup())
+
     # 기타 초기화 작업 (필요 시 추가)
     # - Redis 연결 확인
     # - 외부 API 연결 테스트
@@ -48,6 +63,20 @@ async def lifespan(app: FastAPI):
     # === 종료 이벤트 ===
     logger.info("🛑 애플리케이션 종료 중...")
 
+    # 백그라운드 정리 태스크 중지
+    verification_cleanup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await verification_cleanup_task
+
+    # 공유 HTTP 클라이언트 종료
+    await http_client.aclose()
+
+    # 비동기 DB 엔진 커넥션 풀 정리
+    await async_engine.dispose()
+
+    # 썸네일 생성 프로세스 풀 종료
+    shutdown_thumbnail_executor()
+
     # 정리 작업 수행
     # - 데이터베이스 연결 종료
     # - Redis 연결 종료
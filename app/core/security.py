@@ -3,9 +3,12 @@
 JWT 토큰 생성/검증, 의존성 주입
 """
 
+import hashlib
+import threading
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
 import jwt
@@ -16,9 +19,23 @@ from app.constants import AuthConstants, ResponseMessages
 from app.core.config import get_settings
 from app.utils import data_encryptor, password_hasher
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
 settings = get_settings()
 security = HTTPBearer()
 
+# 디코딩된 토큰 페이로드 캐시 설정 (서명 검증 반복 회피)
+ACCESS_TOKEN_CACHE_TTL_SECONDS = 5
+REFRESH_TOKEN_CACHE_TTL_SECONDS = 300
+DECODED_TOKEN_CACHE_MAX_SIZE = 10_000
+
+# JWT 디코더 및 검증 파라미터 (요청마다 재구성하지 않도록 import 시 한 번만 생성)
+_jwt_decoder = jwt.PyJWT()
+_JWT_KEY = settings.secret_key
+_JWT_ALGORITHMS = [settings.jwt_algorithm]
+_JWT_DECODE_OPTIONS = {"require": ["sub", "exp"]}
+
 
 class JWTHandler:
     """JWT 토큰 처리 클래스"""
@@ -110,10 +127,7 @@ class JWTHandler:
             HTTPException: 토큰 검증 실패 시
         """
         try:
-            payload = jwt.decode(
-                token, settings.secret_key, algorithms=[settings.jwt_algorithm]
-            )
-            return payload
+            return decode_jwt(token)
 
         except jwt.ExpiredSignatureError as e:
             raise HTTPException(
@@ -123,7 +137,7 @@ class JWTHandler:
                     AuthConstants.HEADER_WWW_AUTHENTICATE: AuthConstants.TOKEN_TYPE_BEARER
                 },
             ) from e
-        except jwt.JWTError as e:
+        except jwt.InvalidTokenError as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=ResponseMessages.INVALID_TOKEN,
@@ -147,6 +161,57 @@ class JWTHandler:
         return payload.get("type") == expected_type
 
 
+class DecodedTokenCache:
+    """
+    디코딩된 JWT 페이로드 TTL 캐시
+
+    - 원본 토큰 대신 blake2b 다이제스트를 키로 저장
+    - 항목 만료 시각은 min(저장 시각 + TTL, 토큰 exp)
+    - 검증에 성공한 페이로드만 저장 (실패는 캐시하지 않음)
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = DECODED_TOKEN_CACHE_MAX_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: dict[bytes, tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """캐시된 페이로드 조회 (만료 시 None)"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return payload
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        """페이로드 저장"""
+        now = time.time()
+        expires_at = min(now + self.ttl_seconds, payload.get("exp", now))
+        if expires_at <= now:
+            return
+
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                # 만료된 항목 정리 후에도 가득 차 있으면 전체 비움
+                for key in [
+                    key for key, (exp, _) in self._entries.items() if exp <= now
+                ]:
+                    del self._entries[key]
+                if len(self._entries) >= self.max_size:
+                    self._entries.clear()
+            self._entries[self._key(token)] = (expires_at, payload)
+
+
 class SecurityService:
     """보안 서비스 통합 클래스"""
 
@@ -242,6 +307,10 @@ class SecurityService:
 # 전역 보안 서비스 인스턴스
 security_service = SecurityService()
 
+# 전역 토큰 디코딩 캐시
+_access_token_cache = DecodedTokenCache(ACCESS_TOKEN_CACHE_TTL_SECONDS)
+_refresh_token_cache = DecodedTokenCache(REFRESH_TOKEN_CACHE_TTL_SECONDS)
+
 
 def get_current_user_id(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -308,7 +377,7 @@ def get_current_user_id_from_cookie(
         )
 
     try:
-        payload = decode_access_token(access_token)
+        payload = decode_access_token_cached(access_token)
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(
@@ -325,6 +394,37 @@ def get_current_user_id_from_cookie(
         ) from e
 
 
+def decode_jwt(token: str) -> dict[str, Any]:
+    """
+    JWT 서명/만료 검증 후 페이로드 반환 (모듈 단위 디코더 재사용)
+
+    Raises:
+        jwt.InvalidTokenError: 토큰 검증 실패 시 (sub/exp 클레임 누락 포함)
+    """
+    return _jwt_decoder.decode(
+        token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS
+    )
+
+
+def access_token_claims(user: "User") -> dict[str, Any]:
+    """
+    액세스 토큰 클레임 생성 (이메일 로그인/OAuth 로그인 공통)
+
+    로그아웃 시 DB 조회 없이 계정 유형을 판별할 수 있도록 계정 유형/제공자 포함
+
+    Args:
+        user: 토큰을 발급할 사용자
+
+    Returns:
+        액세스 토큰 클레임
+    """
+    return {
+        "sub": str(user.id),
+        "acct": user.account_type,
+        "prov": user.provider,
+    }
+
+
 def create_access_token(data: dict[str, Any]) -> str:
     """
     액세스 토큰 생성 (전역 함수)
@@ -364,6 +464,26 @@ def decode_access_token(token: str) -> dict[str, Any]:
     return security_service.jwt_handler.decode_token(token)
 
 
+def decode_access_token_cached(token: str) -> dict[str, Any]:
+    """
+    액세스 토큰 디코딩 (짧은 TTL 캐시 사용)
+
+    같은 토큰이 짧은 시간 안에 반복 사용될 때 서명 검증과 파싱을 생략.
+    캐시 항목은 토큰 만료(exp) 이후로 유지되지 않음
+
+    Args:
+        token: JWT 토큰
+
+    Returns:
+        토큰 페이로드
+    """
+    payload = _access_token_cache.get(token)
+    if payload is None:
+        payload = decode_access_token(token)
+        _access_token_cache.set(token, payload)
+    return payload
+
+
 def decode_refresh_token(token: str) -> dict[str, Any]:
     """
     리프레시 토큰 디코딩 (전역 함수)
@@ -375,3 +495,20 @@ def decode_refresh_token(token: str) -> dict[str, Any]:
         토큰 페이로드
     """
     return security_service.jwt_handler.decode_token(token)
+
+
+def decode_refresh_token_cached(token: str) -> dict[str, Any]:
+    """
+    리프레시 토큰 디코딩 (TTL 캐시 사용)
+
+    Args:
+        token: JWT 리프레시 토큰
+
+    Returns:
+        토큰 페이로드
+    """
+    payload = _refresh_token_cache.get(token)
+    if payload is None:
+        payload = decode_refresh_token(token)
+        _refresh_token_cache.set(token, payload)
+    return payload
@@ -0,0 +1,87 @@
+"""
+사용자 조회 결과 인메모리 캐시
+/me 응답, 이메일/닉네임 사용 가능 여부, 사용자별 다이어리 개수의 짧은 TTL 캐시
+"""
+
+import threading
+import time
+from typing import Any, Hashable
+from uuid import UUID
+
+# /me 응답 캐시 TTL (프로필 변경/탈퇴 시 즉시 무효화)
+# 무효화는 해당 워커에만 적용되므로, 다른 워커에서 탈퇴/비활성 계정이 보이는 시간이
+# 액세스 토큰 디코딩 캐시 TTL(5초)을 넘지 않도록 동일하게 유지
+USER_INFO_CACHE_TTL_SECONDS = 5
+# 사용 가능(미사용) 판정 캐시 TTL (타이핑 중 연속 요청 흡수용)
+AVAILABILITY_CACHE_TTL_SECONDS = 5
+# 사용자별 다이어리 개수 캐시 TTL (생성/삭제 시 즉시 무효화)
+DIARY_COUNT_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_SIZE = 10_000
+
+
+class TTLCache:
+    """
+    스레드 안전 TTL 캐시
+
+    - 항목별 만료 시각(monotonic) 저장
+    - 가득 차면 만료 항목 정리 후에도 남는 경우 전체 비움
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int = USER_CACHE_MAX_SIZE):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """캐시 값 조회 (없거나 만료 시 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 값 저장"""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                for stale in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+                    del self._entries[stale]
+                if len(self._entries) >= self.max_size:
+                    self._entries.clear()
+            self._entries[key] = (now + self.ttl_seconds, value)
+
+    def delete(self, key: Hashable) -> None:
+        """캐시 값 삭제"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+user_info_cache = TTLCache(USER_INFO_CACHE_TTL_SECONDS)
+availability_cache = TTLCache(AVAILABILITY_CACHE_TTL_SECONDS)
+diary_count_cache = TTLCache(DIARY_COUNT_CACHE_TTL_SECONDS)
+
+
+def invalidate_user_info(user_id: UUID | str) -> None:
+    """사용자 정보 변경 시 /me 캐시 무효화"""
+    user_info_cache.delete(str(user_id))
+
+
+def invalidate_availability(
+    email: str | None = None, nickname: str | None = None
+) -> None:
+    """이메일/닉네임 점유 시 사용 가능 캐시 무효화"""
+    if email is not None:
+        availability_cache.delete(("email", email.lower()))
+    if nickname is not None:
+        availability_cache.delete(("nickname", nickname))
+
+
+def invalidate_diary_count(user_id: UUID | str) -> None:
+    """다이어리 생성/삭제 시 사용자별 다이어리 개수 캐시 무효화"""
+    diary_count_cache.delete(str(user_id))
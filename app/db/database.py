@@ -1,18 +1,33 @@
 """
 데이터베이스 연결 설정
 """
-from collections.abc import Generator
+import logging
+import re
+from collections.abc import AsyncGenerator, Generator
 from contextlib import contextmanager
+from typing import Any
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import QueuePool
 
 from app.core.config import get_settings
 from app.models.base import Base
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
+# libpq options 문자열의 "-c 이름=값" / "--이름=값" 항목
+_LIBPQ_OPTION_PATTERN = re.compile(r"(?:-c\s*|--)([\w.]+)=(\S+)")
+
+# asyncpg connect_args로 변환(또는 설정값으로 대체)되는 URL 쿼리 파라미터
+_ASYNCPG_TRANSLATED_PARAMS = frozenset(
+    {"sslmode", "connect_timeout", "application_name", "options"}
+)
+
 # PostgreSQL 엔진 생성
 engine = create_engine(
     settings.database_url,
@@ -21,6 +36,8 @@ engine = create_engine(
     max_overflow=settings.database_max_overflow,
     pool_timeout=settings.database_pool_timeout,
     pool_recycle=settings.database_pool_recycle,
+    # LIFO: 최근 사용한 연결을 우선 재사용하여 유휴 연결이 자연스럽게 정리되도록 함
+    pool_use_lifo=settings.database_pool_use_lifo,
     pool_pre_ping=True,
     echo=settings.database_echo,
     connect_args={
@@ -30,6 +47,70 @@ engine = create_engine(
 )
 
 
+def _async_database_url(url: str) -> tuple[str, dict[str, Any]]:
+    """
+    동기 드라이버 URL을 asyncpg 드라이버 URL과 connect_args로 변환
+
+    asyncpg는 libpq 전용 쿼리 파라미터(sslmode, connect_timeout, options 등)를
+    받지 않으므로 쿼리스트링을 제거하고 지원하는 항목만 connect_args로 옮김
+    """
+    sync_url = make_url(url)
+    query = {
+        key: value if isinstance(value, str) else value[-1]
+        for key, value in sync_url.query.items()
+    }
+
+    # sslmode/connect_timeout은 동기 엔진과 동일하게 설정값을 사용
+    connect_args: dict[str, Any] = {
+        "ssl": settings.database_ssl_mode,
+        "timeout": 10,
+    }
+
+    # application_name, options의 "-c 이름=값"은 asyncpg server_settings로 전달
+    server_settings: dict[str, str] = {}
+    if "application_name" in query:
+        server_settings["application_name"] = query["application_name"]
+    if "options" in query:
+        server_settings.update(_LIBPQ_OPTION_PATTERN.findall(query["options"]))
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+
+    ignored_params = set(query) - _ASYNCPG_TRANSLATED_PARAMS
+    if ignored_params:
+        logger.warning(
+            "asyncpg에서 지원하지 않는 DATABASE_URL 파라미터 무시: %s",
+            ", ".join(sorted(ignored_params)),
+        )
+
+    async_query: dict[str, str] = {}
+    if settings.database_pgbouncer:
+        # PgBouncer transaction 모드에서는 연결 간 prepared statement 공유 불가
+        async_query["prepared_statement_cache_size"] = "0"
+        connect_args["statement_cache_size"] = 0
+
+    async_url = sync_url.set(drivername="postgresql+asyncpg", query=async_query)
+    return async_url.render_as_string(hide_password=False), connect_args
+
+
+_async_url, _async_connect_args = _async_database_url(settings.database_url)
+
+# PostgreSQL 비동기 엔진 생성 (asyncpg, 동기 엔진과 별도의 풀 크기 사용)
+async_engine = create_async_engine(
+    _async_url,
+    pool_size=settings.database_async_pool_size,
+    max_overflow=settings.database_async_max_overflow,
+    pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
+    pool_use_lifo=settings.database_pool_use_lifo,
+    pool_pre_ping=True,
+    echo=settings.database_echo,
+    connect_args=_async_connect_args,
+)
+
+# 비동기 세션 팩토리 (커밋 후 속성 만료 시 암묵적 지연 로딩이 불가하므로 expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+
 # 세션 팩토리 생성
 def SessionLocal():
     """SQLAlchemy Session 팩토리"""
@@ -53,6 +134,16 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """비동기 데이터베이스 세션 의존성"""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+
+
 @contextmanager
 def get_session_context():
     """컨텍스트 매니저로 사용할 수 있는 세션 팩토리"""
@@ -13,7 +13,8 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api import router as api_router
 from app.constants import HTTPHeaders
@@ -42,6 +43,8 @@ app = FastAPI(
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
     lifespan=lifespan,
+    # orjson 기반 기본 응답 클래스 (표준 json 대비 직렬화 비용 절감)
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -91,7 +94,59 @@ def custom_openapi():
 # 커스텀 OpenAPI 스키마 적용
 app.openapi = custom_openapi
 
+def _internal_error_response(request: Request, exc: Exception) -> JSONResponse:
+    """처리되지 않은 예외를 로깅하고 공통 500 응답 생성"""
+    logger.exception(
+        "Unhandled exception on %s %s: %s", request.method, request.url.path, exc
+    )
+    return JSONResponse(
+        status_code=500,
+        content={
+            "detail": "내부 서버 오류가 발생했습니다.",
+            "timestamp": datetime.now().isoformat(),
+        },
+    )
+
+
+class UnhandledExceptionMiddleware:
+    """
+    처리되지 않은 예외를 CORS 미들웨어 안쪽에서 500 응답으로 변환
+
+    Exception 핸들러는 가장 바깥의 ServerErrorMiddleware에서 실행되어
+    CORS 헤더가 붙지 않으므로, 다른 origin의 브라우저도 JSON 에러 본문을 받을 수 있도록
+    CORSMiddleware보다 먼저(안쪽에) 등록
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            # 응답 전송이 이미 시작된 경우에는 상태 코드를 바꿀 수 없으므로 그대로 전파
+            if response_started:
+                raise
+            response = _internal_error_response(Request(scope), exc)
+            await response(scope, receive, send)
+
+
 # 미들웨어 설정
+# 처리되지 않은 예외 → 500 변환 (CORS 헤더가 붙도록 CORSMiddleware보다 안쪽에 등록)
+app.add_middleware(UnhandledExceptionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"]
@@ -108,6 +163,7 @@ app.add_middleware(
         HTTPHeaders.ACCESS_CONTROL_REQUEST_METHOD,
         HTTPHeaders.ACCESS_CONTROL_REQUEST_HEADERS,
     ],  # 보안 강화: 구체적 헤더만 허용
+    expose_headers=[HTTPHeaders.X_NEXT_CURSOR],  # 다이어리 목록 다음 페이지 커서
 )
 
 # 프로덕션 환경에서만 적용되는 미들웨어
@@ -119,17 +175,11 @@ if settings.is_production:
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
-# 전역 예외 핸들러
+# 전역 예외 핸들러 (미들웨어 바깥에서 발생한 예외용 최후 처리)
+# DB 롤백은 get_session/get_async_session 의존성에서 처리
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Global exception handler caught: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "detail": "내부 서버 오류가 발생했습니다.",
-            "timestamp": datetime.now().isoformat(),
-        },
-    )
+    return _internal_error_response(request, exc)
 
 
 def _get_uptime() -> int:
@@ -66,8 +66,9 @@ class DiaryEntry(Base):
 
     # 관계 설정
     user: Mapped[User] = relationship("User", back_populates="diaries")
+    # 지연 로딩(N+1) 방지: 조회 시 selectinload로 명시적으로 함께 로드해야 함
     images: Mapped[list[Image]] = relationship(
-        "Image", back_populates="diary", cascade="all, delete-orphan"
+        "Image", back_populates="diary", cascade="all, delete-orphan", lazy="raise"
     )
 
     # 감정 값 제약 조건 추가
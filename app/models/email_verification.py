@@ -21,6 +21,21 @@ class EmailVerification(Base):
         Index(
             "idx_expires", "expires_at", postgresql_where=text("expires_at IS NOT NULL")
         ),
+        # 미사용 인증 코드 조회용 부분 인덱스 (email, verification_type, expires_at 필터)
+        Index(
+            "ix_ev_lookup",
+            "email",
+            "verification_type",
+            text("expires_at DESC"),
+            postgresql_where=text("is_used = false"),
+        ),
+        # 회원가입 인증 코드는 이메일당 1건 (INSERT ... ON CONFLICT 대상)
+        Index(
+            "uq_ev_signup_email",
+            "email",
+            unique=True,
+            postgresql_where=text("verification_type = 'signup'"),
+        ),
         CheckConstraint("char_length(verification_code) = 6", name="ck_verif_code_len"),
         CheckConstraint(
             "verification_type IN ('signup','change','restore')",
@@ -41,6 +41,8 @@ class User(Base):
             "(provider IS NULL OR provider IN ('google','kakao','naver'))",
             name="ck_users_provider",
         ),
+        # 대소문자 무시 이메일 조회용 함수 인덱스
+        Index("ix_users_email_lower", text("lower(email)"), unique=True),
         Index("idx_users_provider", "provider", "provider_id"),
         Index("idx_account_type", "account_type"),
         # partial index: WHERE deleted_at IS NULL
@@ -2,12 +2,14 @@
 데이터 정리 서비스 (영구 삭제 스케줄러)
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
+from app.db.database import AsyncSessionLocal
 from app.models.ai_usage_log import AIUsageLog
 from app.models.diary import DiaryEntry
 from app.models.email_verification import EmailVerification
@@ -19,6 +21,10 @@ from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
+# 만료된 이메일 인증 코드 정리 주기 및 보존 기간
+EMAIL_VERIFICATION_CLEANUP_INTERVAL_SECONDS = 60 * 60
+EMAIL_VERIFICATION_RETENTION = timedelta(days=1)
+
 
 class CleanupService:
     """데이터 정리 서비스"""
@@ -199,3 +205,33 @@ class CleanupService:
         except Exception as e:
             logger.error(f"통계 조회 중 오류 발생: {e}")
             raise
+
+
+async def purge_expired_email_verifications() -> int:
+    """
+    만료 후 보존 기간이 지난 이메일 인증 코드 일괄 삭제
+
+    Returns:
+        삭제된 인증 코드 수
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            delete(EmailVerification).where(
+                EmailVerification.expires_at
+                < func.now() - EMAIL_VERIFICATION_RETENTION
+            )
+        )
+        await session.commit()
+    return result.rowcount
+
+
+async def run_email_verification_cleanup() -> None:
+    """만료된 이메일 인증 코드 주기적 정리 루프 (lifespan 백그라운드 태스크)"""
+    while True:
+        await asyncio.sleep(EMAIL_VERIFICATION_CLEANUP_INTERVAL_SECONDS)
+        try:
+            deleted = await purge_expired_email_verifications()
+            if deleted:
+                logger.info("만료된 이메일 인증 코드 %s건 삭제", deleted)
+        except Exception as e:
+            logger.error("이메일 인증 코드 정리 실패: %s", e)
@@ -2,31 +2,82 @@
 다이어리 비즈니스 로직 서비스 (캘린더용)
 """
 
+import base64
+import binascii
+import json
 import logging
 from datetime import UTC, date, datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
 from app.constants import SortOrder
+from app.core.user_cache import diary_count_cache, invalidate_diary_count
 from app.models.diary import DiaryEntry
+from app.models.image import Image
 from app.schemas.diary import DiaryCreateRequest, DiaryUpdateRequest
 from app.services.base import BaseService
-from app.utils.error_handlers import ErrorPatterns, database_transaction_handler
+from app.utils.error_handlers import (
+    ErrorPatterns,
+    async_database_transaction_handler,
+)
+from app.utils.minio_upload import get_minio_uploader
 from app.utils.validators import extract_minio_object_key
 
 logger = logging.getLogger(__name__)
 
+# 목록 정렬 기준 날짜 (diary_date 우선, 없으면 created_at의 날짜)
+_DIARY_SORT_DATE = func.coalesce(DiaryEntry.diary_date, func.date(DiaryEntry.created_at))
+
+
+# 목록/캘린더 응답(DiaryListResponse)에 필요한 컬럼 (본문 외 불필요한 컬럼 로딩 생략)
+_DIARY_LIST_COLUMNS = (
+    DiaryEntry.id,
+    DiaryEntry.title,
+    DiaryEntry.content,
+    DiaryEntry.ai_generated_text,
+    DiaryEntry.user_emotion,
+    DiaryEntry.ai_emotion,
+    DiaryEntry.keywords,
+    DiaryEntry.diary_date,
+    DiaryEntry.created_at,
+    DiaryEntry.is_public,
+)
+
+
+def _encode_diary_cursor(sort_date: date, created_at: datetime, diary_id: UUID) -> str:
+    """키셋 페이지네이션 커서 생성 (마지막 행의 정렬 키를 base64로 인코딩)"""
+    raw = json.dumps([sort_date.isoformat(), created_at.isoformat(), str(diary_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_diary_cursor(cursor: str) -> tuple[date, datetime, UUID]:
+    """키셋 페이지네이션 커서 해석"""
+    try:
+        sort_date, created_at, diary_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return (
+            date.fromisoformat(sort_date),
+            datetime.fromisoformat(created_at),
+            UUID(diary_id),
+        )
+    except (binascii.Error, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바른 커서 형식이 아닙니다.",
+        )
+
 
 class DiaryService(BaseService):
     """다이어리 비즈니스 로직 (캘린더용)"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         super().__init__(session)
         self.session = session  # 기존 코드 호환성을 위해 유지
 
-    def get_diaries(
+    async def get_diaries(
         self,
         user_id: UUID | None = None,
         page: int = 1,
@@ -37,14 +88,22 @@ class DiaryService(BaseService):
         start_date: date | None = None,
         end_date: date | None = None,
         sort_order: str = SortOrder.DESC.value,
-    ) -> tuple[list[DiaryEntry], int]:
-        """다이어리 목록 조회 (페이지네이션 포함)"""
+        cursor: str | None = None,
+    ) -> tuple[list[DiaryEntry], int | None, str | None]:
+        """
+        다이어리 목록 조회 (페이지네이션 포함)
 
-        # 이미지 관계를 함께 로드하기 위해 selectinload 사용
-        from sqlalchemy.orm import selectinload
+        cursor가 주어지면 OFFSET 대신 키셋(seek) 방식으로 다음 페이지를 조회하며,
+        이 경우 전체 개수(COUNT) 조회는 생략하고 None을 반환
 
-        # 기본 쿼리 구성 - 이미지 관계 포함
-        statement = select(DiaryEntry).options(selectinload(DiaryEntry.images))
+        Returns:
+            (다이어리 목록, 전체 개수, 다음 페이지 커서)
+        """
+
+        # 기본 쿼리 구성 - 이미지 관계 포함 (selectinload), 커서 생성용 정렬 키 함께 조회
+        statement = select(DiaryEntry, _DIARY_SORT_DATE.label("sort_date")).options(
+            load_only(*_DIARY_LIST_COLUMNS), selectinload(DiaryEntry.images)
+        )
 
         # 사용자별 필터링 (Soft Delete 제외)
         if user_id is not None:
@@ -80,61 +139,106 @@ class DiaryService(BaseService):
         # 정렬 적용 (diary_date 우선, 없으면 created_at 사용)
         # 1차: diary_date (내림차순/오름차순)
         # 2차: created_at (내림차순/오름차순) - 같은 날짜 내에서 시간순 정렬
-        if sort_order.lower() == SortOrder.DESC.value:
+        # 3차: id - 커서 비교를 위한 고유 정렬 보장
+        sort_key = tuple_(_DIARY_SORT_DATE, DiaryEntry.created_at, DiaryEntry.id)
+        is_desc = sort_order.lower() == SortOrder.DESC.value
+        if is_desc:
             statement = statement.order_by(
-                func.coalesce(DiaryEntry.diary_date, func.date(DiaryEntry.created_at)).desc(),
-                DiaryEntry.created_at.desc()  # 2차 정렬: 같은 날짜 내에서 최신순
+                _DIARY_SORT_DATE.desc(),
+                DiaryEntry.created_at.desc(),  # 2차 정렬: 같은 날짜 내에서 최신순
+                DiaryEntry.id.desc(),
             )
         else:
             statement = statement.order_by(
-                func.coalesce(DiaryEntry.diary_date, func.date(DiaryEntry.created_at)).asc(),
-                DiaryEntry.created_at.asc()  # 2차 정렬: 같은 날짜 내에서 오래된순
+                _DIARY_SORT_DATE.asc(),
+                DiaryEntry.created_at.asc(),  # 2차 정렬: 같은 날짜 내에서 오래된순
+                DiaryEntry.id.asc(),
+            )
+
+        total_count = None
+        if cursor is not None:
+            # 키셋 페이지네이션: 마지막으로 받은 행 이후부터 조회 (OFFSET 스캔 없음)
+            cursor_key = tuple_(*_decode_diary_cursor(cursor))
+            statement = statement.where(
+                sort_key < cursor_key if is_desc else sort_key > cursor_key
             )
+        else:
+            # 전체 개수 조회 (user_id 필터 적용, Soft Delete 제외)
+            total_count = await self._count_diaries(user_id)
+
+            # 페이지네이션 적용
+            statement = statement.offset((page - 1) * page_size)
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        statement = statement.limit(page_size + 1)
+
+        # 결과 조회
+        result = await self.session.execute(statement)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_diary, last_sort_date = rows[-1]
+            next_cursor = _encode_diary_cursor(
+                last_sort_date, last_diary.created_at, last_diary.id
+            )
+
+        diaries = [diary for diary, _ in rows]
+
+        return diaries, total_count, next_cursor
+
+    async def _count_diaries(self, user_id: UUID | None) -> int:
+        """
+        전체 다이어리 개수 조회 (Soft Delete 제외)
+
+        사용자별 개수는 검색/필터와 무관하므로 짧은 TTL로 캐시하고
+        생성/삭제 시 무효화
+        """
+        cache_key = str(user_id) if user_id is not None else None
+        if cache_key is not None:
+            cached_count = diary_count_cache.get(cache_key)
+            if cached_count is not None:
+                return cached_count
 
-        # 전체 개수 조회 (user_id 필터 적용, Soft Delete 제외)
         count_statement = select(func.count(DiaryEntry.id))
         if user_id is not None:
             count_statement = count_statement.where(
                 DiaryEntry.user_id == user_id, DiaryEntry.deleted_at.is_(None)
             )
 
-        result = self.session.execute(count_statement)
+        result = await self.session.execute(count_statement)
         total_count = result.scalar_one()
 
-        # 페이지네이션 적용
-        offset = (page - 1) * page_size
-        statement = statement.offset(offset).limit(page_size)
+        if cache_key is not None:
+            diary_count_cache.set(cache_key, total_count)
 
-        # 결과 조회
-        result = self.session.execute(statement)
-        diaries = result.scalars().all()
-
-        return diaries, total_count
+        return total_count
 
-    def get_diary_by_id(
-        self, diary_id: str, user_id: UUID | None = None
+    async def get_diary_by_id(
+        self, diary_id: UUID, user_id: UUID | None = None
     ) -> DiaryEntry | None:
-        """ID로 다이어리 조회 (Soft Delete 제외)"""
-        statement = select(DiaryEntry).where(
-            DiaryEntry.id == diary_id, DiaryEntry.deleted_at.is_(None)
+        """ID로 다이어리 조회 (Soft Delete 제외) - 이미지 정보 포함"""
+        # AsyncSession에서는 지연 로딩이 불가능하므로 이미지 관계를 함께 로드
+        statement = (
+            select(DiaryEntry)
+            .options(selectinload(DiaryEntry.images))
+            .where(DiaryEntry.id == diary_id, DiaryEntry.deleted_at.is_(None))
         )
 
         if user_id is not None:
             statement = statement.where(DiaryEntry.user_id == user_id)
 
-        result = self.session.execute(statement)
+        result = await self.session.execute(statement)
         return result.scalar_one_or_none()
 
-    def get_diaries_by_date_range(
+    async def get_diaries_by_date_range(
         self, user_id: UUID, start_date: date, end_date: date
     ) -> list[DiaryEntry]:
         """특정 날짜 범위의 다이어리 조회 (캘린더용) - 이미지 정보 포함"""
-        # 이미지 관계를 함께 로드하기 위해 selectinload 사용
-        from sqlalchemy.orm import selectinload
-
         statement = (
             select(DiaryEntry)
-            .options(selectinload(DiaryEntry.images))
+            .options(load_only(*_DIARY_LIST_COLUMNS), selectinload(DiaryEntry.images))
             .where(
                 DiaryEntry.user_id == user_id,
                 DiaryEntry.deleted_at.is_(None),
@@ -146,15 +250,29 @@ class DiaryService(BaseService):
             )
         )
 
-        result = self.session.execute(statement)
+        result = await self.session.execute(statement)
         return result.scalars().all()
 
-    def create_diary(
+    async def create_diary(
         self, diary_create: DiaryCreateRequest, user_id: UUID
     ) -> DiaryEntry:
         """새로운 다이어리 생성"""
 
         try:
+            # 업로드된 이미지가 있다면 Image 레코드를 관계로 함께 생성
+            # (AsyncSession에서 지연 로딩 없이 응답에 사용할 수 있도록 컬렉션을 항상 초기화)
+            new_images = [
+                Image(
+                    file_path=image_data.get("original_url"),
+                    thumbnail_path=image_data.get("thumbnail_url"),
+                    mime_type=image_data.get("mime_type"),
+                    file_size=image_data.get("file_size"),
+                    exif_removed=True,  # 이미 처리된 이미지이므로 True
+                    created_at=datetime.now(UTC),
+                )
+                for image_data in diary_create.uploaded_images or []
+            ]
+
             # 새 다이어리 엔트리 생성 (실제 AI 데이터 사용)
             new_diary = DiaryEntry(
                 user_id=user_id,
@@ -165,113 +283,100 @@ class DiaryService(BaseService):
                 ai_generated_text=diary_create.ai_generated_text,
                 keywords=diary_create.keywords,
                 diary_date=diary_create.diary_date,
+                images=new_images,
             )
 
-            # 데이터베이스에 저장
+            # 데이터베이스에 저장 (다이어리와 이미지를 한 번에 커밋)
             self.session.add(new_diary)
-            self.session.commit()
-            self.session.refresh(new_diary)
-
-            # 업로드된 이미지가 있다면 Image 레코드 생성
-            if diary_create.uploaded_images:
-                from app.models.image import Image
-
-                for image_data in diary_create.uploaded_images:
-                    # uploaded_images의 각 항목을 Image 모델로 변환
-                    new_image = Image(
-                        diary_id=new_diary.id,
-                        file_path=image_data.get("original_url"),
-                        thumbnail_path=image_data.get("thumbnail_url"),
-                        mime_type=image_data.get("mime_type"),
-                        file_size=image_data.get("file_size"),
-                        exif_removed=True,  # 이미 처리된 이미지이므로 True
-                        created_at=datetime.now(UTC),
-                    )
-                    self.session.add(new_image)
-
-                # 이미지 레코드들 저장
-                self.session.commit()
+            await self.session.commit()
+            invalidate_diary_count(user_id)
+            # 서버 기본값 컬럼만 재조회 (이미지 컬렉션은 유지)
+            await self.session.refresh(new_diary, ["created_at", "updated_at"])
 
             return new_diary
 
         except Exception as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"다이어리 생성 실패 - user_id: {user_id}, error: {e}")
             raise
 
-    def update_diary(
-        self, diary_id: str, diary_update: DiaryUpdateRequest
+    async def update_diary(
+        self, diary_id: UUID, user_id: UUID, diary_update: DiaryUpdateRequest
     ) -> DiaryEntry | None:
-        """다이어리 수정"""
-        diary = self.get_diary_by_id(diary_id)
-
-        if not diary:
-            return None
+        """다이어리 수정 (소유권 확인과 수정을 단일 UPDATE ... RETURNING으로 처리)"""
 
-        # 업데이트할 필드들만 수정
+        # 업데이트할 필드들만 수정 (keywords 필드는 JSONB 타입이므로 리스트 그대로 저장)
         update_data = diary_update.dict(exclude_unset=True)
 
-        for field, value in update_data.items():
-            if hasattr(diary, field):
-                # keywords 필드는 JSONB 타입이므로 리스트 그대로 저장
-                setattr(diary, field, value)
+        update_statement = (
+            update(DiaryEntry)
+            .where(
+                DiaryEntry.id == diary_id,
+                DiaryEntry.user_id == user_id,
+                DiaryEntry.deleted_at.is_(None),
+            )
+            .values(**update_data, updated_at=datetime.now(UTC))
+            .returning(DiaryEntry)
+        )
+        statement = (
+            select(DiaryEntry)
+            .from_statement(update_statement)
+            .options(selectinload(DiaryEntry.images))
+            .execution_options(populate_existing=True)
+        )
+
+        result = await self.session.execute(statement)
+        diary = result.scalar_one_or_none()
 
-        # updated_at 필드 자동 업데이트
-        diary.updated_at = datetime.now(UTC)
+        if not diary:
+            return None
 
-        # 데이터베이스에 저장
-        self.session.add(diary)
-        self.session.commit()
-        self.session.refresh(diary)
+        await self.session.commit()
 
         return diary
 
-    def delete_diary(self, diary_id: str, user_id: UUID) -> bool:
+    async def delete_diary(self, diary_id: UUID, user_id: UUID) -> bool:
         """다이어리 삭제 (Soft Delete) - 관련 이미지들도 MinIO에서 삭제"""
-        diary = self.get_diary_by_id(diary_id, user_id)
-
-        if not diary:
-            return False
 
-        with database_transaction_handler(
+        async with async_database_transaction_handler(
             self.session,
             ErrorPatterns.DIARY_DELETE_FAILED,
             log_context=f"다이어리 삭제 - diary_id: {diary_id}",
         ):
-            # 다이어리와 관련된 이미지들 조회
-            from app.models.image import Image
-            from app.utils.minio_upload import get_minio_uploader
-
-            stmt = select(Image).where(Image.diary_id == diary_id)
-            result = self.session.execute(stmt)
-            images = result.scalars().all()
-
-            # MinIO에서 이미지 파일들 삭제
-            if images:
-                uploader = get_minio_uploader()
-
-                for image in images:
-                    # 원본 이미지 삭제
-                    if image.file_path:
-                        original_key = extract_minio_object_key(image.file_path)
-                        if original_key:
-                            uploader.delete_image(original_key)
-
-                    # 썸네일 삭제
-                    if image.thumbnail_path:
-                        thumbnail_key = extract_minio_object_key(image.thumbnail_path)
-                        if thumbnail_key:
-                            uploader.delete_image(thumbnail_key)
-
-                # 데이터베이스에서 이미지 레코드들 삭제
-                for image in images:
-                    self.session.delete(image)
-
-            # Soft Delete: deleted_at 필드를 현재 시간으로 설정
-            diary.deleted_at = datetime.now(UTC)
-
-            # 데이터베이스에 저장
-            self.session.add(diary)
-            self.session.commit()
+            # Soft Delete: 소유권 확인과 deleted_at 설정을 단일 UPDATE로 처리
+            result = await self.session.execute(
+                update(DiaryEntry)
+                .where(
+                    DiaryEntry.id == diary_id,
+                    DiaryEntry.user_id == user_id,
+                    DiaryEntry.deleted_at.is_(None),
+                )
+                .values(deleted_at=datetime.now(UTC))
+                .returning(DiaryEntry.id)
+            )
+            if result.scalar_one_or_none() is None:
+                return False
+
+            # 데이터베이스에서 이미지 레코드들 삭제 (MinIO 삭제용 경로 반환)
+            result = await self.session.execute(
+                delete(Image)
+                .where(Image.diary_id == diary_id)
+                .returning(Image.file_path, Image.thumbnail_path)
+            )
+            image_paths = result.all()
+
+            await self.session.commit()
+            invalidate_diary_count(user_id)
+
+            # 커밋 후 MinIO에서 이미지 파일들(원본/썸네일)을 한 번의 요청으로 삭제
+            if image_paths:
+                await get_minio_uploader().delete_images(
+                    [
+                        extract_minio_object_key(path)
+                        for paths in image_paths
+                        for path in paths
+                        if path
+                    ]
+                )
 
             return True
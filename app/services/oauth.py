@@ -6,7 +6,8 @@ import logging
 from datetime import UTC, datetime, timedelta
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.constants import AccountType, OAuthProvider
@@ -56,15 +57,15 @@ class GoogleOAuthService(BaseService):
             "redirect_uri": self.redirect_uri,
         }
 
-        logger.info(f"Requesting token with redirect_uri: {self.redirect_uri}")
-        logger.info(f"Client ID configured: {self.client_id[:8]}...")
-        logger.info(f"Token URL: {self.token_url}")
+        logger.info("Requesting token with redirect_uri: %s", self.redirect_uri)
+        logger.info("Client ID configured: %s...", self.client_id[:8])
+        logger.info("Token URL: %s", self.token_url)
 
         try:
             response_data = await http_client.post_json(self.token_url, data)
             return GoogleOAuthResponse(**response_data)
         except HTTPException as e:
-            logger.error(f"Failed to get access token: {e.detail}")
+            logger.error("Failed to get access token: %s", e.detail)
             raise OAuthErrors.token_request_failed(str(e.detail))
 
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
@@ -85,8 +86,9 @@ class GoogleOAuthService(BaseService):
             user_data = await http_client.get_json(self.userinfo_url, headers=headers)
 
             # user_data is already parsed from http_client.get_json()
-            # 디버깅: 구글 API 응답 확인
-            print(f"Google API Response: {user_data}")
+            # 디버깅: 구글 API 응답 확인 (개발 환경 + DEBUG 레벨에서만)
+            if settings.is_development and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Google API Response: %s", user_data)
 
             # 구글 userinfo API 응답 구조 확인 및 안전한 ID 추출
             user_id = (
@@ -121,8 +123,31 @@ class GoogleOAuthService(BaseService):
         # 사용자 정보 요청
         user_info = await self.get_user_info(token_response.access_token)
 
+        # 동기 DB 작업은 스레드풀에서 실행하여 이벤트 루프 블로킹 방지
+        return await run_in_threadpool(
+            self._save_oauth_user, user_info, token_response, db
+        )
+
+    def _save_oauth_user(
+        self,
+        user_info: OAuthUserInfo,
+        token_response: GoogleOAuthResponse,
+        db: Session,
+    ) -> tuple[User, OAuthToken]:
+        """OAuth 사용자 및 토큰 저장 (동기 DB 작업)
+
+        Args:
+            user_info: 구글 사용자 정보
+            token_response: 구글 토큰 응답
+            db: 데이터베이스 세션
+
+        Returns:
+            Tuple[User, OAuthToken]: (사용자, OAuth 토큰)
+        """
         # 기존 사용자 확인 또는 새로 생성
-        stmt = select(User).where(User.email == user_info.email)
+        stmt = select(User).where(
+            func.lower(User.email) == user_info.email.lower()
+        )
         result = db.execute(stmt)
         user = result.scalar_one_or_none()
 
@@ -211,5 +236,7 @@ class GoogleOAuthService(BaseService):
 
         db.commit()
         db.refresh(oauth_token)
+        # 커밋으로 만료된 사용자 속성을 스레드풀 안에서 미리 로드 (이벤트 루프에서 지연 로딩 방지)
+        db.refresh(user)
 
         return user, oauth_token
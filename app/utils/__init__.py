@@ -6,7 +6,12 @@ from .encryption import (
     password_hasher,
     data_encryptor,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
+    clear_verify_cache,
+    constant_time_compare,
+    generate_verification_code,
     encrypt_data,
     decrypt_data
 )
@@ -17,7 +22,12 @@ __all__ = [
     "password_hasher",
     "data_encryptor",
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
+    "clear_verify_cache",
+    "constant_time_compare",
+    "generate_verification_code",
     "encrypt_data",
     "decrypt_data"
 ]
\ No newline at end of file
@@ -6,10 +6,12 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import logging
+from functools import lru_cache
 from typing import Optional
 import os
 
 from app.core.config import get_settings
+from app.core.http_client import http_client
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -103,8 +105,6 @@ class EmailService:
     async def _send_with_sendgrid(self, to_email: str, verification_code: str, email_type: str = "signup") -> bool:
         """SendGrid를 사용한 이메일 발송"""
         try:
-            import httpx
-            
             # 디버깅을 위한 로그 추가
             logger.info(f"SendGrid sender email: {self.sendgrid_from_email}")
             logger.info(f"Recipient email: {to_email}")
@@ -219,8 +219,7 @@ class EmailService:
             }
             
             # SendGrid API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=data, headers=headers)
+            response = await http_client.client.post(url, json=data, headers=headers)
             
             if response.status_code == 202:
                 logger.info(f"SendGrid verification email sent successfully: {to_email}")
@@ -367,8 +366,6 @@ class EmailService:
     async def _send_welcome_with_sendgrid(self, to_email: str, nickname: str) -> bool:
         """SendGrid를 사용한 환영 이메일 발송"""
         try:
-            import httpx
-            
             url = "https://api.sendgrid.com/v3/mail/send"
             subject = "[Saegim] Saegim 서비스에 오신 것을 환영합니다!"
             
@@ -432,8 +429,7 @@ class EmailService:
             }
             
             # SendGrid API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=data, headers=headers)
+            response = await http_client.client.post(url, json=data, headers=headers)
             
             if response.status_code == 202:
                 logger.info(f"SendGrid welcome email sent successfully: {to_email}")
@@ -515,8 +511,6 @@ class EmailService:
     async def _send_email_change_with_sendgrid(self, to_email: str, verification_url: str, current_email: str) -> bool:
         """SendGrid를 사용한 이메일 변경 인증 URL 발송"""
         try:
-            import httpx
-            
             # SendGrid API 엔드포인트
             url = "https://api.sendgrid.com/v3/mail/send"
             
@@ -577,23 +571,22 @@ class EmailService:
             }
             
             # SendGrid API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=data,
-                    headers={
-                        "Authorization": f"Bearer {self.sendgrid_api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
+            response = await http_client.client.post(
+                url,
+                json=data,
+                headers={
+                    "Authorization": f"Bearer {self.sendgrid_api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            
+            if response.status_code == 202:
+                logger.info(f"Email change verification sent successfully to {to_email}")
+                return True
+            else:
+                logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
+                return False
                 
-                if response.status_code == 202:
-                    logger.info(f"Email change verification sent successfully to {to_email}")
-                    return True
-                else:
-                    logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
-                    return False
-                    
         except Exception as e:
             logger.error(f"SendGrid email change verification sending failed: {e}")
             return False
@@ -650,8 +643,6 @@ class EmailService:
     async def _send_password_reset_with_sendgrid(self, to_email: str, nickname: str, reset_url: str) -> bool:
         """SendGrid를 사용한 비밀번호 재설정 이메일 발송"""
         try:
-            import httpx
-            
             # SendGrid API 엔드포인트
             url = "https://api.sendgrid.com/v3/mail/send"
             
@@ -702,23 +693,22 @@ class EmailService:
             }
             
             # SendGrid API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=data,
-                    headers={
-                        "Authorization": f"Bearer {self.sendgrid_api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
+            response = await http_client.client.post(
+                url,
+                json=data,
+                headers={
+                    "Authorization": f"Bearer {self.sendgrid_api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            
+            if response.status_code == 202:
+                logger.info(f"Password reset email sent successfully to {to_email}")
+                return True
+            else:
+                logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
+                return False
                 
-                if response.status_code == 202:
-                    logger.info(f"Password reset email sent successfully to {to_email}")
-                    return True
-                else:
-                    logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
-                    return False
-                    
         except Exception as e:
             logger.error(f"SendGrid password reset email sending failed: {e}")
             return False
@@ -772,8 +762,6 @@ class EmailService:
     async def _send_social_error_with_sendgrid(self, to_email: str, nickname: str, provider: str, error_url: str) -> bool:
         """SendGrid를 사용한 소셜 계정 에러 이메일 발송"""
         try:
-            import httpx
-            
             # SendGrid API 엔드포인트
             url = "https://api.sendgrid.com/v3/mail/send"
             
@@ -831,23 +819,22 @@ class EmailService:
             }
             
             # SendGrid API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=data,
-                    headers={
-                        "Authorization": f"Bearer {self.sendgrid_api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
+            response = await http_client.client.post(
+                url,
+                json=data,
+                headers={
+                    "Authorization": f"Bearer {self.sendgrid_api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            
+            if response.status_code == 202:
+                logger.info(f"Social account error email sent successfully to {to_email}")
+                return True
+            else:
+                logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
+                return False
                 
-                if response.status_code == 202:
-                    logger.info(f"Social account error email sent successfully to {to_email}")
-                    return True
-                else:
-                    logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
-                    return False
-                    
         except Exception as e:
             logger.error(f"SendGrid social error email sending failed: {e}")
             return False
@@ -908,8 +895,6 @@ class EmailService:
     async def _send_general_with_sendgrid(self, to_email: str, subject: str, body: str, html: bool = False) -> bool:
         """SendGrid를 사용한 일반 이메일 발송"""
         try:
-            import httpx
-            
             # SendGrid API 엔드포인트
             url = "https://api.sendgrid.com/v3/mail/send"
             
@@ -937,23 +922,22 @@ class EmailService:
             }
             
             # SendGrid API 호출
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=data,
-                    headers={
-                        "Authorization": f"Bearer {self.sendgrid_api_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
+            response = await http_client.client.post(
+                url,
+                json=data,
+                headers={
+                    "Authorization": f"Bearer {self.sendgrid_api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            
+            if response.status_code == 202:
+                logger.info(f"General email sent successfully to {to_email}")
+                return True
+            else:
+                logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
+                return False
                 
-                if response.status_code == 202:
-                    logger.info(f"General email sent successfully to {to_email}")
-                    return True
-                else:
-                    logger.error(f"SendGrid API error: {response.status_code} - {response.text}")
-                    return False
-                    
         except Exception as e:
             logger.error(f"SendGrid general email sending failed: {e}")
             return False
@@ -985,3 +969,7 @@ class EmailService:
             return False
 
 
+@lru_cache(maxsize=1)
+def get_email_service() -> EmailService:
+    """EmailService 싱글톤 인스턴스 반환 (FastAPI 의존성으로도 사용)"""
+    return EmailService()
@@ -1,30 +1,57 @@
 """
 암호화 및 해싱 유틸리티
-bcrypt(cost factor: 12)와 AES-256-GCM 암호화 지원
+Argon2id 비밀번호 해싱(기존 bcrypt 해시 검증 호환)과 AES-256-GCM 암호화 지원
 """
 
 import base64
+import hashlib
+import hmac
 import os
+import secrets
+import threading
+from collections import OrderedDict
 from typing import Optional
 
+import anyio
 import bcrypt
+from argon2 import PasswordHasher as Argon2Hasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
-# bcrypt 설정 (cost factor: 12)
+# bcrypt 설정 (cost factor: 12) - 기존 해시 검증 및 마이그레이션 판단용
 BCRYPT_ROUNDS = 12
 
+# Argon2id 설정 (OWASP 권장 최소값: m=19MiB, t=2, p=1)
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19456
+ARGON2_PARALLELISM = 1
+_argon2 = Argon2Hasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+)
+
+# 검증 성공 결과 캐시 설정 (반복 로그인 시 해시 재연산 회피)
+VERIFY_CACHE_MAX_SIZE = 10_000
+_verify_cache: OrderedDict[tuple[str, bytes], bool] = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+# 해싱 전용 스레드 동시 실행 수 제한 (가입 폭주 시 기본 스레드풀 고갈 방지)
+HASH_THREAD_LIMIT = os.cpu_count() or 1
+_hash_limiter: Optional[anyio.CapacityLimiter] = None
+
 
 class PasswordHasher:
-    """비밀번호 해싱 클래스 (bcrypt)"""
+    """비밀번호 해싱 클래스 (Argon2id, 기존 bcrypt 해시 검증 지원)"""
 
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        비밀번호를 bcrypt로 해싱 (cost factor: 12)
+        비밀번호를 Argon2id로 해싱
 
         Args:
             password: 평문 비밀번호
@@ -40,12 +67,7 @@ class PasswordHasher:
         if not isinstance(password, str):
             raise ValueError("비밀번호는 문자열이어야 합니다")
 
-        # bcrypt.gensalt()로 salt 생성 (rounds=12)
-        salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
-        # 비밀번호를 bytes로 인코딩하고 해싱
-        hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
-        # 결과를 string으로 디코딩하여 반환
-        return hashed.decode("utf-8")
+        return _argon2.hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -68,9 +90,34 @@ class PasswordHasher:
             if not plain_password or not hashed_password:
                 return False
 
-            return bcrypt.checkpw(
-                plain_password.encode("utf-8"), hashed_password.encode("utf-8")
-            )
+            password_bytes = plain_password.encode("utf-8")
+            # 평문 대신 SHA-256 다이제스트를 캐시 키로 사용
+            cache_key = (hashed_password, hashlib.sha256(password_bytes).digest())
+
+            with _verify_cache_lock:
+                if cache_key in _verify_cache:
+                    _verify_cache.move_to_end(cache_key)
+                    return True
+
+            if hashed_password.startswith("$2"):
+                # 기존 bcrypt 해시 (로그인 성공 시 Argon2id로 재해싱 대상)
+                verified = bcrypt.checkpw(
+                    password_bytes, hashed_password.encode("utf-8")
+                )
+            else:
+                try:
+                    verified = _argon2.verify(hashed_password, plain_password)
+                except (VerificationError, InvalidHashError):
+                    verified = False
+
+            # 성공한 검증만 캐시 (실패 결과는 캐시하지 않음)
+            if verified:
+                with _verify_cache_lock:
+                    _verify_cache[cache_key] = True
+                    if len(_verify_cache) > VERIFY_CACHE_MAX_SIZE:
+                        _verify_cache.popitem(last=False)
+
+            return verified
         except (ValueError, TypeError, AttributeError):
             return False
 
@@ -79,7 +126,7 @@ class PasswordHasher:
         """
         해시가 업데이트가 필요한지 확인
 
-        bcrypt 직접 사용 시 간단한 버전 체크
+        bcrypt 해시이거나 Argon2id 파라미터가 현재 설정과 다르면 재해싱 필요
 
         Args:
             hashed_password: 해싱된 비밀번호
@@ -88,20 +135,11 @@ class PasswordHasher:
             업데이트 필요 여부
         """
         try:
-            # $2b$ 버전이 아니거나 rounds가 다르면 업데이트 필요
-            if not hashed_password.startswith("$2b$"):
+            if not hashed_password.startswith("$argon2"):
                 return True
 
-            # rounds 체크 (예: $2b$12$...)
-            parts = hashed_password.split("$")
-            if len(parts) >= 3:
-                try:
-                    rounds = int(parts[2])
-                    return rounds != BCRYPT_ROUNDS
-                except ValueError:
-                    return True
-            return True
-        except (AttributeError, IndexError):
+            return _argon2.check_needs_rehash(hashed_password)
+        except (AttributeError, InvalidHashError):
             return True
 
 
@@ -271,6 +309,48 @@ def hash_password(password: str) -> str:
     return password_hasher.hash_password(password)
 
 
+def _get_hash_limiter() -> anyio.CapacityLimiter:
+    """해싱용 CapacityLimiter 반환 (이벤트 루프 내에서 최초 호출 시 생성)"""
+    global _hash_limiter
+    if _hash_limiter is None:
+        _hash_limiter = anyio.CapacityLimiter(HASH_THREAD_LIMIT)
+    return _hash_limiter
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    비밀번호 해싱 (워커 스레드에서 실행하여 이벤트 루프 블로킹 방지)
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        해싱된 비밀번호
+    """
+    return await anyio.to_thread.run_sync(
+        password_hasher.hash_password, password, limiter=_get_hash_limiter()
+    )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    비밀번호 검증 (워커 스레드에서 실행하여 이벤트 루프 블로킹 방지)
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해싱된 비밀번호
+
+    Returns:
+        검증 결과
+    """
+    return await anyio.to_thread.run_sync(
+        password_hasher.verify_password,
+        plain_password,
+        hashed_password,
+        limiter=_get_hash_limiter(),
+    )
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     비밀번호 검증 (전역 함수)
@@ -285,6 +365,56 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return password_hasher.verify_password(plain_password, hashed_password)
 
 
+def clear_verify_cache(hashed_password: Optional[str] = None) -> None:
+    """
+    비밀번호 검증 캐시 비우기
+
+    비밀번호 변경/재설정 직후 호출하여 이전 해시에 대한 검증 결과를 제거
+
+    Args:
+        hashed_password: 제거할 해시 (없으면 전체 캐시 제거)
+    """
+    with _verify_cache_lock:
+        if hashed_password is None:
+            _verify_cache.clear()
+            return
+
+        for key in [key for key in _verify_cache if key[0] == hashed_password]:
+            del _verify_cache[key]
+
+
+def constant_time_compare(a: str | bytes, b: str | bytes) -> bool:
+    """
+    비밀 값 상수 시간 비교 (타이밍 공격 방지)
+
+    토큰, 인증 코드 등 비밀 문자열을 파이썬에서 직접 비교할 때는
+    `==` 대신 이 함수를 사용해야 함
+
+    Args:
+        a: 비교할 값
+        b: 비교할 값
+
+    Returns:
+        두 값의 일치 여부
+    """
+    if isinstance(a, str):
+        a = a.encode("utf-8")
+    if isinstance(b, str):
+        b = b.encode("utf-8")
+
+    return hmac.compare_digest(a, b)
+
+
+def generate_verification_code() -> str:
+    """
+    6자리 숫자 인증 코드 생성 (CSPRNG 사용, 예측 불가)
+
+    Returns:
+        100000~999999 범위의 인증 코드 문자열
+    """
+    return f"{secrets.randbelow(900_000) + 100_000:06d}"
+
+
 def encrypt_data(plaintext: str) -> str:
     """
     데이터 암호화 (전역 함수)
@@ -4,13 +4,14 @@
 """
 
 import logging
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, ParamSpec, TypeVar
 
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # 타입 힌팅을 위한 제네릭 타입들
@@ -229,6 +230,41 @@ def database_transaction_handler(
         ) from e
 
 
+@asynccontextmanager
+async def async_database_transaction_handler(
+    session: AsyncSession,
+    error_message: str = "작업 처리 중 오류가 발생했습니다",
+    status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+    log_context: str = "Database operation"
+):
+    """
+    비동기 데이터베이스 트랜잭션 에러 처리 컨텍스트 매니저
+
+    Args:
+        session: SQLAlchemy 비동기 세션
+        error_message: 사용자에게 표시할 에러 메시지
+        status_code: HTTP 상태 코드
+        log_context: 로그 컨텍스트
+
+    Usage:
+        async with async_database_transaction_handler(session, "다이어리 삭제 실패"):
+            # database operations
+            pass
+    """
+    try:
+        yield
+    except HTTPException:
+        await session.rollback()
+        raise
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"{log_context} 실패: {str(e)}")
+        raise HTTPException(
+            status_code=status_code,
+            detail=error_message,
+        ) from e
+
+
 def safe_database_operation(
     session: Session,
     operation: Callable[[], T],
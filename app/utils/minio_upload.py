@@ -2,24 +2,104 @@
 MinIO 이미지 업로드 유틸리티 함수
 """
 
+import asyncio
 import io
+import os
 import uuid
 import logging
-from typing import Tuple
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
 from minio import Minio
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 from fastapi import HTTPException, UploadFile, status
 from PIL import Image
 
 from app.core.config import get_settings
 from app.constants import FileConstants
+from app.utils.validators import validate_image_content
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 썸네일 생성 프로세스 풀 (CPU 바운드 리사이즈를 GIL 밖에서 병렬 처리)
+_thumbnail_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _thumbnail_worker_count() -> int:
+    """설정값과 현재 프로세스에 할당된 CPU 수 중 작은 값으로 워커 수 결정"""
+    try:
+        available_cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # sched_getaffinity 미지원 플랫폼
+        available_cpus = os.cpu_count() or 1
+    return max(1, min(get_settings().thumbnail_process_workers, available_cpus))
+
+
+def start_thumbnail_executor() -> ProcessPoolExecutor:
+    """
+    썸네일 생성용 프로세스 풀 생성 (애플리케이션 시작 시 호출)
+
+    스레드가 떠 있는 프로세스를 fork하면 자식이 락을 잡은 채 멈출 수 있으므로
+    spawn 방식으로 워커를 생성
+    """
+    global _thumbnail_executor
+    if _thumbnail_executor is None:
+        _thumbnail_executor = ProcessPoolExecutor(
+            max_workers=_thumbnail_worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _thumbnail_executor
+
+
+def _restart_thumbnail_executor(broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+    """워커 비정상 종료(OOM 등)로 깨진 프로세스 풀을 새 풀로 교체"""
+    global _thumbnail_executor
+    if _thumbnail_executor is broken:
+        broken.shutdown(wait=False, cancel_futures=True)
+        _thumbnail_executor = None
+    return start_thumbnail_executor()
+
+
+def shutdown_thumbnail_executor() -> None:
+    """썸네일 생성용 프로세스 풀 종료 (애플리케이션 종료 시 호출)"""
+    global _thumbnail_executor
+    if _thumbnail_executor is not None:
+        _thumbnail_executor.shutdown(wait=False, cancel_futures=True)
+        _thumbnail_executor = None
+
+
+def _make_thumbnail(image_data: bytes, size: Tuple[int, int], quality: int) -> bytes:
+    """
+    이미지 데이터로부터 썸네일 생성 (프로세스 풀 워커에서 실행)
+
+    Args:
+        image_data: 원본 이미지 데이터
+        size: 썸네일 크기
+        quality: JPEG 품질
+
+    Returns:
+        bytes: 썸네일 이미지 데이터
+    """
+    # 이미지 열기
+    with Image.open(io.BytesIO(image_data)) as img:
+        # RGB 모드로 변환 (RGBA 등 다른 모드 지원)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = img.convert('RGB')
+
+        # 원본 비율 유지하면서 리사이즈 (copy 없이 제자리 축소, JPEG는 draft 디코딩 활용)
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+
+        # 썸네일 데이터를 BytesIO로 저장
+        thumbnail_buffer = io.BytesIO()
+        img.save(thumbnail_buffer, FileConstants.THUMBNAIL_FORMAT, quality=quality, optimize=True)
+
+        return thumbnail_buffer.getvalue()
+
 
 class MinIOUploader:
     """MinIO 이미지 업로드 유틸리티"""
@@ -81,7 +161,10 @@ class MinIOUploader:
             self._validate_file(file)
 
             # 파일 읽기
-            file_content = await file.read()
+            file_content = await self._read_file(file)
+
+            # 실제 파일 내용(매직 바이트)으로 이미지 형식 검증
+            content_type = validate_image_content(file_content)
 
             # 고유 파일 ID 생성
             file_id = str(uuid.uuid4())
@@ -90,13 +173,7 @@ class MinIOUploader:
             object_key = self._generate_object_key(file_id, file.filename)
 
             # MinIO에 업로드
-            self.client.put_object(
-                bucket_name=self.bucket_name,
-                object_name=object_key,
-                data=io.BytesIO(file_content),
-                length=len(file_content),
-                content_type=file.content_type,
-            )
+            await self._put_object(object_key, file_content, content_type)
 
             # 이미지 URL 생성
             image_url = self._generate_image_url(object_key)
@@ -132,6 +209,40 @@ class MinIOUploader:
             logger.error(f"이미지 삭제 실패: {e}")
             return False
 
+    async def delete_images(self, object_keys: list[str]) -> bool:
+        """
+        MinIO에서 여러 이미지를 한 번의 다중 삭제 요청으로 삭제
+
+        Args:
+            object_keys: 삭제할 객체 키 목록 (빈 값은 무시)
+
+        Returns:
+            bool: 모든 객체 삭제 성공 여부
+        """
+        keys = [key for key in object_keys if key]
+        if not keys:
+            return True
+
+        def _remove_objects() -> list:
+            # remove_objects는 지연 실행되므로 결과(에러 목록)를 끝까지 소비해야 요청이 전송됨
+            return list(
+                self.client.remove_objects(
+                    self.bucket_name, [DeleteObject(key) for key in keys]
+                )
+            )
+
+        try:
+            errors = await asyncio.to_thread(_remove_objects)
+        except Exception as e:
+            logger.error(f"이미지 일괄 삭제 실패: {e}")
+            return False
+
+        for error in errors:
+            logger.error(f"이미지 삭제 실패: {error}")
+        if not errors:
+            logger.info(f"이미지 일괄 삭제 성공: {keys}")
+        return not errors
+
     def get_image_url(self, object_key: str) -> str:
         """
         이미지 URL 생성
@@ -144,9 +255,9 @@ class MinIOUploader:
         """
         return self._generate_image_url(object_key)
 
-    def _create_thumbnail(self, image_data: bytes, size: Tuple[int, int] = FileConstants.THUMBNAIL_SIZE, quality: int = FileConstants.THUMBNAIL_QUALITY) -> bytes:
+    async def _create_thumbnail(self, image_data: bytes, size: Tuple[int, int] = FileConstants.THUMBNAIL_SIZE, quality: int = FileConstants.THUMBNAIL_QUALITY) -> bytes:
         """
-        이미지 데이터로부터 썸네일 생성
+        이미지 데이터로부터 썸네일 생성 (프로세스 풀에서 실행하여 이벤트 루프 블로킹 방지)
 
         Args:
             image_data: 원본 이미지 데이터
@@ -156,22 +267,20 @@ class MinIOUploader:
         Returns:
             bytes: 썸네일 이미지 데이터
         """
+        loop = asyncio.get_running_loop()
+        executor = start_thumbnail_executor()
         try:
-            # 이미지 열기
-            with Image.open(io.BytesIO(image_data)) as img:
-                # RGB 모드로 변환 (RGBA 등 다른 모드 지원)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert('RGB')
-
-                # 원본 비율 유지하면서 리사이즈
-                img.thumbnail(size, Image.Resampling.LANCZOS)
-
-                # 썸네일 데이터를 BytesIO로 저장
-                thumbnail_buffer = io.BytesIO()
-                img.save(thumbnail_buffer, FileConstants.THUMBNAIL_FORMAT, quality=quality, optimize=True)
-                thumbnail_buffer.seek(0)
-
-                return thumbnail_buffer.getvalue()
+            try:
+                return await loop.run_in_executor(
+                    executor, _make_thumbnail, image_data, size, quality
+                )
+            except BrokenProcessPool:
+                # 워커가 죽어 풀이 깨진 경우 풀을 재생성하고 한 번만 재시도
+                logger.warning("썸네일 프로세스 풀이 손상되어 재생성합니다.")
+                executor = _restart_thumbnail_executor(executor)
+                return await loop.run_in_executor(
+                    executor, _make_thumbnail, image_data, size, quality
+                )
 
         except Exception as e:
             logger.error(f"썸네일 생성 실패: {e}")
@@ -180,7 +289,41 @@ class MinIOUploader:
                 detail=f"썸네일 생성 중 오류가 발생했습니다: {str(e)}",
             )
 
-    async def upload_image_with_thumbnail(self, file: UploadFile, thumbnail_size: Tuple[int, int] = FileConstants.THUMBNAIL_SIZE) -> Tuple[str, str, str]:
+    async def _put_object(self, object_key: str, data: bytes, content_type: str) -> None:
+        """
+        MinIO에 객체 업로드 (동기 클라이언트 호출을 워커 스레드에서 실행)
+
+        Args:
+            object_key: 객체 키
+            data: 업로드할 데이터
+            content_type: MIME 타입
+        """
+        await asyncio.to_thread(
+            self.client.put_object,
+            bucket_name=self.bucket_name,
+            object_name=object_key,
+            data=io.BytesIO(data),
+            length=len(data),
+            content_type=content_type,
+        )
+
+    async def _upload_thumbnail(self, object_key: str, image_data: bytes, size: Tuple[int, int]) -> None:
+        """
+        썸네일 생성 후 MinIO에 업로드
+
+        Args:
+            object_key: 썸네일 객체 키
+            image_data: 원본 이미지 데이터
+            size: 썸네일 크기
+        """
+        thumbnail_data = await self._create_thumbnail(image_data, size)
+        await self._put_object(
+            object_key,
+            thumbnail_data,
+            f"image/{FileConstants.THUMBNAIL_FORMAT.lower()}",
+        )
+
+    async def upload_image_with_thumbnail(self, file: UploadFile, thumbnail_size: Tuple[int, int] = FileConstants.THUMBNAIL_SIZE) -> Tuple[str, str, str, str]:
         """
         이미지를 MinIO에 업로드하고 썸네일도 생성하여 업로드
 
@@ -189,14 +332,17 @@ class MinIOUploader:
             thumbnail_size: 썸네일 크기 (기본값: 150x150)
 
         Returns:
-            Tuple[str, str, str]: (파일 ID, 원본 이미지 URL, 썸네일 URL)
+            Tuple[str, str, str, str]: (파일 ID, 원본 이미지 URL, 썸네일 URL, 매직 바이트로 판별한 MIME 타입)
         """
         try:
             # 파일 검증
             self._validate_file(file)
 
             # 파일 읽기
-            file_content = await file.read()
+            file_content = await self._read_file(file)
+
+            # 실제 파일 내용(매직 바이트)으로 이미지 형식 검증
+            content_type = validate_image_content(file_content)
 
             # 고유 파일 ID 생성
             file_id = str(uuid.uuid4())
@@ -205,23 +351,10 @@ class MinIOUploader:
             original_object_key = self._generate_object_key(file_id, file.filename)
             thumbnail_object_key = self._generate_thumbnail_object_key(file_id, file.filename)
 
-            # 원본 이미지 업로드
-            self.client.put_object(
-                bucket_name=self.bucket_name,
-                object_name=original_object_key,
-                data=io.BytesIO(file_content),
-                length=len(file_content),
-                content_type=file.content_type,
-            )
-
-            # 썸네일 생성 및 업로드
-            thumbnail_data = self._create_thumbnail(file_content, thumbnail_size)
-            self.client.put_object(
-                bucket_name=self.bucket_name,
-                object_name=thumbnail_object_key,
-                data=io.BytesIO(thumbnail_data),
-                length=len(thumbnail_data),
-                content_type=f"image/{FileConstants.THUMBNAIL_FORMAT.lower()}",
+            # 원본 업로드와 썸네일 생성/업로드를 동시에 진행 (전체 지연 = 합이 아닌 최댓값)
+            await asyncio.gather(
+                self._put_object(original_object_key, file_content, content_type),
+                self._upload_thumbnail(thumbnail_object_key, file_content, thumbnail_size),
             )
 
             # URL 생성
@@ -229,7 +362,7 @@ class MinIOUploader:
             thumbnail_url = self._generate_image_url(thumbnail_object_key)
 
             logger.info(f"이미지 및 썸네일 업로드 성공: {file.filename} -> {original_object_key}, {thumbnail_object_key}")
-            return file_id, original_url, thumbnail_url
+            return file_id, original_url, thumbnail_url, content_type
 
         except HTTPException:
             raise
@@ -240,6 +373,29 @@ class MinIOUploader:
                 detail=f"이미지 및 썸네일 업로드 중 오류가 발생했습니다: {str(e)}",
             )
 
+    async def _read_file(self, file: UploadFile) -> bytes:
+        """
+        업로드 파일을 청크 단위로 읽기 (크기 제한 초과 시 즉시 중단)
+
+        Content-Length가 없어 file.size로 사전 검증되지 않은 업로드도
+        제한 크기 이상 메모리에 적재하지 않음
+
+        Args:
+            file: 업로드 파일 객체
+
+        Returns:
+            bytes: 파일 데이터
+        """
+        buffer = bytearray()
+        while chunk := await file.read(FileConstants.UPLOAD_READ_CHUNK_SIZE):
+            buffer += chunk
+            if len(buffer) > FileConstants.MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"파일 크기가 {FileConstants.MAX_FILE_SIZE_MB}MB를 초과합니다.",
+                )
+        return bytes(buffer)
+
     def _validate_file(self, file: UploadFile) -> None:
         """파일 검증"""
         # 파일 크기 확인 (상수 사용)
@@ -302,7 +458,7 @@ async def upload_image_to_minio(file: UploadFile) -> Tuple[str, str]:
     return await uploader.upload_image(file)
 
 
-async def upload_image_with_thumbnail_to_minio(file: UploadFile, thumbnail_size: Tuple[int, int] = FileConstants.THUMBNAIL_SIZE) -> Tuple[str, str, str]:
+async def upload_image_with_thumbnail_to_minio(file: UploadFile, thumbnail_size: Tuple[int, int] = FileConstants.THUMBNAIL_SIZE) -> Tuple[str, str, str, str]:
     """
     이미지와 썸네일을 MinIO에 업로드하는 편의 함수
 
@@ -311,7 +467,7 @@ async def upload_image_with_thumbnail_to_minio(file: UploadFile, thumbnail_size:
         thumbnail_size: 썸네일 크기 (기본값: 150x150)
 
     Returns:
-        Tuple[str, str, str]: (파일 ID, 원본 이미지 URL, 썸네일 URL)
+        Tuple[str, str, str, str]: (파일 ID, 원본 이미지 URL, 썸네일 URL, 매직 바이트로 판별한 MIME 타입)
     """
     uploader = get_minio_uploader()
     return await uploader.upload_image_with_thumbnail(file, thumbnail_size)
@@ -57,6 +57,115 @@ def validate_image_file(content_type: Optional[str], file_size: Optional[int]) -
         )
 
 
+# 이미지 형식별 매직 바이트 시그니처 (MIME 타입, 오프셋, 시그니처)
+_IMAGE_SIGNATURES = (
+    ("image/jpeg", 0, b"\xff\xd8\xff"),
+    ("image/png", 0, b"\x89PNG\r\n\x1a\n"),
+    ("image/gif", 0, b"GIF87a"),
+    ("image/gif", 0, b"GIF89a"),
+    ("image/webp", 8, b"WEBP"),  # RIFF????WEBP
+    ("image/bmp", 0, b"BM"),
+)
+
+
+def detect_image_mime_type(data: bytes) -> Optional[str]:
+    """
+    파일 앞부분의 매직 바이트로 실제 이미지 MIME 타입 판별
+
+    Args:
+        data: 파일 데이터 (앞 12바이트 이상)
+
+    Returns:
+        판별된 MIME 타입 (지원하지 않는 형식이면 None)
+    """
+    for mime_type, offset, signature in _IMAGE_SIGNATURES:
+        if data.startswith(signature, offset):
+            if mime_type == "image/webp" and not data.startswith(b"RIFF"):
+                continue
+            return mime_type
+    return None
+
+
+def validate_image_content(data: bytes) -> str:
+    """
+    클라이언트가 보낸 content_type 대신 실제 파일 내용으로 이미지 형식 검증
+
+    Args:
+        data: 파일 데이터
+
+    Returns:
+        판별된 MIME 타입
+
+    Raises:
+        HTTPException: 허용된 이미지 형식이 아닌 경우
+    """
+    mime_type = detect_image_mime_type(data)
+    if mime_type is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미지 파일만 업로드할 수 있습니다.",
+        )
+    return mime_type
+
+
+def _build_password_char_class(special_chars: str) -> bytes:
+    """비밀번호 문자 분류 테이블 생성 (바이트 -> L: 영문, D: 숫자, S: 특수문자, _: 그 외)"""
+    return bytes(
+        ord("L")
+        if chr(i).isascii() and chr(i).isalpha()
+        else ord("D")
+        if chr(i).isascii() and chr(i).isdigit()
+        else ord("S")
+        if chr(i) in special_chars
+        else ord("_")
+        for i in range(256)
+    )
+
+
+# 회원가입 비밀번호 규칙용 분류 테이블 (넓은 특수문자 집합, 그 외 문자 허용)
+_SIGNUP_PASSWORD_CHAR_CLASS = _build_password_char_class(
+    "!@#$%^&*()_+-=[]{};':\"\\|,.<>/?"
+)
+
+# 비밀번호 변경/재설정 규칙용 분류 테이블 (영문/숫자/@$!%*?& 만 허용)
+_PASSWORD_CHAR_CLASS = _build_password_char_class("@$!%*?&")
+
+
+def has_required_password_classes(password: str) -> bool:
+    """
+    회원가입 비밀번호에 영문, 숫자, 특수문자가 각 1개 이상 포함되어 있는지 확인
+
+    bytes.translate 한 번으로 전체 문자를 분류하여 정규식 스캔을 대체
+
+    Args:
+        password: 검증할 비밀번호
+
+    Returns:
+        세 종류의 문자가 모두 포함되어 있으면 True
+    """
+    classes = password.encode("utf-8").translate(_SIGNUP_PASSWORD_CHAR_CLASS)
+    return b"L" in classes and b"D" in classes and b"S" in classes
+
+
+def has_valid_password_charset(password: str) -> bool:
+    """
+    비밀번호 변경/재설정 시 문자 구성 검증 (영문/숫자/특수문자 각 1개 이상, 허용 문자만 사용)
+
+    Args:
+        password: 검증할 비밀번호
+
+    Returns:
+        허용 문자만으로 구성되고 세 종류의 문자가 모두 포함되어 있으면 True
+    """
+    classes = password.encode("utf-8").translate(_PASSWORD_CHAR_CLASS)
+    return (
+        b"_" not in classes
+        and b"L" in classes
+        and b"D" in classes
+        and b"S" in classes
+    )
+
+
 def parse_keywords_from_json(keywords_data: Any) -> list[str]:
     """
     keywords를 JSON 문자열에서 리스트로 변환하는 공통 함수
@@ -111,18 +220,17 @@ def extract_minio_object_key(url: str) -> str:
         # Returns: "images/2023/12/01/uuid.jpg"
     """
     try:
-        # URL에서 버킷 이름 이후의 경로를 객체 키로 추출
-        parts = url.split("/")
-        bucket_index = -1
-        for i, part in enumerate(parts):
-            if "saegim-images" in part or part == "saegim-images":
-                bucket_index = i
-                break
+        # URL에서 버킷 이름이 포함된 경로 조각 이후의 경로를 객체 키로 추출
+        # (split/join 없이 문자열 검색 두 번으로 처리)
+        bucket_start = url.find("saegim-images")
+        if bucket_start == -1:
+            return ""
 
-        if bucket_index != -1 and bucket_index + 1 < len(parts):
-            return "/".join(parts[bucket_index + 1:])
+        slash_index = url.find("/", bucket_start)
+        if slash_index == -1:
+            return ""
 
-        return ""
+        return url[slash_index + 1:]
     except Exception:
         return ""
 